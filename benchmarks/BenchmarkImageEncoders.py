@@ -0,0 +1,134 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from PIL import Image
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import DefinitionType
+from pyumldiagrams.Definitions import MethodDefinition
+from pyumldiagrams.Definitions import ParameterDefinition
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+
+from pyumldiagrams.image.EncoderPreset import EncoderPreset
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.image.ImageEncoder import ImageEncoder
+from pyumldiagrams.image.ImageFormat import ImageFormat
+
+EncoderResult = Tuple[ImageFormat, EncoderPreset, float, int]
+
+
+class BenchmarkImageEncoders:
+    """
+    Reports the encode time against the file size for every image format and encoder preset
+    """
+    CELL_WIDTH:  int = 150  # pixels
+    CELL_HEIGHT: int = 100  # pixels
+
+    COLUMNS: int = 7
+    ROWS:    int = 8
+
+    DEFAULT_REPETITIONS: int = 5
+
+    def __init__(self, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._repetitions: int   = repetitions
+        self._image:       Image = self._renderImage()
+
+    def run(self) -> List[EncoderResult]:
+
+        results: List[EncoderResult] = []
+        for imageFormat in ImageFormat:
+            for preset in EncoderPreset:
+                encoder: ImageEncoder = ImageEncoder(imageFormat=imageFormat, preset=preset)
+                results.append(self._timeEncoder(encoder=encoder))
+
+        return results
+
+    def report(self, results: List[EncoderResult]):
+
+        print(f'{"Format":<8} {"Preset":<8} {"Encode (ms)":>12} {"Size (bytes)":>14}')
+        for imageFormat, preset, seconds, byteCount in results:
+            print(f'{imageFormat.name:<8} {preset.value:<8} {seconds * 1000:>12.2f} {byteCount:>14}')
+
+    def _timeEncoder(self, encoder: ImageEncoder) -> EncoderResult:
+        """
+        Best of the repetitions, so that we do not measure the noise
+
+        Args:
+            encoder:  The encoder to time
+
+        Returns:  The best encode time in seconds and the encoded size
+        """
+        bestTime:  float = float('inf')
+        byteCount: int   = 0
+        for x in range(self._repetitions):
+            buffer: BytesIO = BytesIO()
+
+            startTime: float = perf_counter()
+            encoder.encode(image=self._image, fp=buffer)
+            bestTime = min(bestTime, perf_counter() - startTime)
+
+            byteCount = buffer.tell()
+
+        return encoder.imageFormat, encoder.preset, bestTime, byteCount
+
+    def _renderImage(self) -> Image:
+        """
+        A page full of classes with methods;  Rendered once, we only time the encoders
+
+        Returns:  The rendered canvas
+        """
+        diagram: ImageDiagram = ImageDiagram(fileName='BenchmarkImageEncoders')
+
+        widthInterval:  int = BenchmarkImageEncoders.CELL_WIDTH // 10
+        heightInterval: int = BenchmarkImageEncoders.CELL_HEIGHT // 10
+
+        for x in range(BenchmarkImageEncoders.COLUMNS):
+            scrX: int = (x * BenchmarkImageEncoders.CELL_WIDTH) + (widthInterval * x)
+            for y in range(BenchmarkImageEncoders.ROWS):
+                scrY: int = (y * BenchmarkImageEncoders.CELL_HEIGHT) + (heightInterval * y)
+
+                classDef: ClassDefinition = ClassDefinition(name=f'BenchmarkClass{x}{y}',
+                                                            position=Position(scrX, scrY),
+                                                            size=Size(width=BenchmarkImageEncoders.CELL_WIDTH, height=BenchmarkImageEncoders.CELL_HEIGHT))
+                methodDef: MethodDefinition = MethodDefinition(name=f'method{x}{y}', visibility=DefinitionType.Public)
+                methodDef.parameters = [ParameterDefinition(name='param', parameterType='int', defaultValue='0')]
+
+                classDef.methods = [methodDef]
+                diagram.drawClass(classDef)
+
+        return diagram.render()
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Time the image encoders')
+    cliParser.add_argument('-r',
+                           '--repetitions',
+                           type=int,
+                           default=BenchmarkImageEncoders.DEFAULT_REPETITIONS,
+                           help='Number of times to encode with each encoder;  The best time is reported')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkImageEncoders = BenchmarkImageEncoders(repetitions=args.repetitions)
+
+    benchmark.report(benchmark.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from sys import exit as sysExit
+
+from gc import collect
+
+from json import load as jsonLoad
+
+from dataclasses import dataclass
+
+from tempfile import TemporaryDirectory
+
+from tracemalloc import get_traced_memory
+from tracemalloc import reset_peak
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from PIL.Image import Image
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.Definitions import ClassDefinitions
+from pyumldiagrams.Definitions import UmlLineDefinitions
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+MemoryBudgets = Dict[int, Dict[str, float]]
+"""
+Syntactic sugar for the peak memory budgets in megabytes;  By number of classes, then by stage
+"""
+
+MEGABYTE: int = 1024 * 1024
+
+
+@dataclass
+class MemoryResult:
+    """
+    The memory that a stage allocated;  Relative to what was allocated when the stage started
+    """
+    classes:    int = 0
+    diagram:    str = ''        # The diagram type;  Parsing does not depend on it
+    stage:      str = ''
+    peak:       int = 0         # bytes
+    retained:   int = 0         # bytes;  Still allocated when the stage is done
+
+    @property
+    def peakMegabytes(self) -> float:
+        return self.peak / MEGABYTE
+
+    @property
+    def retainedMegabytes(self) -> float:
+        return self.retained / MEGABYTE
+
+
+class BenchmarkMemory:
+    """
+    Records, with tracemalloc, the peak and the retained memory of each stage of making a diagram from a synthetic
+    Pyut XML file:  Parsing, the definitions that stay in memory, the FPDF page buffer, the Pillow canvas, and
+    writing or encoding the document.  A stage whose peak is over its budget fails the benchmark.
+
+    tracemalloc only sees the allocations of the Python memory allocators.  Pillow allocates the pixels and the
+    encoder buffers with `malloc`;  So the canvas stage adds the size of the finished canvas to what was traced,
+    and the image encode stage misses the zlib buffers
+    """
+    DEFAULT_CLASS_COUNTS: List[int] = [10, 300, 1000]
+
+    PARSE_STAGE:       str = 'parse'
+    DEFINITIONS_STAGE: str = 'definitions'
+    PDF_BUFFER_STAGE:  str = 'pdfBuffer'
+    CANVAS_STAGE:      str = 'canvas'
+    ENCODE_STAGE:      str = 'encode'
+
+    XML_DIAGRAM:   str = 'xml'
+    PDF_DIAGRAM:   str = 'pdf'
+    IMAGE_DIAGRAM: str = 'image'
+
+    DEFAULT_BUDGETS: MemoryBudgets = {
+        10: {
+            PARSE_STAGE:        1.0,
+            DEFINITIONS_STAGE:  0.5,
+            PDF_BUFFER_STAGE:   0.5,
+            CANVAS_STAGE:       4.0,
+            ENCODE_STAGE:       2.0,
+        },
+        300: {
+            PARSE_STAGE:        16.0,
+            DEFINITIONS_STAGE:  2.0,
+            PDF_BUFFER_STAGE:   1.0,
+            CANVAS_STAGE:       64.0,
+            ENCODE_STAGE:       1.0,
+        },
+        1000: {
+            PARSE_STAGE:        53.0,
+            DEFINITIONS_STAGE:  7.0,
+            PDF_BUFFER_STAGE:   3.0,
+            CANVAS_STAGE:       200.0,
+            ENCODE_STAGE:       2.0,
+        },
+    }
+    """
+    Twice, rounded up, the peaks measured when the budgets were set;  The definitions budget applies to the
+    retained memory since their peak is the parse peak
+    """
+
+    def __init__(self, classCounts: List[int] = None, diagramTypes: List[str] = None, seed: int = SyntheticDiagramSettings.seed):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._classCounts:  List[int] = BenchmarkMemory.DEFAULT_CLASS_COUNTS if classCounts is None else classCounts
+        self._diagramTypes: List[str] = [BenchmarkMemory.PDF_DIAGRAM, BenchmarkMemory.IMAGE_DIAGRAM] if diagramTypes is None else diagramTypes
+        self._seed:         int       = seed
+
+    def run(self) -> List[MemoryResult]:
+
+        results: List[MemoryResult] = []
+        with TemporaryDirectory() as outputDirectory:
+            for classCount in self._classCounts:
+                generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(SyntheticDiagramSettings(seed=self._seed, classCount=classCount))
+                generator.generate()
+
+                xmlFileName: str = osPath.join(outputDirectory, f'BenchmarkMemory{classCount}.xml')
+                generator.writeXml(xmlFileName)
+                del generator
+
+                startTracing()
+                try:
+                    classDefinitions, umlLineDefinitions = self._measureParse(classCount=classCount, xmlFileName=xmlFileName, results=results)
+                    for diagramType in self._diagramTypes:
+                        fileName: str = osPath.join(outputDirectory, f'BenchmarkMemory{classCount}')
+                        results.extend(self._measureDiagram(classCount=classCount, diagramType=diagramType, fileName=fileName,
+                                                            classDefinitions=classDefinitions, umlLineDefinitions=umlLineDefinitions))
+                finally:
+                    stopTracing()
+
+        return results
+
+    def report(self, results: List[MemoryResult]):
+
+        print(f'{"Classes":>8} {"Type":<6} {"Stage":<12} {"Peak (MB)":>10} {"Retained (MB)":>14}')
+        for result in results:
+            print(f'{result.classes:>8} {result.diagram:<6} {result.stage:<12} {result.peakMegabytes:>10.2f} {result.retainedMegabytes:>14.2f}')
+
+    @classmethod
+    def loadBudgets(cls, fileName: str) -> MemoryBudgets:
+        """
+        Args:
+            fileName:  A JSON file shaped like `DEFAULT_BUDGETS`;  The class counts are the keys of the top object
+
+        Returns:  The budgets
+        """
+        with open(fileName) as budgetsFile:
+            document: Dict = jsonLoad(budgetsFile)
+
+        return {int(classCount): stageBudgets for classCount, stageBudgets in document.items()}
+
+    @classmethod
+    def overBudget(cls, results: List[MemoryResult], budgets: MemoryBudgets = None) -> List[Tuple[MemoryResult, float]]:
+        """
+        Args:
+            results:  What `run` returned
+            budgets:  The budgets in megabytes;  Defaults to `DEFAULT_BUDGETS`
+
+        Returns:  The stages over their budget, each with the budget;  Stages without a budget are not checked
+        """
+        if budgets is None:
+            budgets = BenchmarkMemory.DEFAULT_BUDGETS
+
+        exceeded: List[Tuple[MemoryResult, float]] = []
+        for result in results:
+            budget: float = budgets.get(result.classes, {}).get(result.stage)
+            if budget is None:
+                continue
+            if result.stage == BenchmarkMemory.DEFINITIONS_STAGE:
+                used: float = result.retainedMegabytes
+            else:
+                used: float = result.peakMegabytes
+            if used > budget:
+                exceeded.append((result, budget))
+
+        return exceeded
+
+    def _measureParse(self, classCount: int, xmlFileName: str, results: List[MemoryResult]) -> Tuple[ClassDefinitions, UmlLineDefinitions]:
+        """
+        The parse stage holds the whole DOM;  The definitions stage is what stays once the DOM is gone
+
+        Returns:  The parsed definitions
+        """
+        startMemory: int = self._startStage()
+
+        toClassDefinition: ToClassDefinition = ToClassDefinition(fqFileName=xmlFileName)
+        toClassDefinition.generateClassDefinitions()
+        toClassDefinition.generateUmlLineDefinitions()
+
+        parsed: MemoryResult = self._endStage(classCount=classCount, diagramType=BenchmarkMemory.XML_DIAGRAM, stage=BenchmarkMemory.PARSE_STAGE,
+                                              startMemory=startMemory)
+
+        classDefinitions:   ClassDefinitions   = toClassDefinition.classDefinitions
+        umlLineDefinitions: UmlLineDefinitions = toClassDefinition.umlLineDefinitions
+        del toClassDefinition
+
+        definitions: MemoryResult = self._endStage(classCount=classCount, diagramType=BenchmarkMemory.XML_DIAGRAM,
+                                                   stage=BenchmarkMemory.DEFINITIONS_STAGE, startMemory=startMemory)
+        results.extend([parsed, definitions])
+
+        return classDefinitions, umlLineDefinitions
+
+    def _measureDiagram(self, classCount: int, diagramType: str, fileName: str,
+                        classDefinitions: ClassDefinitions, umlLineDefinitions: UmlLineDefinitions) -> List[MemoryResult]:
+        """
+        The image diagram fits its canvas to the diagram, which is how large diagrams are exported
+
+        Returns:  The drawing stage and the encode stage
+        """
+        startMemory: int = self._startStage()
+
+        diagram: BaseDiagram
+        if diagramType == BenchmarkMemory.PDF_DIAGRAM:
+            diagram = PdfDiagram(fileName=f'{fileName}.pdf', dpi=72)
+        else:
+            diagram = ImageDiagram(fileName=f'{fileName}.png', autoFit=True)
+
+        for classDefinition in classDefinitions:
+            diagram.drawClass(classDefinition)
+        for umlLineDefinition in umlLineDefinitions:
+            diagram.drawUmlLine(umlLineDefinition)
+
+        if diagramType == BenchmarkMemory.PDF_DIAGRAM:
+            drawn: MemoryResult = self._endStage(classCount=classCount, diagramType=diagramType, stage=BenchmarkMemory.PDF_BUFFER_STAGE,
+                                                 startMemory=startMemory)
+        else:
+            canvas:    Image = diagram.render()
+            width, height    = canvas.size
+            pixelSize: int   = width * height * len(canvas.getbands())
+
+            drawn: MemoryResult = self._endStage(classCount=classCount, diagramType=diagramType, stage=BenchmarkMemory.CANVAS_STAGE,
+                                                 startMemory=startMemory)
+            drawn.peak     += pixelSize
+            drawn.retained += pixelSize
+
+        startMemory = self._startStage()
+        diagram.write()
+        encoded: MemoryResult = self._endStage(classCount=classCount, diagramType=diagramType, stage=BenchmarkMemory.ENCODE_STAGE,
+                                               startMemory=startMemory)
+
+        return [drawn, encoded]
+
+    def _startStage(self) -> int:
+        """
+        Returns:  The memory allocated when the stage starts
+        """
+        collect()
+        reset_peak()
+
+        currentMemory, peakMemory = get_traced_memory()
+
+        return currentMemory
+
+    def _endStage(self, classCount: int, diagramType: str, stage: str, startMemory: int) -> MemoryResult:
+        """
+        Collects the garbage first so that the retained memory does not count it;  The peak already happened
+        """
+        peakMemory: int = get_traced_memory()[1]
+
+        collect()
+        currentMemory: int = get_traced_memory()[0]
+
+        return MemoryResult(classes=classCount, diagram=diagramType, stage=stage,
+                            peak=max(0, peakMemory - startMemory), retained=max(0, currentMemory - startMemory))
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Record the peak and retained memory of each stage and check them against budgets')
+    cliParser.add_argument('-c',
+                           '--classes',
+                           type=int,
+                           nargs='+',
+                           default=BenchmarkMemory.DEFAULT_CLASS_COUNTS,
+                           help='The number of classes in each diagram')
+    cliParser.add_argument('-t',
+                           '--types',
+                           nargs='+',
+                           choices=[BenchmarkMemory.PDF_DIAGRAM, BenchmarkMemory.IMAGE_DIAGRAM],
+                           default=[BenchmarkMemory.PDF_DIAGRAM, BenchmarkMemory.IMAGE_DIAGRAM],
+                           help='The diagram types')
+    cliParser.add_argument('-s',
+                           '--seed',
+                           type=int,
+                           default=SyntheticDiagramSettings.seed,
+                           help='Seeds the synthetic diagrams')
+    cliParser.add_argument('-b',
+                           '--budgets',
+                           help='A JSON file with the budgets in megabytes, by number of classes then by stage;  Exits with 1 if a stage is over')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkMemory    = BenchmarkMemory(classCounts=args.classes, diagramTypes=args.types, seed=args.seed)
+    results:   List[MemoryResult] = benchmark.run()
+
+    benchmark.report(results)
+
+    budgets: MemoryBudgets = BenchmarkMemory.DEFAULT_BUDGETS if args.budgets is None else BenchmarkMemory.loadBudgets(args.budgets)
+
+    exceeded: List[Tuple[MemoryResult, float]] = BenchmarkMemory.overBudget(results=results, budgets=budgets)
+    for result, budget in exceeded:
+        print(f'OVER BUDGET {result.classes} {result.diagram} {result.stage}: '
+              f'{result.peakMegabytes:.2f} MB peak, {result.retainedMegabytes:.2f} MB retained against {budget:.2f} MB')
+    if len(exceeded) > 0:
+        sysExit(1)
+
+
+if __name__ == "__main__":
+    main()
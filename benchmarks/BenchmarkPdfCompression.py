@@ -0,0 +1,143 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+CompressionSettings = Tuple[int, bool, bool]
+"""
+Syntactic sugar for the compression level, object streams, and compressed cross-reference table
+"""
+CompressionResult = Tuple[int, CompressionSettings, float, int]
+"""
+Syntactic sugar for the number of classes, the settings, the write time in seconds, and the document size
+"""
+
+
+class BenchmarkPdfCompression:
+    """
+    Reports the write time against the file size for every compression setting over a corpus of synthetic diagrams
+    """
+    DEFAULT_CLASS_COUNTS: List[int] = [10, 1000, 10000]
+    DEFAULT_REPETITIONS:  int       = 3
+
+    COMPRESSION_LEVELS: List[int] = [0, 1, 6, 9]
+
+    def __init__(self, classCounts: List[int] = None, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._classCounts: List[int] = BenchmarkPdfCompression.DEFAULT_CLASS_COUNTS if classCounts is None else classCounts
+        self._repetitions: int       = repetitions
+
+    def run(self) -> List[CompressionResult]:
+
+        results: List[CompressionResult] = []
+        with TemporaryDirectory() as outputDirectory:
+            for classCount in self._classCounts:
+                generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(SyntheticDiagramSettings(classCount=classCount))
+                generator.generate()
+                for settings in self._compressionSettings():
+                    results.append(self._timeWrite(outputDirectory=outputDirectory, generator=generator, settings=settings))
+
+        return results
+
+    def report(self, results: List[CompressionResult]):
+
+        print(f'{"Classes":>8} {"Level":>6} {"ObjStm":>7} {"XRefStm":>8} {"Write (ms)":>11} {"Size (bytes)":>14}')
+        for classCount, (compressionLevel, objectStreams, compressedXref), seconds, byteCount in results:
+            print(f'{classCount:>8} {compressionLevel:>6} {str(objectStreams):>7} {str(compressedXref):>8} {seconds * 1000:>11.2f} {byteCount:>14}')
+
+    def _compressionSettings(self) -> List[CompressionSettings]:
+        """
+        Object streams imply a compressed cross-reference table
+        """
+        return [
+            (compressionLevel, objectStreams, compressedXref)
+            for compressionLevel in BenchmarkPdfCompression.COMPRESSION_LEVELS
+            for objectStreams, compressedXref in [(False, False), (False, True), (True, True)]
+        ]
+
+    def _timeWrite(self, outputDirectory: str, generator: SyntheticDiagramGenerator, settings: CompressionSettings) -> CompressionResult:
+        """
+        Best of the repetitions, so that we do not measure the noise.  Only `write()` is timed;  Each repetition
+        draws a new diagram first
+
+        Args:
+            outputDirectory:  Where to write the documents
+            generator:        Has the diagram
+            settings:         The compression settings to time
+
+        Returns:  The best write time in seconds and the document size
+        """
+        compressionLevel, objectStreams, compressedXref = settings
+
+        classCount: int   = generator.settings.classCount
+        fileName:   str   = osPath.join(outputDirectory, f'BenchmarkPdfCompression{classCount}.pdf')
+        bestTime:   float = float('inf')
+        for x in range(self._repetitions):
+            diagram: PdfDiagram = self._drawDiagram(fileName=fileName, generator=generator)
+
+            diagram.compressionLevel = compressionLevel
+            diagram.objectStreams    = objectStreams
+            diagram.compressedXref   = compressedXref
+
+            startTime: float = perf_counter()
+            diagram.write()
+            bestTime = min(bestTime, perf_counter() - startTime)
+
+        return classCount, settings, bestTime, osPath.getsize(fileName)
+
+    def _drawDiagram(self, fileName: str, generator: SyntheticDiagramGenerator) -> PdfDiagram:
+        """
+        Returns:  The drawn, not yet written, diagram
+        """
+        diagram: PdfDiagram = PdfDiagram(fileName=fileName, dpi=72)
+
+        for classDefinition in generator.classDefinitions:
+            diagram.drawClass(classDefinition)
+        for umlLineDefinition in generator.umlLineDefinitions:
+            diagram.drawUmlLine(umlLineDefinition)
+
+        return diagram
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Time writing PDF documents with each compression setting')
+    cliParser.add_argument('-c',
+                           '--classes',
+                           type=int,
+                           nargs='+',
+                           default=BenchmarkPdfCompression.DEFAULT_CLASS_COUNTS,
+                           help='The number of classes in each diagram of the corpus')
+    cliParser.add_argument('-r',
+                           '--repetitions',
+                           type=int,
+                           default=BenchmarkPdfCompression.DEFAULT_REPETITIONS,
+                           help='Number of times to write with each setting;  The best time is reported')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkPdfCompression = BenchmarkPdfCompression(classCounts=args.classes, repetitions=args.repetitions)
+
+    benchmark.report(benchmark.run())
+
+
+if __name__ == "__main__":
+    main()
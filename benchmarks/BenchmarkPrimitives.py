@@ -0,0 +1,173 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from sys import exit as sysExit
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.Common import Common
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Internal import InternalPosition
+from pyumldiagrams.Internal import PolygonPoints
+from pyumldiagrams.Internal import ScanPoints
+
+from pyumldiagrams.image.ImageCommon import ImageCommon
+from pyumldiagrams.pdf.PdfCommon import PdfCommon
+
+PrimitiveCase = Tuple[str, Callable, Tuple, Any]
+"""
+Syntactic sugar for the case name, the primitive, its arguments, and the reference output
+"""
+PrimitiveResult = Tuple[str, bool, int, float]
+"""
+Syntactic sugar for the case name, whether the output matched the reference, the number of calls, and the best time in seconds
+"""
+
+DIAMOND: PolygonPoints = [
+    InternalPosition(1118.0, 460.0),
+    InternalPosition(1122.0, 469.0717),
+    InternalPosition(1114.0, 469.0717),
+    InternalPosition(1118.0, 476.0)
+]
+ARROW: PolygonPoints = [
+    InternalPosition(1122.0, 469.0717),
+    InternalPosition(1118.0, 476.0),
+    InternalPosition(1114.0, 469.0717)
+]
+LOW_DIAMOND: PolygonPoints = [InternalPosition(point.x - 1000.0, point.y) for point in DIAMOND]
+"""
+Below the diagonal;  Its X values are smaller than its Y values
+"""
+
+
+class BenchmarkPrimitives:
+    """
+    Times the geometry and hit-testing primitives that every drawn line calls, over many calls each.  Before timing,
+    the output of each primitive is checked against a reference output, so that a faster version that is also wrong
+    is not accepted.  The reported time includes the loop overhead, which is the same for every case
+    """
+    DEFAULT_CALLS:       int = 1000000
+    DEFAULT_REPETITIONS: int = 3
+
+    REFERENCE_PRECISION: int = 4    # Decimals compared;  The computed vertices are trigonometry results
+
+    def __init__(self, calls: int = DEFAULT_CALLS, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._calls:       int = calls
+        self._repetitions: int = repetitions
+
+    def run(self) -> List[PrimitiveResult]:
+
+        results: List[PrimitiveResult] = []
+        for name, primitive, arguments, reference in self._primitiveCases():
+            matched: bool = self._matches(primitive(*arguments), reference)
+            if matched is False:
+                self.logger.error(f'{name} does not match its reference output')
+            results.append((name, matched, self._calls, self._timePrimitive(primitive, arguments)))
+
+        return results
+
+    def report(self, results: List[PrimitiveResult]):
+
+        print(f'{"Primitive":<36} {"Correct":>7} {"Calls":>9} {"Time (ms)":>11} {"ns/call":>9}')
+        for name, matched, calls, seconds in results:
+            print(f'{name:<36} {str(matched):>7} {calls:>9} {seconds * 1000:>11.2f} {seconds * 1e9 / calls:>9.1f}')
+
+    def _primitiveCases(self) -> List[PrimitiveCase]:
+        """
+        The polygons are the ones that the unit tests use;  The reference outputs were computed with the
+        original implementations
+        """
+        return [
+            ('pointInsidePolygon diamond inside',  PdfCommon.pointInsidePolygon, (InternalPosition(1118.0, 470.0), DIAMOND), True),
+            ('pointInsidePolygon diamond outside', PdfCommon.pointInsidePolygon, (InternalPosition(1122.0, 490.0), DIAMOND), False),
+            ('pointInsidePolygon arrow inside',    PdfCommon.pointInsidePolygon, (InternalPosition(1118.0, 472.0), ARROW), True),
+            ('pointInsidePolygon arrow outside',   PdfCommon.pointInsidePolygon, (InternalPosition(0.0, 0.0), ARROW), False),
+            ('buildScanPoints diamond',            PdfCommon.buildScanPoints, (DIAMOND, ),
+                ScanPoints(startScan=InternalPosition(1114.0, 460.0), endScan=InternalPosition(1122.0, 476.0))),
+            ('buildScanPoints low diamond',        PdfCommon.buildScanPoints, (LOW_DIAMOND, ),
+                ScanPoints(startScan=InternalPosition(114.0, 460.0), endScan=InternalPosition(122.0, 476.0))),
+            ('computeTheArrowVertices vertical',   Common.computeTheArrowVertices, (InternalPosition(100, 100), InternalPosition(100, 200)),
+                [InternalPosition(105.0, 191.3397), InternalPosition(100, 200), InternalPosition(95.0, 191.3397)]),
+            ('computeTheArrowVertices oblique',    Common.computeTheArrowVertices, (InternalPosition(0, 0), InternalPosition(300, 150)),
+                [InternalPosition(294.4901, 141.6549), InternalPosition(300, 150), InternalPosition(290.018, 150.5992)]),
+            ('computeTheArrowVertices horizontal', Common.computeTheArrowVertices, (InternalPosition(400, 50), InternalPosition(100, 50)),
+                [InternalPosition(108.6603, 55.0), InternalPosition(100, 50), InternalPosition(108.6603, 45.0)]),
+            ('computeDiamondVertices vertical',    Common.computeDiamondVertices, (InternalPosition(100, 100), InternalPosition(100, 200)),
+                [InternalPosition(104.0, 193.0718), InternalPosition(100, 200), InternalPosition(96.0, 193.0718), InternalPosition(100.0, 184.0)]),
+            ('computeDiamondVertices oblique',     Common.computeDiamondVertices, (InternalPosition(0, 0), InternalPosition(300, 150)),
+                [InternalPosition(295.5921, 143.3239), InternalPosition(300, 150), InternalPosition(292.0144, 150.4793), InternalPosition(285.6892, 142.8446)]),
+            ('computeDiamondVertices horizontal',  Common.computeDiamondVertices, (InternalPosition(400, 50), InternalPosition(100, 50)),
+                [InternalPosition(106.9282, 54.0), InternalPosition(100, 50), InternalPosition(106.9282, 46.0), InternalPosition(116.0, 50.0)]),
+            ('toPdfPoints 96 dpi',                 PdfCommon.toPdfPoints, (1024, 96), 768),
+            ('toPdfPoints fractional pixels',      PdfCommon.toPdfPoints, (333.3, 72), 333),
+            ('toInternal',                         ImageCommon.toInternal, (Position(100, 200), 30, 40), InternalPosition(138, 248)),
+        ]
+
+    def _timePrimitive(self, primitive: Callable, arguments: Tuple) -> float:
+        """
+        Best of the repetitions, so that we do not measure the noise
+
+        Returns:  The best time in seconds for all the calls
+        """
+        bestTime: float = float('inf')
+        for x in range(self._repetitions):
+            startTime: float = perf_counter()
+            for y in range(self._calls):
+                primitive(*arguments)
+            bestTime = min(bestTime, perf_counter() - startTime)
+
+        return bestTime
+
+    def _matches(self, actual: Any, reference: Any) -> bool:
+        """
+        Positions match when they are equal to `REFERENCE_PRECISION` decimals;  Everything else must be equal
+        """
+        if isinstance(reference, list):
+            return len(actual) == len(reference) and all(self._matches(position, expected) for position, expected in zip(actual, reference))
+        elif isinstance(reference, ScanPoints):
+            return self._matches(actual.startScan, reference.startScan) and self._matches(actual.endScan, reference.endScan)
+        elif isinstance(reference, InternalPosition):
+            precision: int = BenchmarkPrimitives.REFERENCE_PRECISION
+            return round(actual.x, precision) == round(reference.x, precision) and round(actual.y, precision) == round(reference.y, precision)
+        else:
+            return actual == reference
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Time the geometry and hit-testing primitives and check their outputs')
+    cliParser.add_argument('-n',
+                           '--calls',
+                           type=int,
+                           default=BenchmarkPrimitives.DEFAULT_CALLS,
+                           help='Number of calls to time for each primitive')
+    cliParser.add_argument('-r',
+                           '--repetitions',
+                           type=int,
+                           default=BenchmarkPrimitives.DEFAULT_REPETITIONS,
+                           help='Number of times to time the calls;  The best time is reported')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkPrimitives   = BenchmarkPrimitives(calls=args.calls, repetitions=args.repetitions)
+    results:   List[PrimitiveResult] = benchmark.run()
+
+    benchmark.report(results)
+    if not all(matched for name, matched, calls, seconds in results):
+        sysExit(1)
+
+
+if __name__ == "__main__":
+    main()
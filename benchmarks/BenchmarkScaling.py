@@ -0,0 +1,145 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+ScalingResult = Tuple[int, int, str, int, float, float, float]
+"""
+Syntactic sugar for the number of classes and lines, the diagram type, the render processes, and the generate, draw, and
+write times in seconds
+"""
+
+
+class BenchmarkScaling:
+    """
+    Reports how drawing and writing scale with the size of synthetic diagrams.  PDF diagrams are also timed with
+    each of the requested numbers of render processes;  See `pyumldiagrams.pdf.PdfDiagram.PdfDiagram.renderProcesses`
+    """
+    DEFAULT_CLASS_COUNTS: List[int] = [10, 100, 1000, 10000, 100000]
+
+    PDF_DIAGRAM:   str = 'pdf'
+    IMAGE_DIAGRAM: str = 'image'
+
+    DEFAULT_RENDER_PROCESSES: List[int] = [1]
+
+    def __init__(self, classCounts: List[int] = None, diagramTypes: List[str] = None, seed: int = SyntheticDiagramSettings.seed,
+                 renderProcesses: List[int] = None):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._classCounts:  List[int] = BenchmarkScaling.DEFAULT_CLASS_COUNTS if classCounts is None else classCounts
+        self._diagramTypes: List[str] = [BenchmarkScaling.PDF_DIAGRAM] if diagramTypes is None else diagramTypes
+        self._seed:         int       = seed
+
+        self._renderProcesses: List[int] = BenchmarkScaling.DEFAULT_RENDER_PROCESSES if renderProcesses is None else renderProcesses
+
+    def run(self) -> List[ScalingResult]:
+
+        results: List[ScalingResult] = []
+        with TemporaryDirectory() as outputDirectory:
+            for classCount in self._classCounts:
+                startTime: float = perf_counter()
+                generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(SyntheticDiagramSettings(seed=self._seed, classCount=classCount))
+                generator.generate()
+                generateTime: float = perf_counter() - startTime
+
+                for diagramType in self._diagramTypes:
+                    processCounts: List[int] = self._renderProcesses if diagramType == BenchmarkScaling.PDF_DIAGRAM else [1]
+                    for processCount in processCounts:
+                        drawTime, writeTime = self._timeDiagram(outputDirectory=outputDirectory, generator=generator, diagramType=diagramType,
+                                                                renderProcesses=processCount)
+                        results.append((classCount, len(generator.umlLineDefinitions), diagramType, processCount, generateTime, drawTime, writeTime))
+
+        return results
+
+    def report(self, results: List[ScalingResult]):
+
+        print(f'{"Classes":>8} {"Lines":>8} {"Type":<6} {"Processes":>9} {"Generate (ms)":>14} {"Draw (ms)":>11} {"Write (ms)":>11}')
+        for classCount, lineCount, diagramType, processCount, generateTime, drawTime, writeTime in results:
+            print(f'{classCount:>8} {lineCount:>8} {diagramType:<6} {processCount:>9} {generateTime * 1000:>14.2f} {drawTime * 1000:>11.2f} {writeTime * 1000:>11.2f}')
+
+    def _timeDiagram(self, outputDirectory: str, generator: SyntheticDiagramGenerator, diagramType: str, renderProcesses: int) -> Tuple[float, float]:
+        """
+        With more than one render process the drawing happens in `write`, so only the sum of the times compares
+
+        Returns:  The draw and the write times in seconds
+        """
+        fileName: str = osPath.join(outputDirectory, f'BenchmarkScaling{generator.settings.classCount}')
+
+        startTime: float = perf_counter()
+
+        diagram: BaseDiagram
+        if diagramType == BenchmarkScaling.PDF_DIAGRAM:
+            diagram = PdfDiagram(fileName=f'{fileName}.pdf', dpi=72)
+            diagram.renderProcesses = renderProcesses
+        else:
+            diagram = ImageDiagram(fileName=f'{fileName}.png')
+
+        for classDefinition in generator.classDefinitions:
+            diagram.drawClass(classDefinition)
+        for umlLineDefinition in generator.umlLineDefinitions:
+            diagram.drawUmlLine(umlLineDefinition)
+
+        drawTime: float = perf_counter() - startTime
+
+        startTime = perf_counter()
+        diagram.write()
+
+        return drawTime, perf_counter() - startTime
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Time drawing and writing synthetic diagrams of increasing size')
+    cliParser.add_argument('-c',
+                           '--classes',
+                           type=int,
+                           nargs='+',
+                           default=BenchmarkScaling.DEFAULT_CLASS_COUNTS,
+                           help='The number of classes in each diagram')
+    cliParser.add_argument('-t',
+                           '--types',
+                           nargs='+',
+                           choices=[BenchmarkScaling.PDF_DIAGRAM, BenchmarkScaling.IMAGE_DIAGRAM],
+                           default=[BenchmarkScaling.PDF_DIAGRAM],
+                           help='The diagram types;  Image text rendering makes large image diagrams slow')
+    cliParser.add_argument('-s',
+                           '--seed',
+                           type=int,
+                           default=SyntheticDiagramSettings.seed,
+                           help='Seeds the synthetic diagrams')
+    cliParser.add_argument('-p',
+                           '--processes',
+                           type=int,
+                           nargs='+',
+                           default=BenchmarkScaling.DEFAULT_RENDER_PROCESSES,
+                           help='The numbers of render processes to time the PDF diagrams with')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkScaling = BenchmarkScaling(classCounts=args.classes, diagramTypes=args.types, seed=args.seed, renderProcesses=args.processes)
+
+    benchmark.report(benchmark.run())
+
+
+if __name__ == "__main__":
+    main()
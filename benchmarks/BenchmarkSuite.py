@@ -0,0 +1,286 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from sys import exit as sysExit
+from sys import version as pythonVersion
+
+from platform import platform
+
+from datetime import datetime
+
+from json import dump as jsonDump
+from json import load as jsonLoad
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+
+@dataclass
+class StageResult:
+    """
+    The best time of a stage over the repetitions
+    """
+    corpus:     str   = ''
+    diagram:    str   = ''       # The diagram type;  Parsing does not depend on it
+    stage:      str   = ''
+    items:      int   = 0        # What the stage processes;  Classes, lines or diagrams
+    seconds:    float = 0.0
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return self.corpus, self.diagram, self.stage
+
+    @property
+    def throughput(self) -> float:
+        """
+        Items per second
+        """
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+
+class BenchmarkSuite:
+    """
+    Times each stage of making a diagram separately:  Parsing the Pyut XML file, drawing the classes, drawing the lines
+    and writing the document;  For both the PDF and the image diagrams, over a fixed corpus of synthetic diagrams.
+    The results can be saved as JSON and compared with a saved baseline;  See `compare`.
+
+    Drawing the huge image diagram takes minutes;  Pillow renders each text line separately
+    """
+    CORPUS: Dict[str, int] = {
+        'small':  10,
+        'medium': 300,
+        'huge':   5000,
+    }
+    """
+    The number of classes in each diagram of the corpus;  Always drawn from the same seed
+    """
+    CORPUS_SEED: int = 42
+
+    PARSE_STAGE:       str = 'parse'
+    DRAW_CLASS_STAGE:  str = 'drawClass'
+    DRAW_LINE_STAGE:   str = 'drawUmlLine'
+    WRITE_STAGE:       str = 'write'
+
+    XML_DIAGRAM:   str = 'xml'
+    PDF_DIAGRAM:   str = 'pdf'
+    IMAGE_DIAGRAM: str = 'image'
+
+    RESULTS_VERSION: int = 1
+
+    DEFAULT_REPETITIONS: int   = 3
+    DEFAULT_TOLERANCE:   float = 0.10   # A stage that is 10% slower than the baseline is a regression
+
+    def __init__(self, corpusNames: List[str] = None, diagramTypes: List[str] = None, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._corpusNames:  List[str] = list(BenchmarkSuite.CORPUS.keys()) if corpusNames is None else corpusNames
+        self._diagramTypes: List[str] = [BenchmarkSuite.PDF_DIAGRAM, BenchmarkSuite.IMAGE_DIAGRAM] if diagramTypes is None else diagramTypes
+        self._repetitions:  int       = repetitions
+
+    def run(self) -> List[StageResult]:
+
+        results: List[StageResult] = []
+        with TemporaryDirectory() as outputDirectory:
+            for corpusName in self._corpusNames:
+                generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(
+                    SyntheticDiagramSettings(seed=BenchmarkSuite.CORPUS_SEED, classCount=BenchmarkSuite.CORPUS[corpusName])
+                )
+                generator.generate()
+
+                xmlFileName: str = osPath.join(outputDirectory, f'{corpusName}.xml')
+                generator.writeXml(xmlFileName)
+
+                results.append(self._timeParse(corpusName=corpusName, xmlFileName=xmlFileName))
+                for diagramType in self._diagramTypes:
+                    results.extend(self._timeDiagram(corpusName=corpusName, generator=generator, diagramType=diagramType, outputDirectory=outputDirectory))
+
+        return results
+
+    def report(self, results: List[StageResult]):
+
+        print(f'{"Corpus":<8} {"Type":<6} {"Stage":<12} {"Items":>7} {"Time (ms)":>11} {"Items/s":>12}')
+        for result in results:
+            print(f'{result.corpus:<8} {result.diagram:<6} {result.stage:<12} {result.items:>7} {result.seconds * 1000:>11.2f} {result.throughput:>12.1f}')
+
+    def save(self, results: List[StageResult], fileName: str):
+        """
+        Args:
+            results:   What `run` returned
+            fileName:  The JSON file
+        """
+        document: Dict = {
+            'version':   BenchmarkSuite.RESULTS_VERSION,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python':    pythonVersion,
+            'platform':  platform(),
+            'results':   [asdict(result) for result in results],
+        }
+        with open(fileName, 'w') as resultsFile:
+            jsonDump(document, resultsFile, indent=2)
+
+    @classmethod
+    def load(cls, fileName: str) -> List[StageResult]:
+        """
+        Args:
+            fileName:  A JSON file that `save` wrote
+
+        Returns:  The saved results
+        """
+        with open(fileName) as resultsFile:
+            document: Dict = jsonLoad(resultsFile)
+
+        return [StageResult(**result) for result in document['results']]
+
+    @classmethod
+    def compare(cls, results: List[StageResult], baseline: List[StageResult], tolerance: float = DEFAULT_TOLERANCE) -> List[Tuple[StageResult, StageResult]]:
+        """
+        Args:
+            results:    The current results
+            baseline:   The saved results to compare with
+            tolerance:  How much slower than the baseline a stage may be, as a fraction
+
+        Returns:  The regressed stages, each with its baseline result;  Stages that are not in the baseline are ignored
+        """
+        baselineResults: Dict[Tuple[str, str, str], StageResult] = {result.key: result for result in baseline}
+
+        regressions: List[Tuple[StageResult, StageResult]] = []
+        for result in results:
+            baselineResult: StageResult = baselineResults.get(result.key)
+            if baselineResult is not None and result.seconds > baselineResult.seconds * (1 + tolerance):
+                regressions.append((result, baselineResult))
+
+        return regressions
+
+    def _timeParse(self, corpusName: str, xmlFileName: str) -> StageResult:
+
+        bestTime:   float = float('inf')
+        classCount: int   = 0
+        for x in range(self._repetitions):
+            startTime: float = perf_counter()
+
+            toClassDefinition: ToClassDefinition = ToClassDefinition(fqFileName=xmlFileName)
+            toClassDefinition.generateClassDefinitions()
+            toClassDefinition.generateUmlLineDefinitions()
+
+            bestTime   = min(bestTime, perf_counter() - startTime)
+            classCount = len(toClassDefinition.classDefinitions)
+
+        return StageResult(corpus=corpusName, diagram=BenchmarkSuite.XML_DIAGRAM, stage=BenchmarkSuite.PARSE_STAGE, items=classCount, seconds=bestTime)
+
+    def _timeDiagram(self, corpusName: str, generator: SyntheticDiagramGenerator, diagramType: str, outputDirectory: str) -> List[StageResult]:
+        """
+        Each repetition draws and writes a new diagram
+
+        Returns:  The best class drawing, line drawing and write times
+        """
+        bestTimes: List[float] = [float('inf')] * 3
+        for x in range(self._repetitions):
+            diagram: BaseDiagram = self._createDiagram(diagramType=diagramType, fileName=osPath.join(outputDirectory, f'{corpusName}-{diagramType}'))
+
+            startTime: float = perf_counter()
+            for classDefinition in generator.classDefinitions:
+                diagram.drawClass(classDefinition)
+            classTime: float = perf_counter() - startTime
+
+            startTime = perf_counter()
+            for umlLineDefinition in generator.umlLineDefinitions:
+                diagram.drawUmlLine(umlLineDefinition)
+            lineTime: float = perf_counter() - startTime
+
+            startTime = perf_counter()
+            diagram.write()
+            writeTime: float = perf_counter() - startTime
+
+            bestTimes = [min(bestTime, stageTime) for bestTime, stageTime in zip(bestTimes, [classTime, lineTime, writeTime])]
+
+        return [
+            StageResult(corpus=corpusName, diagram=diagramType, stage=BenchmarkSuite.DRAW_CLASS_STAGE, items=len(generator.classDefinitions), seconds=bestTimes[0]),
+            StageResult(corpus=corpusName, diagram=diagramType, stage=BenchmarkSuite.DRAW_LINE_STAGE, items=len(generator.umlLineDefinitions), seconds=bestTimes[1]),
+            StageResult(corpus=corpusName, diagram=diagramType, stage=BenchmarkSuite.WRITE_STAGE, items=1, seconds=bestTimes[2]),
+        ]
+
+    def _createDiagram(self, diagramType: str, fileName: str) -> BaseDiagram:
+
+        if diagramType == BenchmarkSuite.PDF_DIAGRAM:
+            return PdfDiagram(fileName=f'{fileName}.pdf', dpi=72)
+        else:
+            return ImageDiagram(fileName=f'{fileName}.png')
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Time parsing, drawing, and writing over a fixed corpus of diagrams')
+    cliParser.add_argument('-c',
+                           '--corpus',
+                           nargs='+',
+                           choices=list(BenchmarkSuite.CORPUS.keys()),
+                           default=list(BenchmarkSuite.CORPUS.keys()),
+                           help='The corpus diagrams to time')
+    cliParser.add_argument('-t',
+                           '--types',
+                           nargs='+',
+                           choices=[BenchmarkSuite.PDF_DIAGRAM, BenchmarkSuite.IMAGE_DIAGRAM],
+                           default=[BenchmarkSuite.PDF_DIAGRAM, BenchmarkSuite.IMAGE_DIAGRAM],
+                           help='The diagram types')
+    cliParser.add_argument('-r',
+                           '--repetitions',
+                           type=int,
+                           default=BenchmarkSuite.DEFAULT_REPETITIONS,
+                           help='Number of times to time each stage;  The best time is reported')
+    cliParser.add_argument('-o',
+                           '--output',
+                           help='Save the results to this JSON file')
+    cliParser.add_argument('-b',
+                           '--baseline',
+                           help='Compare the results with the ones saved in this JSON file;  Exits with 1 if a stage regressed')
+    cliParser.add_argument('--tolerance',
+                           type=float,
+                           default=BenchmarkSuite.DEFAULT_TOLERANCE,
+                           help='How much slower than the baseline a stage may be, as a fraction')
+
+    args: Namespace = cliParser.parse_args()
+
+    benchmark: BenchmarkSuite    = BenchmarkSuite(corpusNames=args.corpus, diagramTypes=args.types, repetitions=args.repetitions)
+    results:   List[StageResult] = benchmark.run()
+
+    benchmark.report(results)
+    if args.output is not None:
+        benchmark.save(results=results, fileName=args.output)
+
+    if args.baseline is not None:
+        regressions: List[Tuple[StageResult, StageResult]] = BenchmarkSuite.compare(results=results,
+                                                                                    baseline=BenchmarkSuite.load(args.baseline),
+                                                                                    tolerance=args.tolerance)
+        for result, baselineResult in regressions:
+            print(f'REGRESSION {result.corpus} {result.diagram} {result.stage}: '
+                  f'{result.seconds * 1000:.2f} ms against {baselineResult.seconds * 1000:.2f} ms')
+        if len(regressions) > 0:
+            sysExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.DiagramFeatures import DiagramFeatures
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.RenderCostEstimator import BackendCoefficients
+from pyumldiagrams.RenderCostEstimator import CalibrationSample
+from pyumldiagrams.RenderCostEstimator import RenderCostEstimator
+from pyumldiagrams.RenderCostEstimator import RenderEstimate
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+RenderMeasurement = Tuple[DiagramFeatures, float, int]
+"""
+Syntactic sugar for the features of a rendered diagram, its best render time in seconds, and its output size
+"""
+
+
+class CalibrateRenderCost:
+    """
+    Renders synthetic diagrams that vary in size, text volume, and line types with each backend;  Then fits the
+    `RenderCostEstimator` coefficients to the measured render times and output sizes.  The render time is from the
+    creation of the diagram to the end of `write`
+    """
+    PDF_CLASS_COUNTS:   List[int] = [10, 50, 200, 800]
+    IMAGE_CLASS_COUNTS: List[int] = [10, 40, 120]     # Pillow text rendering makes large image diagrams slow
+
+    METHODS_PER_CLASS: List[int] = [0, 3, 8]
+
+    LINE_TYPE_MIXES: List[Dict[LineType, float]] = [
+        {LineType.Inheritance: 1.0},
+        {LineType.Composition: 1.0},
+        {LineType.Inheritance: 0.5, LineType.Aggregation: 0.25, LineType.Composition: 0.25},
+    ]
+    DEFAULT_REPETITIONS: int = 2
+
+    def __init__(self, backends: List[str] = None, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._backends:    List[str] = [RenderCostEstimator.PDF_BACKEND, RenderCostEstimator.IMAGE_BACKEND] if backends is None else backends
+        self._repetitions: int       = repetitions
+
+    def run(self) -> Dict[str, List[RenderMeasurement]]:
+        """
+        Returns:  The measurements of each backend
+        """
+        measurements: Dict[str, List[RenderMeasurement]] = {}
+        with TemporaryDirectory() as outputDirectory:
+            for backend in self._backends:
+                measurements[backend] = [
+                    self._measure(outputDirectory=outputDirectory, backend=backend, settings=settings) for settings in self._calibrationSettings(backend)
+                ]
+
+        return measurements
+
+    def calibrate(self, measurements: Dict[str, List[RenderMeasurement]]) -> RenderCostEstimator:
+        """
+        Args:
+            measurements:  What `run` returned
+
+        Returns:  An estimator with coefficients fit to the measurements;  Backends that were not measured keep the default ones
+        """
+        coefficients: BackendCoefficients = dict(RenderCostEstimator.DEFAULT_COEFFICIENTS)
+        for backend, backendMeasurements in measurements.items():
+            timeSamples: List[CalibrationSample] = [(features, seconds) for features, seconds, byteCount in backendMeasurements]
+            sizeSamples: List[CalibrationSample] = [(features, byteCount) for features, seconds, byteCount in backendMeasurements]
+            coefficients[backend] = {
+                RenderCostEstimator.SECONDS: RenderCostEstimator.fit(timeSamples),
+                RenderCostEstimator.BYTES:   RenderCostEstimator.fit(sizeSamples),
+            }
+
+        return RenderCostEstimator(coefficients=coefficients)
+
+    def report(self, measurements: Dict[str, List[RenderMeasurement]], estimator: RenderCostEstimator):
+
+        print(f'{"Type":<6} {"Classes":>8} {"Text lines":>11} {"Compositions":>13} {"Time (ms)":>10} {"Estimate":>10} {"Size (bytes)":>13} {"Estimate":>10}')
+        for backend, backendMeasurements in measurements.items():
+            for features, seconds, byteCount in backendMeasurements:
+                estimate: RenderEstimate = estimator.estimate(features=features, backend=backend)
+                print(f'{backend:<6} {features.classCount:>8} {features.textLines:>11} {features.compositions:>13} '
+                      f'{seconds * 1000:>10.2f} {estimate.seconds * 1000:>10.2f} {byteCount:>13} {estimate.bytes:>10}')
+
+        for backend, backendCoefficients in estimator.coefficients.items():
+            for quantity, coefficients in backendCoefficients.items():
+                print(f'{backend} {quantity}: ' + ', '.join(f'{name}={value:.3g}' for name, value in coefficients.items()))
+
+    def _calibrationSettings(self, backend: str) -> List[SyntheticDiagramSettings]:
+
+        classCounts: List[int] = CalibrateRenderCost.PDF_CLASS_COUNTS if backend == RenderCostEstimator.PDF_BACKEND else CalibrateRenderCost.IMAGE_CLASS_COUNTS
+
+        return [
+            SyntheticDiagramSettings(classCount=classCount, methodsPerClass=methodsPerClass, lineTypeMix=lineTypeMix)
+            for classCount in classCounts
+            for methodsPerClass in CalibrateRenderCost.METHODS_PER_CLASS
+            for lineTypeMix in CalibrateRenderCost.LINE_TYPE_MIXES
+        ]
+
+    def _measure(self, outputDirectory: str, backend: str, settings: SyntheticDiagramSettings) -> RenderMeasurement:
+        """
+        Best of the repetitions, so that we do not measure the noise
+        """
+        generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(settings)
+        generator.generate()
+
+        fileName: str   = osPath.join(outputDirectory, f'CalibrateRenderCost.{backend}')
+        bestTime: float = float('inf')
+        for x in range(self._repetitions):
+            startTime: float = perf_counter()
+
+            diagram: BaseDiagram
+            if backend == RenderCostEstimator.PDF_BACKEND:
+                diagram = PdfDiagram(fileName=fileName, dpi=72)
+            else:
+                diagram = ImageDiagram(fileName=fileName, autoFit=True)
+            for classDefinition in generator.classDefinitions:
+                diagram.drawClass(classDefinition)
+            for umlLineDefinition in generator.umlLineDefinitions:
+                diagram.drawUmlLine(umlLineDefinition)
+            diagram.write()
+
+            bestTime = min(bestTime, perf_counter() - startTime)
+
+        features: DiagramFeatures = DiagramFeatures.fromDefinitions(classDefinitions=generator.classDefinitions, umlLineDefinitions=generator.umlLineDefinitions)
+
+        return features, bestTime, osPath.getsize(diagram._outputFileName())
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Calibrate the render cost estimator on synthetic diagrams')
+    cliParser.add_argument('-t',
+                           '--types',
+                           nargs='+',
+                           choices=[RenderCostEstimator.PDF_BACKEND, RenderCostEstimator.IMAGE_BACKEND],
+                           default=[RenderCostEstimator.PDF_BACKEND, RenderCostEstimator.IMAGE_BACKEND],
+                           help='The backends to calibrate')
+    cliParser.add_argument('-r',
+                           '--repetitions',
+                           type=int,
+                           default=CalibrateRenderCost.DEFAULT_REPETITIONS,
+                           help='Number of times to render each diagram;  The best time is used')
+    cliParser.add_argument('-o',
+                           '--output',
+                           help='Save the coefficients to this JSON file;  Load it with RenderCostEstimator.load')
+
+    args: Namespace = cliParser.parse_args()
+
+    calibration:  CalibrateRenderCost                   = CalibrateRenderCost(backends=args.types, repetitions=args.repetitions)
+    measurements: Dict[str, List[RenderMeasurement]]   = calibration.run()
+    estimator:    RenderCostEstimator                   = calibration.calibrate(measurements)
+
+    calibration.report(measurements=measurements, estimator=estimator)
+    if args.output is not None:
+        estimator.save(args.output)
+
+
+if __name__ == "__main__":
+    main()
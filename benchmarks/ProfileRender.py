@@ -0,0 +1,103 @@
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.RenderProfiler import RenderProfiler
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
+
+
+class ProfileRender:
+    """
+    Renders a Pyut XML file once with a `RenderProfiler`, from parsing to the written document.  Writes the
+    cProfile statistics and, when sampling, the collapsed stacks for flame graphs;  Then prints the time of each phase
+    """
+    PDF_DIAGRAM:   str = 'pdf'
+    IMAGE_DIAGRAM: str = 'image'
+
+    DEFAULT_SAMPLE_INTERVAL: float = 0.0    # seconds
+
+    def __init__(self, xmlFileName: str, diagramType: str = PDF_DIAGRAM, sampleInterval: float = DEFAULT_SAMPLE_INTERVAL):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._xmlFileName: str            = xmlFileName
+        self._diagramType: str            = diagramType
+        self._profiler:    RenderProfiler = RenderProfiler(sampleInterval=sampleInterval)
+
+    @property
+    def profiler(self) -> RenderProfiler:
+        return self._profiler
+
+    def run(self, outputFileName: str):
+        """
+        Args:
+            outputFileName:  The document to write
+        """
+        self._profiler.start()
+        try:
+            with self._profiler.phase(RenderProfiler.PARSE_PHASE):
+                toClassDefinition: ToClassDefinition = ToClassDefinition(fqFileName=self._xmlFileName)
+                toClassDefinition.generateClassDefinitions()
+                toClassDefinition.generateUmlLineDefinitions()
+
+            diagram: BaseDiagram
+            if self._diagramType == ProfileRender.PDF_DIAGRAM:
+                diagram = PdfDiagram(fileName=outputFileName, dpi=72)
+            else:
+                diagram = ImageDiagram(fileName=outputFileName, autoFit=True)
+            diagram.profiler = self._profiler
+
+            for classDefinition in toClassDefinition.classDefinitions:
+                diagram.drawClass(classDefinition)
+            for umlLineDefinition in toClassDefinition.umlLineDefinitions:
+                diagram.drawUmlLine(umlLineDefinition)
+            diagram.write()
+        finally:
+            self._profiler.stop()
+
+
+def main():
+
+    cliParser: ArgumentParser = ArgumentParser(description='Profile rendering a Pyut XML file, from parsing to the written document')
+    cliParser.add_argument('xmlFileName', help='The Pyut XML file')
+    cliParser.add_argument('outputFileName', help='The document to write')
+    cliParser.add_argument('-t',
+                           '--type',
+                           choices=[ProfileRender.PDF_DIAGRAM, ProfileRender.IMAGE_DIAGRAM],
+                           default=ProfileRender.PDF_DIAGRAM,
+                           help='The diagram type')
+    cliParser.add_argument('-p',
+                           '--profile',
+                           default='render.prof',
+                           help='The cProfile statistics file;  Read it with pstats or snakeviz')
+    cliParser.add_argument('-s',
+                           '--sample-interval',
+                           type=float,
+                           default=ProfileRender.DEFAULT_SAMPLE_INTERVAL,
+                           help='Seconds between stack samples;  0 does not sample')
+    cliParser.add_argument('-f',
+                           '--folded',
+                           default='render.folded',
+                           help='The collapsed stacks file, when sampling;  The input of flamegraph.pl and speedscope')
+
+    args: Namespace = cliParser.parse_args()
+
+    profileRender: ProfileRender = ProfileRender(xmlFileName=args.xmlFileName, diagramType=args.type, sampleInterval=args.sample_interval)
+    profileRender.run(outputFileName=args.outputFileName)
+
+    profileRender.profiler.dumpStats(args.profile)
+    if args.sample_interval > 0:
+        profileRender.profiler.writeCollapsedStacks(args.folded)
+
+    print(profileRender.profiler.summary())
+
+
+if __name__ == "__main__":
+    main()
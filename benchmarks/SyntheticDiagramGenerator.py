@@ -0,0 +1,301 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from itertools import accumulate
+
+from math import ceil
+from math import sqrt
+
+from random import Random
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from xml.dom.minidom import Document
+from xml.dom.minidom import Element
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import ClassDefinitions
+from pyumldiagrams.Definitions import DefinitionType
+from pyumldiagrams.Definitions import LinePositions
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.Definitions import MethodDefinition
+from pyumldiagrams.Definitions import ParameterDefinition
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import UmlLineDefinition
+from pyumldiagrams.Definitions import UmlLineDefinitions
+
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_DEFAULT_VALUE
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_HEIGHT
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_LINK_DESTINATION_ANCHOR_X
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_LINK_DESTINATION_ANCHOR_Y
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_LINK_SOURCE_ANCHOR_X
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_LINK_SOURCE_ANCHOR_Y
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_NAME
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_SHOW_FIELDS
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_SHOW_METHODS
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_SHOW_STEREOTYPE
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_TYPE
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_WIDTH
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_X
+from pyumldiagrams.xmlsupport.XmlConstants import ATTR_Y
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_CONTROL_POINT
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_DOCUMENT
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_GRAPHIC_CLASS
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_GRAPHIC_LINK
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_MODEL_CLASS
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_MODEL_LINK
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_MODEL_METHOD
+from pyumldiagrams.xmlsupport.XmlConstants import ELEMENT_MODEL_PARAM
+from pyumldiagrams.xmlsupport.XmlConstants import TOP_LEVEL_ELEMENT
+
+
+def defaultLineTypeMix() -> Dict[LineType, float]:
+    return {LineType.Inheritance: 0.5, LineType.Aggregation: 0.25, LineType.Composition: 0.25}
+
+
+@dataclass
+class SyntheticDiagramSettings:
+    """
+    Describes the diagrams that the generator makes;  The same settings always make the same diagram
+    """
+    seed:                int = 42
+    classCount:          int = 100
+    methodsPerClass:     int = 3
+    """
+    Every class has this many methods
+    """
+    maximumParameters:   int = 2
+    """
+    Each method has up to this many parameters
+    """
+    lineTypeMix:         Dict[LineType, float] = field(default_factory=defaultLineTypeMix)
+    """
+    The relative frequency of each line type.  Only the types that Pyut XML files can have
+    """
+    lineProbability:     float = 1.0
+    """
+    The chance that a class, except the first one, has a line to the class to its left or above it
+    """
+    maximumBends:        int = 2
+    """
+    Each line has up to this many bends
+    """
+
+
+class SyntheticDiagramGenerator:
+    """
+    Makes seeded, reproducible UML class diagrams of any size for the scaling benchmarks.  The classes are laid out
+    on a square grid;  Each line connects a class to a neighbor.  The diagrams are available as definitions or as a
+    Pyut XML file that `pyumldiagrams.xmlsupport.ToClassDefinition.ToClassDefinition` reads.  The file carries the
+    method visibilities but `ToClassDefinition` does not read them;  Its methods are all public
+    """
+    CLASS_WIDTH:        int = 150   # pixels
+    CLASS_BASE_HEIGHT:  int = 50    # pixels;  The name and the separators
+    METHOD_LINE_HEIGHT: int = 15    # pixels
+    CELL_GAP:           int = 60    # pixels;  Room for the lines and their bends
+
+    PARAMETER_TYPES: List[str] = ['int', 'float', 'str', 'bool', 'List[str]', 'Dict[str, int]']
+    VISIBILITIES:    List[DefinitionType] = [DefinitionType.Public, DefinitionType.Private, DefinitionType.Protected]
+
+    PYUT_VISIBILITY: Dict[DefinitionType, str] = {
+        DefinitionType.Public:    'PUBLIC',
+        DefinitionType.Private:   'PRIVATE',
+        DefinitionType.Protected: 'PROTECTED',
+    }
+
+    def __init__(self, settings: SyntheticDiagramSettings = None):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._settings: SyntheticDiagramSettings = SyntheticDiagramSettings() if settings is None else settings
+
+        self._classDefinitions:   ClassDefinitions      = []
+        self._umlLineDefinitions: UmlLineDefinitions    = []
+        self._lineEnds:           List[Tuple[int, int]] = []   # The source and destination class indices of each line
+
+    @property
+    def settings(self) -> SyntheticDiagramSettings:
+        return self._settings
+
+    @property
+    def classDefinitions(self) -> ClassDefinitions:
+        return self._classDefinitions
+
+    @property
+    def umlLineDefinitions(self) -> UmlLineDefinitions:
+        return self._umlLineDefinitions
+
+    def generate(self):
+        """
+        Make the definitions;  Again from the seed each time
+        """
+        randomGenerator: Random = Random(self._settings.seed)
+
+        self._classDefinitions   = []
+        self._umlLineDefinitions = []
+        self._lineEnds           = []
+
+        columns:    int = max(1, ceil(sqrt(self._settings.classCount)))
+        cellHeight: int = self._classHeight() + SyntheticDiagramGenerator.CELL_GAP
+        cellWidth:  int = SyntheticDiagramGenerator.CLASS_WIDTH + SyntheticDiagramGenerator.CELL_GAP
+
+        for classNumber in range(self._settings.classCount):
+            row, column = divmod(classNumber, columns)
+            position: Position = Position(x=column * cellWidth + SyntheticDiagramGenerator.CELL_GAP, y=row * cellHeight + SyntheticDiagramGenerator.CELL_GAP)
+            self._classDefinitions.append(self._generateClass(randomGenerator=randomGenerator, classNumber=classNumber, position=position))
+
+        lineTypes:         List[LineType] = list(self._settings.lineTypeMix.keys())
+        cumulativeWeights: List[float]    = list(accumulate(self._settings.lineTypeMix.values()))
+        for classNumber in range(1, self._settings.classCount):
+            if randomGenerator.random() >= self._settings.lineProbability:
+                continue
+            row, column = divmod(classNumber, columns)
+            if row == 0 or (column > 0 and randomGenerator.random() < 0.5):
+                neighbor: int = classNumber - 1
+            else:
+                neighbor: int = classNumber - columns
+            lineType:  LineType = randomGenerator.choices(lineTypes, cum_weights=cumulativeWeights)[0]
+            bendCount: int      = randomGenerator.randint(0, self._settings.maximumBends)
+
+            self._umlLineDefinitions.append(self._generateLine(source=classNumber, destination=neighbor, lineType=lineType, bendCount=bendCount))
+            self._lineEnds.append((classNumber, neighbor))
+
+        self.logger.debug(f'Generated {len(self._classDefinitions)} classes and {len(self._umlLineDefinitions)} lines')
+
+    def writeXml(self, fqFileName: str):
+        """
+        Write the generated definitions as a Pyut project file
+
+        Args:
+            fqFileName:  Fully qualified file name
+        """
+        document:    Document = Document()
+        topElement:  Element  = document.createElement(TOP_LEVEL_ELEMENT)
+        pyutElement: Element  = document.createElement(ELEMENT_DOCUMENT)
+
+        topElement.setAttribute('version', '10')
+        topElement.setAttribute('CodePath', '')
+        pyutElement.setAttribute(ATTR_TYPE, 'CLASS_DIAGRAM')
+        pyutElement.setAttribute('title', f'Synthetic{self._settings.classCount}')
+
+        document.appendChild(topElement)
+        topElement.appendChild(pyutElement)
+
+        for classId, classDef in enumerate(self._classDefinitions, start=1):
+            pyutElement.appendChild(self._classElement(document=document, classId=classId, classDef=classDef))
+
+        for (source, destination), lineDefinition in zip(self._lineEnds, self._umlLineDefinitions):
+            pyutElement.appendChild(self._linkElement(document=document, sourceId=source + 1, destinationId=destination + 1, lineDefinition=lineDefinition))
+
+        with open(fqFileName, 'w', encoding='iso-8859-1') as xmlFile:
+            xmlFile.write(document.toprettyxml(indent='    ', encoding='iso-8859-1').decode('iso-8859-1'))
+
+    def _classHeight(self) -> int:
+        return SyntheticDiagramGenerator.CLASS_BASE_HEIGHT + self._settings.methodsPerClass * SyntheticDiagramGenerator.METHOD_LINE_HEIGHT
+
+    def _generateClass(self, randomGenerator: Random, classNumber: int, position: Position) -> ClassDefinition:
+
+        classDef: ClassDefinition = ClassDefinition(name=f'SyntheticClass{classNumber}',
+                                                    position=position,
+                                                    size=Size(width=SyntheticDiagramGenerator.CLASS_WIDTH, height=self._classHeight()))
+        for methodNumber in range(self._settings.methodsPerClass):
+            methodDef: MethodDefinition = MethodDefinition(name=f'method{classNumber}_{methodNumber}',
+                                                           visibility=randomGenerator.choice(SyntheticDiagramGenerator.VISIBILITIES))
+            for parameterNumber in range(randomGenerator.randint(0, self._settings.maximumParameters)):
+                parameterType: str = randomGenerator.choice(SyntheticDiagramGenerator.PARAMETER_TYPES)
+                methodDef.parameters.append(ParameterDefinition(name=f'param{parameterNumber}', parameterType=parameterType))
+
+            classDef.methods.append(methodDef)
+
+        return classDef
+
+    def _generateLine(self, source: int, destination: int, lineType: LineType, bendCount: int) -> UmlLineDefinition:
+        """
+        From the top (or left) of the source to the bottom (or right) of the destination.  The bends step across
+        the gap between the classes
+        """
+        sourceDef:      ClassDefinition = self._classDefinitions[source]
+        destinationDef: ClassDefinition = self._classDefinitions[destination]
+
+        vertical: bool = sourceDef.position.y != destinationDef.position.y
+        if vertical is True:
+            start: Position = Position(x=sourceDef.position.x + sourceDef.size.width / 2, y=sourceDef.position.y)
+            end:   Position = Position(x=destinationDef.position.x + destinationDef.size.width / 2, y=destinationDef.position.y + destinationDef.size.height)
+        else:
+            start: Position = Position(x=sourceDef.position.x, y=sourceDef.position.y + sourceDef.size.height / 2)
+            end:   Position = Position(x=destinationDef.position.x + destinationDef.size.width, y=destinationDef.position.y + destinationDef.size.height / 2)
+
+        linePositions: LinePositions = [start]
+        for bendNumber in range(1, bendCount + 1):
+            fraction: float = bendNumber / (bendCount + 1)
+            offset:   float = SyntheticDiagramGenerator.CELL_GAP / 4 if bendNumber % 2 == 1 else -SyntheticDiagramGenerator.CELL_GAP / 4
+            if vertical is True:
+                linePositions.append(Position(x=start.x + offset, y=start.y + (end.y - start.y) * fraction))
+            else:
+                linePositions.append(Position(x=start.x + (end.x - start.x) * fraction, y=start.y + offset))
+        linePositions.append(end)
+
+        return UmlLineDefinition(linePositions=linePositions, lineType=lineType)
+
+    def _classElement(self, document: Document, classId: int, classDef: ClassDefinition) -> Element:
+
+        graphicClass: Element = document.createElement(ELEMENT_GRAPHIC_CLASS)
+        graphicClass.setAttribute(ATTR_WIDTH,  f'{classDef.size.width:.2f}')
+        graphicClass.setAttribute(ATTR_HEIGHT, f'{classDef.size.height:.2f}')
+        graphicClass.setAttribute(ATTR_X,      f'{classDef.position.x:.2f}')
+        graphicClass.setAttribute(ATTR_Y,      f'{classDef.position.y:.2f}')
+
+        modelClass: Element = document.createElement(ELEMENT_MODEL_CLASS)
+        modelClass.setAttribute('id', str(classId))
+        modelClass.setAttribute(ATTR_NAME, classDef.name)
+        modelClass.setAttribute(ATTR_SHOW_METHODS,    str(classDef.displayMethods))
+        modelClass.setAttribute(ATTR_SHOW_FIELDS,     str(classDef.displayFields))
+        modelClass.setAttribute(ATTR_SHOW_STEREOTYPE, str(classDef.displayStereotype))
+
+        for methodDef in classDef.methods:
+            modelMethod: Element = document.createElement(ELEMENT_MODEL_METHOD)
+            modelMethod.setAttribute(ATTR_NAME, methodDef.name)
+            modelMethod.setAttribute('visibility', SyntheticDiagramGenerator.PYUT_VISIBILITY[methodDef.visibility])
+            for parameterDef in methodDef.parameters:
+                modelParameter: Element = document.createElement(ELEMENT_MODEL_PARAM)
+                modelParameter.setAttribute(ATTR_NAME, parameterDef.name)
+                modelParameter.setAttribute(ATTR_TYPE, parameterDef.parameterType)
+                modelParameter.setAttribute(ATTR_DEFAULT_VALUE, parameterDef.defaultValue)
+                modelMethod.appendChild(modelParameter)
+            modelClass.appendChild(modelMethod)
+
+        graphicClass.appendChild(modelClass)
+
+        return graphicClass
+
+    def _linkElement(self, document: Document, sourceId: int, destinationId: int, lineDefinition: UmlLineDefinition) -> Element:
+
+        linePositions: LinePositions = lineDefinition.linePositions
+
+        graphicLink: Element = document.createElement(ELEMENT_GRAPHIC_LINK)
+        graphicLink.setAttribute(ATTR_LINK_SOURCE_ANCHOR_X,      f'{linePositions[0].x:.2f}')
+        graphicLink.setAttribute(ATTR_LINK_SOURCE_ANCHOR_Y,      f'{linePositions[0].y:.2f}')
+        graphicLink.setAttribute(ATTR_LINK_DESTINATION_ANCHOR_X, f'{linePositions[-1].x:.2f}')
+        graphicLink.setAttribute(ATTR_LINK_DESTINATION_ANCHOR_Y, f'{linePositions[-1].y:.2f}')
+        graphicLink.setAttribute('spline', 'False')
+
+        for bend in linePositions[1:-1]:
+            controlPoint: Element = document.createElement(ELEMENT_CONTROL_POINT)
+            controlPoint.setAttribute(ATTR_X, f'{bend.x:.2f}')
+            controlPoint.setAttribute(ATTR_Y, f'{bend.y:.2f}')
+            graphicLink.appendChild(controlPoint)
+
+        modelLink: Element = document.createElement(ELEMENT_MODEL_LINK)
+        modelLink.setAttribute(ATTR_TYPE, lineDefinition.lineType.name.upper())
+        modelLink.setAttribute('sourceId', str(sourceId))
+        modelLink.setAttribute('destId',   str(destinationId))
+        graphicLink.appendChild(modelLink)
+
+        return graphicLink
@@ -0,0 +1,4 @@
+"""
+Performance measurements for pyumldiagrams.  These are not unit tests;  Run them from the project root,
+for example `python3 -m benchmarks.BenchmarkImageEncoders`
+"""
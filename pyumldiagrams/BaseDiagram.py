@@ -1,13 +1,30 @@
 
+from typing import Any
+from typing import Callable
 from typing import List
+from typing import Optional
+from typing import Union
 from typing import cast
 from typing import final
 
 from logging import Logger
 from logging import getLogger
 
+from os import path as osPath
+
 from datetime import datetime
 
+from hashlib import sha256
+
+from contextlib import nullcontext
+
+from time import perf_counter
+
+from pyumldiagrams.DiagramCache import DiagramCache
+from pyumldiagrams.DiagramInstrumentation import DiagramInstrumentation
+from pyumldiagrams.DiagramInstrumentation import InstrumentationCounters
+from pyumldiagrams.RenderProfiler import RenderProfiler
+
 from pyumldiagrams.Definitions import ClassDefinition
 from pyumldiagrams.Definitions import DiagramPadding
 from pyumldiagrams.Definitions import DisplayMethodParameters
@@ -16,10 +33,14 @@ from pyumldiagrams.Definitions import FieldDefinition
 from pyumldiagrams.Definitions import MethodDefinition
 from pyumldiagrams.Definitions import ParameterDefinition
 from pyumldiagrams.Definitions import RectangleDefinition
+from pyumldiagrams.Definitions import TextDefinition
 from pyumldiagrams.Definitions import UmlLineDefinition
 from pyumldiagrams.Definitions import Fields
 from pyumldiagrams.Definitions import Methods
 
+DeferredDefinition  = Union[ClassDefinition, UmlLineDefinition, EllipseDefinition, RectangleDefinition, TextDefinition]
+DeferredDefinitions = List[DeferredDefinition]
+
 
 class BaseDiagram:
     """
@@ -37,6 +58,17 @@ class BaseDiagram:
     HEADER_FONT_SIZE:  final = 14
     RESOURCE_ENV_VAR:  final = 'RESOURCEPATH'
 
+    INSTRUMENTED_METHODS: final = {
+        'drawClass':     RenderProfiler.DRAW_PHASE,
+        'drawUmlLine':   RenderProfiler.DRAW_PHASE,
+        'drawRectangle': RenderProfiler.DRAW_PHASE,
+        'drawEllipse':   RenderProfiler.DRAW_PHASE,
+        'write':         RenderProfiler.ENCODE_PHASE,
+    }
+    """
+    The methods that the instrumentation and the profiler wrap;  With the profiler phase of each
+    """
+
     clsLogger: Logger = getLogger(__name__)
 
     def __init__(self, fileName: str, docDisplayMethodParameters: DisplayMethodParameters = DisplayMethodParameters.DISPLAY, dpi: int = 0, headerText: str = ''):
@@ -64,6 +96,12 @@ class BaseDiagram:
         self._softwareNameVersion: str = ''
         self._diagramPadding:      DiagramPadding = DiagramPadding()
 
+        self._diagramCache:        Optional[DiagramCache]           = None
+        self._deferredDefinitions: DeferredDefinitions              = []
+        self._instrumentation:     Optional[DiagramInstrumentation] = None
+        self._profiler:            Optional[RenderProfiler]         = None
+        self._startedProfiler:     bool                             = False
+
     @property
     def fontSize(self) -> int:
         """
@@ -137,6 +175,49 @@ class BaseDiagram:
         """
         pass
 
+    @property
+    def diagramCache(self) -> Optional[DiagramCache]:
+        """
+        An optional cache of rendered output.  With a cache the diagram queues the drawing requests;  When
+        `write` finds the diagram in the cache it writes the cached output and skips the rendering.  Set it before
+        drawing anything.  See `pyumldiagrams.DiagramCache.DiagramCache`
+        """
+        return self._diagramCache
+
+    @diagramCache.setter
+    def diagramCache(self, newCache: DiagramCache):
+        self._diagramCache = newCache
+
+    @property
+    def instrumentation(self) -> Optional[DiagramInstrumentation]:
+        """
+        An optional receiver of a timing span and counters for every `drawClass`, `drawUmlLine`, `drawRectangle`,
+        `drawEllipse` and `write` call.  Setting it wraps those methods on this diagram;  Without it they are not
+        wrapped and nothing is measured.  See `pyumldiagrams.DiagramInstrumentation.DiagramInstrumentation`
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, newValue: Optional[DiagramInstrumentation]):
+
+        self._instrumentation = newValue
+        self.__wrapInstrumentedMethods()
+        self._instrumentationChanged()
+
+    @property
+    def profiler(self) -> Optional[RenderProfiler]:
+        """
+        An optional profiler for the render of this diagram.  Like the instrumentation, setting it wraps the drawing
+        methods and `write`.  See `pyumldiagrams.RenderProfiler.RenderProfiler`
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, newValue: Optional[RenderProfiler]):
+
+        self._profiler = newValue
+        self.__wrapInstrumentedMethods()
+
     def retrieveResourcePath(self, bareFileName: str) -> str:
         """
         Must be overridden by implementors
@@ -195,6 +276,141 @@ class BaseDiagram:
         """
         pass
 
+    @property
+    def _deferDrawing(self) -> bool:
+        """
+        True when the drawing requests are queued until `write`.  Implementors may add their own reasons
+        """
+        return self._diagramCache is not None
+
+    def _drawDeferred(self, definition: DeferredDefinition):
+        """
+        Draw a queued definition
+        Must be overridden by implementors
+
+        Args:
+            definition:  The definition to draw
+        """
+        pass
+
+    def _drawDeferredDefinitions(self):
+
+        with self._profilerPhase(RenderProfiler.DRAW_PHASE):
+            for definition in self._deferredDefinitions:
+                self._drawDeferred(definition=definition)
+
+    def _profilerPhase(self, name: str):
+        """
+        Args:
+            name:  The phase of the block;  See `pyumldiagrams.RenderProfiler.RenderProfiler.PHASES`
+
+        Returns:  A context manager that attributes the block to the phase;  It does nothing without a profiler
+        """
+        if self._profiler is None:
+            return nullcontext()
+        else:
+            return self._profiler.phase(name)
+
+    def _cacheKeySettings(self) -> List[Any]:
+        """
+        Implementors return any additional settings that affect their output
+
+        Returns:  Values with a deterministic representation
+        """
+        return []
+
+    def _computeCacheKey(self) -> str:
+        """
+        A stable hash of everything that affects the output.  The document time stamp is part of it;  Pin it
+        with `docTimeStamp` so that the key does not change from run to run
+
+        Returns:  The cache key
+        """
+        hasher = sha256()
+        for keyPart in self._settingsKeyParts() + [self.docTimeStamp]:
+            hasher.update(repr(keyPart).encode('utf-8'))
+        for definition in self._deferredDefinitions:
+            hasher.update(repr(definition).encode('utf-8'))
+
+        return hasher.hexdigest()
+
+    def _computeSettingsKey(self) -> str:
+        """
+        A stable hash of the settings that affect the output;  Neither the definitions nor the time stamp
+
+        Returns:  The settings key
+        """
+        hasher = sha256()
+        for keyPart in self._settingsKeyParts():
+            hasher.update(repr(keyPart).encode('utf-8'))
+
+        return hasher.hexdigest()
+
+    def _settingsKeyParts(self) -> List[Any]:
+
+        keyParts: List[Any] = [
+            self.__class__.__name__,
+            self._diagramPadding,
+            self._fontSize,
+            self._headerText,
+            self._dpi,
+            self._docDisplayMethodParameters,
+        ]
+        keyParts.extend(self._cacheKeySettings())
+
+        return keyParts
+
+    def _writeCachedOutput(self, fileName: str, render: Callable[[], bytes]):
+        """
+        Writes the cached output if we have it;  Else render, cache and write it
+
+        Args:
+            fileName:  Fully qualified file name
+            render:    Draws the queued definitions and returns the encoded document
+        """
+        cacheKey: str = self._computeCacheKey()
+        output:   Optional[bytes] = self._diagramCache.retrieve(cacheKey)
+
+        if output is None:
+            output = render()
+            self._diagramCache.store(cacheKey, output)
+        else:
+            self.clsLogger.info(f'Cache hit for {fileName}')
+
+        with open(fileName, 'wb') as outputFile:
+            outputFile.write(output)
+
+    def _instrumentationChanged(self):
+        """
+        Implementors that count through their drawing objects install or remove their counting here
+        """
+        pass
+
+    def _instrumentationMark(self) -> Any:
+        """
+        Implementors return where their output is before an instrumented call
+
+        Returns:  What `_instrumentationCounters` needs to count what the call emitted
+        """
+        return None
+
+    def _instrumentationCounters(self, mark: Any) -> InstrumentationCounters:
+        """
+        Implementors count what was emitted since `_instrumentationMark` returned `mark`
+
+        Args:
+            mark:  What `_instrumentationMark` returned
+
+        Returns:  The counters;  The bytes written are filled in by the caller
+        """
+        return InstrumentationCounters()
+
+    def _outputFileName(self) -> str:
+        """
+        Implementors that adjust the file name return the one that `write` writes to
+        """
+        return self._fileName
+
     def _buildMethods(self, methods: Methods, displayParameters: DisplayMethodParameters) -> MethodsRepr:
         """
 
@@ -207,10 +423,11 @@ class BaseDiagram:
 
         methodReprs: BaseDiagram.MethodsRepr = []
 
-        for methodDef in methods:
+        with self._profilerPhase(RenderProfiler.LAYOUT_PHASE):
+            for methodDef in methods:
 
-            methodRepr: str = self._buildMethod(methodDef, displayParameters)
-            methodReprs.append(methodRepr)
+                methodRepr: str = self._buildMethod(methodDef, displayParameters)
+                methodReprs.append(methodRepr)
 
         return methodReprs
 
@@ -240,9 +457,10 @@ class BaseDiagram:
 
         fieldsRepr: BaseDiagram.FieldsRepr = []
 
-        for fieldDef in fields:
-            fieldRepr: str = self._buildField(fieldDef)
-            fieldsRepr.append(fieldRepr)
+        with self._profilerPhase(RenderProfiler.LAYOUT_PHASE):
+            for fieldDef in fields:
+                fieldRepr: str = self._buildField(fieldDef)
+                fieldsRepr.append(fieldRepr)
 
         return fieldsRepr
 
@@ -258,6 +476,61 @@ class BaseDiagram:
 
         return fieldRepr
 
+    def __wrapInstrumentedMethods(self):
+        """
+        Wraps the instrumented methods on this instance when there is an instrumentation or a profiler;  Else
+        removes the wrappers so that the class methods are called directly
+        """
+        for methodName in BaseDiagram.INSTRUMENTED_METHODS:
+            if self._instrumentation is None and self._profiler is None:
+                self.__dict__.pop(methodName, None)
+            else:
+                self.__dict__[methodName] = self.__instrumented(name=methodName, method=getattr(type(self), methodName).__get__(self))
+
+    def __instrumented(self, name: str, method: Callable) -> Callable:
+        """
+        Args:
+            name:    The method name
+            method:  The bound method to measure
+
+        Returns:  A function that calls the method, profiled if there is a profiler, and reports the span to the instrumentation
+        """
+        def profiled(*args, **kwargs):
+
+            if self._profiler is None:
+                measured(*args, **kwargs)
+            else:
+                if self._profiler.running is False:
+                    self._profiler.start()
+                    self._startedProfiler = True
+                try:
+                    with self._profiler.phase(BaseDiagram.INSTRUMENTED_METHODS[name]):
+                        measured(*args, **kwargs)
+                finally:
+                    if name == 'write' and self._startedProfiler is True:
+                        self._profiler.stop()
+                        self._startedProfiler = False
+
+        def measured(*args, **kwargs):
+
+            if self._instrumentation is None:
+                method(*args, **kwargs)
+                return
+
+            mark:      Any   = self._instrumentationMark()
+            startTime: float = perf_counter()
+
+            method(*args, **kwargs)
+
+            seconds:  float                   = perf_counter() - startTime
+            counters: InstrumentationCounters = self._instrumentationCounters(mark)
+            if name == 'write':
+                counters.bytesWritten = osPath.getsize(self._outputFileName())
+
+            self._instrumentation.span(fileName=self._fileName, name=name, seconds=seconds, counters=counters)
+
+        return profiled
+
     def __generateParametersString(self, methodDef, paramRepr):
 
         nParams:  int = len(methodDef.parameters)
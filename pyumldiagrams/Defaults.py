@@ -50,3 +50,23 @@ The Image format
 
 Please don't presume what I am offended by.  Sticks and stones may broke my bones, but words will never hurt me
 """
+
+DEFAULT_CACHE_MAXIMUM_SIZE: int = 256 * 1024 * 1024
+"""
+The maximum number of bytes a diagram cache keeps on disk before it evicts the least recently used output
+"""
+
+DEFAULT_SPRITE_CACHE_MAXIMUM_SIZE: int = 32 * 1024 * 1024
+"""
+The maximum number of pixel bytes the image class sprite cache keeps before it evicts the least recently used sprites
+"""
+
+DEFAULT_PDF_COORDINATE_PRECISION: int = 2
+"""
+The number of decimals in the PDF drawing coordinates
+"""
+
+DEFAULT_PDF_COMPRESSION_LEVEL: int = 6
+"""
+The deflate level of the PDF streams;  0 writes them uncompressed, 9 makes the smallest documents
+"""
@@ -304,3 +304,18 @@ class EllipseDefinition(RectangleDefinition):
     This is just typing syntactical sugar on how to define an Ellipse.
     """
     pass
+
+
+@dataclass
+class TextDefinition:
+    """
+    Defines text to draw at a display position
+    """
+    position: Position = Position(0, 0)
+    """
+    Where to put the text.  See `Position`
+    """
+    text:     str      = ''
+    """
+    The text to draw
+    """
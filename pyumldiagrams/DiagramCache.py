@@ -0,0 +1,150 @@
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import makedirs
+from os import remove as osRemove
+from os import replace as osReplace
+from os import scandir
+from os import utime
+from os import DirEntry
+
+from os.path import join as osPathJoin
+
+from tempfile import NamedTemporaryFile
+
+from pyumldiagrams.Defaults import DEFAULT_CACHE_MAXIMUM_SIZE
+
+CacheEntry = Tuple[float, int, str]
+"""
+Syntactic sugar for the last use time, size, and path of a cached output
+"""
+
+
+class DiagramCache:
+    """
+    A content addressed disk cache for rendered diagrams.  The diagrams compute the keys from everything
+    that affects their output;  So the same key always means the same bytes.  When the cached output exceeds
+    the maximum size the least recently used entries are evicted.
+
+    Several processes may share a cache directory;  Entries are written to a temporary file and then renamed
+    """
+    CACHE_FILE_SUFFIX: str = '.cache'
+
+    def __init__(self, cacheDirectory: str, maximumSize: int = DEFAULT_CACHE_MAXIMUM_SIZE):
+        """
+
+        Args:
+            cacheDirectory:  Where to keep the cached output;  Created if it does not exist
+
+            maximumSize:     The maximum number of bytes to keep.  See `pyumldiagrams.Defaults.DEFAULT_CACHE_MAXIMUM_SIZE`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: str = cacheDirectory
+        self._maximumSize:    int = maximumSize
+
+        makedirs(cacheDirectory, exist_ok=True)
+
+    @property
+    def cacheDirectory(self) -> str:
+        return self._cacheDirectory
+
+    @property
+    def maximumSize(self) -> int:
+        """
+        The maximum number of bytes to keep on disk
+        """
+        return self._maximumSize
+
+    @maximumSize.setter
+    def maximumSize(self, newValue: int):
+        self._maximumSize = newValue
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes currently cached
+        """
+        return sum(entry[1] for entry in self._entries())
+
+    def retrieve(self, key: str) -> Optional[bytes]:
+        """
+        Args:
+            key:  The diagram's cache key
+
+        Returns:  The cached output or None if it is not cached
+        """
+        fqFileName: str = self._toFileName(key)
+        try:
+            with open(fqFileName, 'rb') as cacheFile:
+                output: bytes = cacheFile.read()
+            utime(fqFileName)      # Most recently used now
+        except FileNotFoundError:
+            self.logger.debug(f'Cache miss: {key}')
+            return None
+
+        self.logger.debug(f'Cache hit: {key}')
+        return output
+
+    def store(self, key: str, output: bytes):
+        """
+        Cache the output;  Then evict the least recently used entries if we are over the maximum size
+
+        Args:
+            key:     The diagram's cache key
+            output:  The rendered bytes
+        """
+        with NamedTemporaryFile(dir=self._cacheDirectory, delete=False) as temporaryFile:
+            temporaryFile.write(output)
+
+        osReplace(temporaryFile.name, self._toFileName(key))
+        self._evict()
+
+    def clear(self):
+        """
+        Remove all the cached output
+        """
+        for lastUsed, size, fqFileName in self._entries():
+            self._remove(fqFileName)
+
+    def _evict(self):
+
+        entries:   List[CacheEntry] = sorted(self._entries())
+        totalSize: int              = sum(entry[1] for entry in entries)
+
+        for lastUsed, size, fqFileName in entries:
+            if totalSize <= self._maximumSize:
+                break
+            self.logger.debug(f'Evicting: {fqFileName}')
+            self._remove(fqFileName)
+            totalSize -= size
+
+    def _entries(self) -> List[CacheEntry]:
+
+        entries: List[CacheEntry] = []
+
+        for dirEntry in scandir(self._cacheDirectory):
+            dirEntry: DirEntry = dirEntry
+            if dirEntry.name.endswith(DiagramCache.CACHE_FILE_SUFFIX):
+                try:
+                    stat = dirEntry.stat()
+                except FileNotFoundError:     # Another process evicted it
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dirEntry.path))
+
+        return entries
+
+    def _remove(self, fqFileName: str):
+        try:
+            osRemove(fqFileName)
+        except FileNotFoundError:
+            pass        # Another process beat us to it
+
+    def _toFileName(self, key: str) -> str:
+        return osPathJoin(self._cacheDirectory, f'{key}{DiagramCache.CACHE_FILE_SUFFIX}')
@@ -0,0 +1,93 @@
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+from pyumldiagrams.Defaults import DEFAULT_HORIZONTAL_GAP
+from pyumldiagrams.Defaults import DEFAULT_VERTICAL_GAP
+from pyumldiagrams.Defaults import LEFT_MARGIN
+from pyumldiagrams.Defaults import TOP_MARGIN
+
+from pyumldiagrams.Definitions import ClassDefinitions
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import UmlLineDefinitions
+
+
+@dataclass
+class DiagramFeatures:
+    """
+    What the render cost of a diagram depends on.  Cheap to compute;  Nothing is drawn or measured.
+    See `pyumldiagrams.RenderCostEstimator.RenderCostEstimator`
+    """
+    classCount:     int = 0
+    textLines:      int = 0
+    """
+    The class names plus the displayed fields and methods;  Each is a line of text
+    """
+    textCharacters: int = 0
+    lineSegments:   int = 0
+    decorations:    int = 0
+    """
+    The inheritance arrows and the aggregation diamonds
+    """
+    compositions:   int = 0
+    """
+    The composition diamonds;  Counted apart since some backends fill them point by point
+    """
+    canvasPixels:   int = 0
+
+    @classmethod
+    def fromDefinitions(cls, classDefinitions: ClassDefinitions, umlLineDefinitions: UmlLineDefinitions, canvasSize: Optional[Size] = None) -> 'DiagramFeatures':
+        """
+        Args:
+            classDefinitions:    The classes to draw
+            umlLineDefinitions:  The lines to draw
+            canvasSize:          The image size in pixels;  If None, the size that fits the definitions, like auto fit
+
+        Returns:  The features of the diagram
+        """
+        features: DiagramFeatures = DiagramFeatures(classCount=len(classDefinitions))
+
+        maxX: float = 0.0
+        maxY: float = 0.0
+        for classDefinition in classDefinitions:
+            features.textLines      += 1
+            features.textCharacters += len(classDefinition.name)
+            if classDefinition.displayFields is True:
+                for fieldDefinition in classDefinition.fields:
+                    features.textLines      += 1
+                    features.textCharacters += cls.__textLength(fieldDefinition.name, fieldDefinition.parameterType, fieldDefinition.defaultValue)
+            if classDefinition.displayMethods is True:
+                for methodDefinition in classDefinition.methods:
+                    features.textLines      += 1
+                    features.textCharacters += cls.__textLength(methodDefinition.name, methodDefinition.returnType)
+                    for parameter in methodDefinition.parameters:
+                        features.textCharacters += cls.__textLength(parameter.name, parameter.parameterType, parameter.defaultValue)
+
+            maxX = max(maxX, classDefinition.position.x + classDefinition.size.width)
+            maxY = max(maxY, classDefinition.position.y + classDefinition.size.height)
+
+        for umlLineDefinition in umlLineDefinitions:
+            features.lineSegments += max(0, len(umlLineDefinition.linePositions) - 1)
+            if umlLineDefinition.lineType == LineType.Composition:
+                features.compositions += 1
+            else:
+                features.decorations += 1
+
+            for position in umlLineDefinition.linePositions:
+                maxX = max(maxX, position.x)
+                maxY = max(maxY, position.y)
+
+        if canvasSize is None:
+            canvasSize = Size(width=maxX + 2 * (LEFT_MARGIN + DEFAULT_VERTICAL_GAP), height=maxY + 2 * (TOP_MARGIN + DEFAULT_HORIZONTAL_GAP))
+        features.canvasPixels = int(canvasSize.width * canvasSize.height)
+
+        return features
+
+    @classmethod
+    def __textLength(cls, *texts: Optional[str]) -> int:
+        """
+        The XML reader leaves missing types and default values as None
+        """
+        return sum(len(text) for text in texts if text is not None)
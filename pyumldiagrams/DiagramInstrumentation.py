@@ -0,0 +1,54 @@
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+
+@dataclass
+class InstrumentationCounters:
+    """
+    What a diagram call emitted.  The diagrams count what they hand to their drawing library;  Drawing
+    that is deferred until `write` is counted by `write`
+    """
+    primitives:   int = 0       # Drawing operations;  Lines, rectangles, ellipses, polygons, and text
+    textRuns:     int = 0
+    polygonFills: int = 0       # Filled shapes and decorations;  Each counts once, however the backend fills it
+    bytesWritten: int = 0       # Only `write` writes
+
+    def since(self, mark: 'InstrumentationCounters') -> 'InstrumentationCounters':
+        """
+        Args:
+            mark:  A copy of these counters taken earlier
+
+        Returns:  What was counted since the copy was taken
+        """
+        return InstrumentationCounters(primitives=self.primitives - mark.primitives,
+                                       textRuns=self.textRuns - mark.textRuns,
+                                       polygonFills=self.polygonFills - mark.polygonFills,
+                                       bytesWritten=self.bytesWritten - mark.bytesWritten)
+
+
+class DiagramInstrumentation:
+    """
+    Receives a timing span for every `drawClass`, `drawUmlLine`, `drawRectangle`, `drawEllipse` and `write` call
+    of a diagram.  This implementation discards them;  Subclass it and override `span` to send them to a
+    metrics pipeline.
+
+    Set it with `pyumldiagrams.BaseDiagram.BaseDiagram.instrumentation`.  A diagram without an instrumentation
+    measures nothing;  Its methods are only wrapped once an instrumentation is set
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def span(self, fileName: str, name: str, seconds: float, counters: InstrumentationCounters):
+        """
+        Called when an instrumented call returns;  Not called when it raises
+
+        Args:
+            fileName:  The diagram's output file name
+            name:      The method name, for example `drawClass`
+            seconds:   How long the call took
+            counters:  What the call emitted
+        """
+        pass
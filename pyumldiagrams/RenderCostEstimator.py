@@ -0,0 +1,190 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from json import dump as jsonDump
+from json import load as jsonLoad
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import fields
+
+from pyumldiagrams.DiagramFeatures import DiagramFeatures
+from pyumldiagrams.UnsupportedException import UnsupportedException
+
+Coefficients = Dict[str, float]
+"""
+Syntactic sugar for the cost of one unit of each feature;  `RenderCostEstimator.INTERCEPT` is the fixed cost
+"""
+BackendCoefficients = Dict[str, Dict[str, Coefficients]]
+"""
+Syntactic sugar for the coefficients by backend, then by estimated quantity
+"""
+CalibrationSample = Tuple[DiagramFeatures, float]
+"""
+Syntactic sugar for the features of a rendered diagram and a measured quantity
+"""
+
+
+@dataclass
+class RenderEstimate:
+    seconds: float = 0.0
+    bytes:   int   = 0
+
+
+class RenderCostEstimator:
+    """
+    Predicts the render time and the output size of a diagram from its features, without drawing it.  Each
+    quantity is a linear function of the features, with coefficients that are not negative.  The defaults were
+    calibrated with `benchmarks.CalibrateRenderCost` on the synthetic benchmark diagrams;  Calibrate on the
+    machines that render, save the coefficients, and load them here
+    """
+    PDF_BACKEND:   final = 'pdf'
+    IMAGE_BACKEND: final = 'image'
+
+    SECONDS: final = 'seconds'
+    BYTES:   final = 'bytes'
+
+    INTERCEPT: final = 'intercept'
+
+    DEFAULT_COEFFICIENTS: final = {
+        PDF_BACKEND: {
+            SECONDS: {INTERCEPT: 0.0, 'classCount': 0.000105, 'textLines': 0.0, 'textCharacters': 6.38e-07,
+                      'lineSegments': 0.0, 'decorations': 0.0, 'compositions': 0.00131, 'canvasPixels': 0.0},
+            BYTES:   {INTERCEPT: 1290.0, 'classCount': 0.0, 'textLines': 0.0, 'textCharacters': 0.0,
+                      'lineSegments': 5.63, 'decorations': 0.0, 'compositions': 275.0, 'canvasPixels': 0.00163},
+        },
+        IMAGE_BACKEND: {
+            SECONDS: {INTERCEPT: 0.0, 'classCount': 0.0, 'textLines': 0.0, 'textCharacters': 0.000272,
+                      'lineSegments': 0.000879, 'decorations': 0.0, 'compositions': 0.0, 'canvasPixels': 0.0},
+            BYTES:   {INTERCEPT: 0.0, 'classCount': 0.0, 'textLines': 471.0, 'textCharacters': 0.0,
+                      'lineSegments': 0.0, 'decorations': 0.0, 'compositions': 0.0, 'canvasPixels': 0.00206},
+        },
+    }
+
+    def __init__(self, coefficients: BackendCoefficients = None):
+        """
+
+        Args:
+            coefficients:  The calibrated coefficients;  Defaults to `DEFAULT_COEFFICIENTS`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._coefficients: BackendCoefficients = RenderCostEstimator.DEFAULT_COEFFICIENTS if coefficients is None else coefficients
+
+    @property
+    def coefficients(self) -> BackendCoefficients:
+        return self._coefficients
+
+    def estimate(self, features: DiagramFeatures, backend: str) -> RenderEstimate:
+        """
+        Args:
+            features:  Describes the diagram;  See `pyumldiagrams.DiagramFeatures.DiagramFeatures.fromDefinitions`
+            backend:   `PDF_BACKEND` or `IMAGE_BACKEND`
+
+        Returns:  The predicted render time and output size
+        """
+        if backend not in self._coefficients:
+            raise UnsupportedException(f'No render cost coefficients for backend: `{backend}`')
+
+        backendCoefficients: Dict[str, Coefficients] = self._coefficients[backend]
+
+        return RenderEstimate(seconds=self.predict(backendCoefficients[RenderCostEstimator.SECONDS], features),
+                              bytes=round(self.predict(backendCoefficients[RenderCostEstimator.BYTES], features)))
+
+    def save(self, fileName: str):
+        """
+        Args:
+            fileName:  The JSON file for the coefficients
+        """
+        with open(fileName, 'w') as coefficientsFile:
+            jsonDump(self._coefficients, coefficientsFile, indent=2)
+
+    @classmethod
+    def load(cls, fileName: str) -> 'RenderCostEstimator':
+        """
+        Args:
+            fileName:  A JSON file that `save` wrote
+
+        Returns:  An estimator with the saved coefficients
+        """
+        with open(fileName) as coefficientsFile:
+            return RenderCostEstimator(coefficients=jsonLoad(coefficientsFile))
+
+    @classmethod
+    def predict(cls, coefficients: Coefficients, features: DiagramFeatures) -> float:
+        """
+        Args:
+            coefficients:  For one quantity of one backend
+            features:      Describes the diagram
+
+        Returns:  The predicted quantity
+        """
+        prediction: float = coefficients.get(RenderCostEstimator.INTERCEPT, 0.0)
+        for name, value in asdict(features).items():
+            prediction += coefficients.get(name, 0.0) * value
+
+        return prediction
+
+    @classmethod
+    def fit(cls, samples: List[CalibrationSample]) -> Coefficients:
+        """
+        Least squares fit of the coefficients of one quantity.  A feature whose coefficient comes out negative is
+        dropped and the others are fit again, so that more of anything never costs less
+
+        Args:
+            samples:  Rendered diagrams and what was measured;  More samples than features, with varied features
+
+        Returns:  The coefficients
+        """
+        names:   List[str]         = [RenderCostEstimator.INTERCEPT] + [featureField.name for featureField in fields(DiagramFeatures)]
+        rows:    List[List[float]] = [[1.0] + [float(value) for value in asdict(features).values()] for features, measured in samples]
+        targets: List[float]       = [measured for features, measured in samples]
+        #
+        # Scale the columns so that pixel counts and class counts are equally well conditioned
+        #
+        scales: List[float] = [max((abs(row[column]) for row in rows), default=0.0) or 1.0 for column in range(len(names))]
+        rows = [[value / scale for value, scale in zip(row, scales)] for row in rows]
+
+        active: List[int] = [column for column in range(len(names)) if any(row[column] != 0.0 for row in rows)]
+        solution: Dict[int, float] = {}
+        while len(active) > 0:
+            solution = dict(zip(active, cls.__solveLeastSquares(rows=[[row[column] for column in active] for row in rows], targets=targets)))
+            negative: List[int] = [column for column, value in solution.items() if value < 0.0]
+            if len(negative) == 0:
+                break
+            active = [column for column in active if column not in negative]
+
+        return {name: solution.get(column, 0.0) / scales[column] for column, name in enumerate(names)}
+
+    @classmethod
+    def __solveLeastSquares(cls, rows: List[List[float]], targets: List[float]) -> List[float]:
+        """
+        Solves the normal equations by Gaussian elimination with partial pivoting.  A small ridge keeps
+        them solvable when two features move together
+        """
+        size:   int = len(rows[0])
+        ridge:  float = 1e-9
+
+        matrix: List[List[float]] = [
+            [sum(row[i] * row[j] for row in rows) + (ridge if i == j else 0.0) for j in range(size)] + [sum(row[i] * target for row, target in zip(rows, targets))]
+            for i in range(size)
+        ]
+        for pivot in range(size):
+            best: int = max(range(pivot, size), key=lambda candidate: abs(matrix[candidate][pivot]))
+            matrix[pivot], matrix[best] = matrix[best], matrix[pivot]
+            for row in range(pivot + 1, size):
+                factor: float = matrix[row][pivot] / matrix[pivot][pivot]
+                for column in range(pivot, size + 1):
+                    matrix[row][column] -= factor * matrix[pivot][column]
+
+        solution: List[float] = [0.0] * size
+        for row in reversed(range(size)):
+            solution[row] = (matrix[row][size] - sum(matrix[row][column] * solution[column] for column in range(row + 1, size))) / matrix[row][row]
+
+        return solution
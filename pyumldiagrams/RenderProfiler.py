@@ -0,0 +1,181 @@
+
+from typing import Counter
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from os.path import basename
+
+from sys import _current_frames
+
+from collections import Counter as CounterType
+
+from contextlib import contextmanager
+
+from cProfile import Profile
+
+from threading import Event
+from threading import Thread
+from threading import get_ident
+
+from time import perf_counter
+
+PhaseTimes = Dict[str, float]
+"""
+Syntactic sugar for the seconds spent in each phase
+"""
+
+
+class RenderProfiler:
+    """
+    Profiles a single render with cProfile and, optionally, samples the stack of the rendering thread for
+    flame graphs.  The time is also broken down into phases:  Parsing the input, laying the diagram out, drawing
+    it and encoding the document.  A phase that runs inside another one is not counted in the outer phase.
+
+    Set it with `pyumldiagrams.BaseDiagram.BaseDiagram.profiler`.  The diagram starts the profiler on its
+    first drawing call, unless it is already running, and then stops it when `write` is done.  Start it yourself to
+    also profile parsing;  See `phase`
+    """
+    PARSE_PHASE:  final = 'parse'
+    LAYOUT_PHASE: final = 'layout'
+    DRAW_PHASE:   final = 'draw'
+    ENCODE_PHASE: final = 'encode'
+
+    PHASES: final = [PARSE_PHASE, LAYOUT_PHASE, DRAW_PHASE, ENCODE_PHASE]
+
+    def __init__(self, sampleInterval: float = 0.0):
+        """
+
+        Args:
+            sampleInterval:  The seconds between stack samples;  0 does not sample
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._sampleInterval: float = sampleInterval
+
+        self._profile:      Profile          = Profile()
+        self._running:      bool             = False
+        self._phaseTimes:   PhaseTimes       = {phase: 0.0 for phase in RenderProfiler.PHASES}
+        self._phaseStack:   List[List]       = []      # The name of each active phase and when it last became the innermost one
+        self._stackSamples: Counter[str]     = CounterType()
+        self._sampler:      Optional[Thread] = None
+        self._stopSampling: Event            = Event()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def phaseTimes(self) -> PhaseTimes:
+        """
+        The seconds spent in each phase;  Time outside of the phases is not counted
+        """
+        return dict(self._phaseTimes)
+
+    @property
+    def stackSamples(self) -> Counter[str]:
+        """
+        The number of times each stack was sampled.  A stack is the frames from the outermost one, separated by
+        semicolons;  The format that flame graph tools read
+        """
+        return CounterType(self._stackSamples)
+
+    def start(self):
+        """
+        Start profiling the calling thread
+        """
+        self._running = True
+        if self._sampleInterval > 0:
+            self._stopSampling.clear()
+            self._sampler = Thread(target=self._sample, args=(get_ident(), ), name='RenderProfilerSampler', daemon=True)
+            self._sampler.start()
+
+        self._profile.enable()
+
+    def stop(self):
+
+        self._profile.disable()
+
+        if self._sampler is not None:
+            self._stopSampling.set()
+            self._sampler.join()
+            self._sampler = None
+        self._running = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Attributes the time spent in the block to a phase, for example
+
+            with profiler.phase(RenderProfiler.PARSE_PHASE):
+                toClassDefinition.generateClassDefinitions()
+
+        Args:
+            name:  One of `PHASES`
+        """
+        startTime: float = perf_counter()
+        if len(self._phaseStack) > 0:
+            outerPhase: List = self._phaseStack[-1]
+            self._phaseTimes[outerPhase[0]] += startTime - outerPhase[1]
+
+        self._phaseStack.append([name, startTime])
+        try:
+            yield
+        finally:
+            endTime:    float = perf_counter()
+            innerPhase: List  = self._phaseStack.pop()
+
+            self._phaseTimes[name] += endTime - innerPhase[1]
+            if len(self._phaseStack) > 0:
+                self._phaseStack[-1][1] = endTime
+
+    def summary(self) -> str:
+        """
+        Returns:  The time of each phase and its share of the profiled time, one phase per line
+        """
+        totalTime: float     = sum(self._phaseTimes.values())
+        lines:     List[str] = []
+        for phase, seconds in self._phaseTimes.items():
+            share: float = seconds / totalTime * 100 if totalTime > 0 else 0.0
+            lines.append(f'{phase:<8} {seconds * 1000:>10.2f} ms {share:>6.1f}%')
+
+        return '\n'.join(lines)
+
+    def dumpStats(self, fileName: str):
+        """
+        Write the cProfile statistics;  Read them with `pstats.Stats` or a viewer like snakeviz
+
+        Args:
+            fileName:  The dump file
+        """
+        self._profile.dump_stats(fileName)
+
+    def writeCollapsedStacks(self, fileName: str):
+        """
+        Write the stack samples, one stack and its count per line;  The input of flamegraph.pl and speedscope
+
+        Args:
+            fileName:  The collapsed stacks file
+        """
+        with open(fileName, 'w') as stacksFile:
+            for stack, count in self._stackSamples.most_common():
+                stacksFile.write(f'{stack} {count}\n')
+
+    def _sample(self, threadId: int):
+
+        while self._stopSampling.wait(self._sampleInterval) is False:
+            frame = _current_frames().get(threadId)
+
+            frames: List[str] = []
+            while frame is not None:
+                frames.append(f'{basename(frame.f_code.co_filename)}:{frame.f_code.co_name}')
+                frame = frame.f_back
+
+            if len(frames) > 0:
+                self._stackSamples[';'.join(reversed(frames))] += 1
+
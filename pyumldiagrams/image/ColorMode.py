@@ -0,0 +1,22 @@
+
+from enum import Enum
+
+
+class ColorMode(Enum):
+    """
+    Used to specify the Pillow mode of the canvas we draw the UML image on.  The diagrams only use the
+    background color and black;  So the single byte per pixel modes lose very little.
+    """
+
+    RGB       = 'RGB'
+    """
+    Three bytes per pixel;  Anti-aliased text
+    """
+    PALETTE   = 'P'
+    """
+    One byte per pixel;  Only the colors actually drawn are in the palette;  Text is not anti-aliased
+    """
+    GRAYSCALE = 'L'
+    """
+    One byte per pixel;  The background color is drawn as its gray level;  Anti-aliased text
+    """
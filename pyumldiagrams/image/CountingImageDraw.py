@@ -0,0 +1,64 @@
+
+from typing import Any
+
+from logging import Logger
+from logging import getLogger
+
+from PIL.ImageDraw import ImageDraw
+
+from pyumldiagrams.DiagramInstrumentation import InstrumentationCounters
+
+
+class CountingImageDraw:
+    """
+    Stands in for the Pillow drawing object of an instrumented `ImageDiagram`.  Counts the drawing operations
+    that the diagram uses and hands them to the wrapped drawing object.  Anything else goes straight through
+    """
+    def __init__(self, imageDraw: ImageDraw, counters: InstrumentationCounters):
+        """
+
+        Args:
+            imageDraw:  The drawing object to wrap
+            counters:   Incremented for every drawing operation;  Several drawing objects may share them
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._imageDraw: ImageDraw              = imageDraw
+        self._counters:  InstrumentationCounters = counters
+
+    @property
+    def imageDraw(self) -> ImageDraw:
+        """
+        The wrapped drawing object
+        """
+        return self._imageDraw
+
+    def line(self, xy, fill=None, width=0, joint=None):
+        self._counters.primitives += 1
+        self._imageDraw.line(xy=xy, fill=fill, width=width, joint=joint)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self._count(fill=fill)
+        self._imageDraw.rectangle(xy=xy, fill=fill, outline=outline, width=width)
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self._count(fill=fill)
+        self._imageDraw.ellipse(xy=xy, fill=fill, outline=outline, width=width)
+
+    def polygon(self, xy, fill=None, outline=None):
+        self._count(fill=fill)
+        self._imageDraw.polygon(xy=xy, fill=fill, outline=outline)
+
+    def text(self, xy, text, *args, **kwargs):
+        self._counters.primitives += 1
+        self._counters.textRuns   += 1
+        self._imageDraw.text(xy, text, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._imageDraw, name)
+
+    def _count(self, fill: Any):
+
+        self._counters.primitives += 1
+        if fill is not None:
+            self._counters.polygonFills += 1
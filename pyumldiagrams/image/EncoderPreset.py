@@ -0,0 +1,21 @@
+
+from enum import Enum
+
+
+class EncoderPreset(Enum):
+    """
+    Used to pick a canned set of encoder options for the UML image.
+    """
+
+    DEFAULT = 'Default'
+    """
+    Use the Pillow defaults for the image format
+    """
+    FAST    = 'Fast'
+    """
+    Favor encode time over file size
+    """
+    SMALL   = 'Small'
+    """
+    Favor file size over encode time
+    """
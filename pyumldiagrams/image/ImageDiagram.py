@@ -1,8 +1,20 @@
 
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
 from typing import final
 from typing import Union
 
+from math import ceil
+from math import floor
+
+from io import BytesIO
+
+from dataclasses import replace
+
+from datetime import datetime
+
 from logging import Logger
 from logging import getLogger
 
@@ -11,12 +23,16 @@ from os import sep as osSep
 from pkg_resources import resource_filename
 
 from PIL import Image
+from PIL import ImageChops
 from PIL import ImageColor
 from PIL import ImageDraw
 from PIL import ImageFont
 
 
 from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.BaseDiagram import DeferredDefinition
+from pyumldiagrams.DiagramInstrumentation import InstrumentationCounters
+from pyumldiagrams.RenderProfiler import RenderProfiler
 from pyumldiagrams.Definitions import DisplayMethodParameters
 
 from pyumldiagrams.Definitions import TOP_MARGIN
@@ -34,8 +50,13 @@ from pyumldiagrams.image.ImageCommon import ImageCommon
 from pyumldiagrams.Internal import InternalPosition
 from pyumldiagrams.Internal import SeparatorPosition
 
+from pyumldiagrams.image.ColorMode import ColorMode
+from pyumldiagrams.image.CountingImageDraw import CountingImageDraw
+from pyumldiagrams.image.ImageEncoder import ImageEncoder
 from pyumldiagrams.image.ImageFormat import ImageFormat
 from pyumldiagrams.image.ImageLine import ImageLine
+from pyumldiagrams.image.ImageSpriteCache import ClassSprite
+from pyumldiagrams.image.ImageSpriteCache import ImageSpriteCache
 
 ShapeDefinition = Union[EllipseDefinition, RectangleDefinition]
 
@@ -58,7 +79,11 @@ class ImageDiagram(BaseDiagram):
     Y_NUDGE_FACTOR:        final = 6
     FIRST_METHOD_Y_OFFSET: final = 0
 
-    def __init__(self, fileName: str, docDisplayMethodParameters: DisplayMethodParameters = DisplayMethodParameters.DISPLAY, headerText: str = '', imageSize: Size = Size(width=DEFAULT_IMAGE_WIDTH, height=DEFAULT_IMAGE_HEIGHT)):
+    SPRITE_MARGIN: final = 2     # pixels;  Room for the anti-aliased pixels left of and above a sprite
+
+    def __init__(self, fileName: str, docDisplayMethodParameters: DisplayMethodParameters = DisplayMethodParameters.DISPLAY, headerText: str = '',
+                 imageSize: Size = Size(width=DEFAULT_IMAGE_WIDTH, height=DEFAULT_IMAGE_HEIGHT), autoFit: bool = False,
+                 imageFormat: ImageFormat = ImageFormat(DEFAULT_IMAGE_FORMAT), colorMode: ColorMode = ColorMode.RGB):
         """
 
         Args:
@@ -68,19 +93,39 @@ class ImageDiagram(BaseDiagram):
 
             headerText:  The text to display as a header on the diagram
 
-            imageSize:  The diagram size in pixels
+            imageSize:  The diagram size in pixels;  Ignored when `autoFit` is True
+
+            autoFit:  If True, queue the drawing requests and allocate an image that exactly fits the diagram
+            extents when `write` is called
+
+            imageFormat:  The output image format.  Determines the file name suffix
+
+            colorMode:  The mode of the canvas we draw on.  The palette and grayscale modes use a third of
+            the memory of the RGB mode
         """
 
         super().__init__(fileName=fileName, docDisplayMethodParameters=docDisplayMethodParameters, headerText=headerText)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._img:   Image  = Image.new(mode='RGB',
-                                        size=(imageSize.width, imageSize.height),
-                                        color=ImageColor.getrgb(ImageDiagram.DEFAULT_BACKGROUND_COLOR))
+        self._autoFit:      bool      = autoFit
+        self._imageSize:    Size      = imageSize
+        self._colorMode:    ColorMode = colorMode
+        self._docTimeStamp: datetime  = cast(datetime, None)
+
+        self._img:        Image     = cast(Image, None)
+        self._imgDraw:    ImageDraw = cast(ImageDraw, None)
+        self._lineDrawer: ImageLine = cast(ImageLine, None)
+
+        self._drawCounters: InstrumentationCounters = InstrumentationCounters()
 
-        self._imgDraw:    ImageDraw = ImageDraw.Draw(self._img)
-        self._lineDrawer: ImageLine = ImageLine(docWriter=self._imgDraw, diagramPadding=self._diagramPadding)
+        self._imageEncoder: ImageEncoder               = ImageEncoder(imageFormat=imageFormat)
+        self._spriteCache:  Optional[ImageSpriteCache] = None
+        self._rendered:     bool                       = False
+        self._pixelBuffer:  Optional[memoryview]       = None
+
+        if autoFit is False:
+            self._createCanvas(imageSize=imageSize)
 
         fqPath:     str       = self.retrieveResourcePath('MonoFonto.ttf')
         self._font:       ImageFont = ImageFont.truetype(font=fqPath, size=BaseDiagram.DEFAULT_FONT_SIZE)
@@ -111,35 +156,63 @@ class ImageDiagram(BaseDiagram):
 
         return fqFileName
 
-    def drawClass(self, classDefinition: ClassDefinition):
+    @property
+    def docTimeStamp(self) -> datetime:
         """
-        Draw the class diagram defined by the input
-
-        Overrides the empty base definition
+        Overrides the empty base implementation;  The images do not carry it, but it is part of the cache key
+        """
+        return self._docTimeStamp
 
-        Args:
-            classDefinition:    The class definition
+    @docTimeStamp.setter
+    def docTimeStamp(self, timeStamp: datetime):
         """
-        self._drawClassSymbol(classDefinition=classDefinition)
+        Overrides the empty base implementation
+        """
+        self._docTimeStamp = timeStamp
 
-        position: Position = classDefinition.position
-        size:     Size     = classDefinition.size
+    @property
+    def imageEncoder(self) -> ImageEncoder:
+        """
+        The encoder that writes the image.  Replace it to change the encoder preset or options, or to plug in
+        a different encoder.  See `pyumldiagrams.image.ImageEncoder.ImageEncoder`
+        """
+        return self._imageEncoder
 
-        iPos: InternalPosition = ImageCommon.toInternal(position=position, horizontalGap=self.horizontalGap, verticalGap=self.verticalGap)
+    @imageEncoder.setter
+    def imageEncoder(self, newEncoder: ImageEncoder):
+        self._imageEncoder = newEncoder
 
-        self._drawClassName(classDefinition=classDefinition, rectX=iPos.x, rectY=iPos.y, symbolWidth=size.width)
+    @property
+    def spriteCache(self) -> Optional[ImageSpriteCache]:
+        """
+        An optional cache of rendered class appearances.  With a cache, each distinct class appearance is
+        rasterized once and pasted at every class position that uses it;  Only the class names are drawn
+        individually.  Share `ImageSpriteCache.processCache()` to reuse the sprites across diagrams.
 
-        separatorPosition: SeparatorPosition = self._drawSeparator(rectX=iPos.x, rectY=iPos.y, shapeWidth=size.width)
+        A pasted class replaces what was drawn beneath it, so the anti-aliased pixels where classes overlap
+        other shapes may differ from direct drawing.  The palette color mode ignores the cache.  Set it
+        before drawing anything
+        """
+        return self._spriteCache
 
-        fieldReprs:  BaseDiagram.FieldsRepr  = self._buildFields(classDefinition.fields)
+    @spriteCache.setter
+    def spriteCache(self, newCache: ImageSpriteCache):
+        self._spriteCache = newCache
 
-        fieldSeparatorPosition: SeparatorPosition = self._drawFields(fieldReprs=fieldReprs, separatorPosition=separatorPosition)
-        methodSeparatorPosition = self._drawSeparator(rectX=iPos.x, rectY=fieldSeparatorPosition.y, shapeWidth=size.width)
+    def drawClass(self, classDefinition: ClassDefinition):
+        """
+        Draw the class diagram defined by the input
 
-        methodReprs: BaseDiagram.MethodsRepr = self._buildMethods(classDefinition.methods, classDefinition.displayMethodParameters)
+        Overrides the empty base definition
 
-        if classDefinition.displayMethods is True:
-            self._drawMethods(methodReprs=methodReprs, separatorPosition=methodSeparatorPosition)
+        Args:
+            classDefinition:    The class definition
+        """
+        self._pixelBuffer = None
+        if self._deferDrawing is True:
+            self.__queue(definition=classDefinition)
+        else:
+            self._drawClass(classDefinition=classDefinition)
 
     def drawUmlLine(self, lineDefinition: UmlLineDefinition):
         """
@@ -151,7 +224,11 @@ class ImageDiagram(BaseDiagram):
         Args:
             lineDefinition:   A UML Line definition
         """
-        self._lineDrawer.draw(lineDefinition=lineDefinition)
+        self._pixelBuffer = None
+        if self._deferDrawing is True:
+            self.__queue(definition=lineDefinition)
+        else:
+            self._lineDrawer.draw(lineDefinition=lineDefinition)
 
     def drawEllipse(self, definition: EllipseDefinition):
         """
@@ -162,8 +239,11 @@ class ImageDiagram(BaseDiagram):
         Args:
             definition:     It's definition
         """
-        xy = self.__toInternalCoordinates(definition=definition)
-        self._imgDraw.ellipse(xy=xy, fill=None, outline=ImageDiagram.DEFAULT_LINE_COLOR, width=1)
+        self._pixelBuffer = None
+        if self._deferDrawing is True:
+            self.__queue(definition=definition)
+        else:
+            self._drawEllipse(definition=definition)
 
     def drawRectangle(self, definition: RectangleDefinition):
         """
@@ -174,9 +254,11 @@ class ImageDiagram(BaseDiagram):
         Args:
             definition:  The rectangle definition
         """
-
-        xy = self.__toInternalCoordinates(definition=definition)
-        self._imgDraw.rectangle(xy=xy, fill=None, outline=ImageDiagram.DEFAULT_LINE_COLOR, width=1)
+        self._pixelBuffer = None
+        if self._deferDrawing is True:
+            self.__queue(definition=definition)
+        else:
+            self._drawRectangle(definition=definition)
 
     def write(self):
         """
@@ -184,27 +266,310 @@ class ImageDiagram(BaseDiagram):
 
         Overrides the empty base definition
         """
+        adjustedFileName: str = self._outputFileName()
+
+        self.logger.info(f'{adjustedFileName=}')
+        if self._diagramCache is None:
+            self._imageEncoder.encode(image=self.render(), fp=adjustedFileName)
+        else:
+            self._writeCachedOutput(fileName=adjustedFileName, render=self._renderEncoded)
+
+    def render(self) -> Image:
+        """
+        Finishes the drawing without encoding it.  Use this instead of `write` when the pixels go to another
+        process step instead of a file.  It is safe to call this more than once and to call `write` afterwards.
+        Queued drawing requests made after it are drawn by the next call, on a new canvas
+
+        Returns:  The finished canvas;  Do not draw on it
+        """
+        if self._rendered is False:
+            if self._deferDrawing is True:
+                if self._autoFit is True:
+                    with self._profilerPhase(RenderProfiler.LAYOUT_PHASE):
+                        imageSize: Size = self._computeExtents()
+                    self._createCanvas(imageSize=imageSize)
+                self._drawDeferredDefinitions()
+
+            if self._headerText is not None and self._headerText != '':
+
+                xy = [LEFT_MARGIN, TOP_MARGIN / 2]
+                self._imgDraw.text(xy=xy, fill=ImageDiagram.DEFAULT_TEXT_COLOR, font=self._headerFont, text=self._headerText)
+
+            self._rendered = True
+
+        return self._img
+
+    def pixelBuffer(self) -> memoryview:
+        """
+        The finished canvas as raw pixels;  Skips the encode/decode round trip through an image file.  The
+        view is read-only and shaped (height, width) for the single band color modes and (height, width, bands)
+        for RGB.  So `numpy.asarray(diagram.pixelBuffer())` wraps it without another copy.
+
+        Pillow does not expose the canvas memory, so this is a copy of the pixels;  Later drawing does not
+        change it.  The copy is made once and returned again until the next draw request
+
+        Returns:  A read-only view of a copy of the pixel bytes
+        """
+        if self._pixelBuffer is not None:
+            return self._pixelBuffer
+
+        image: Image = self.render()
+
+        width, height = image.size
+        bandCount: int = len(image.getbands())
+
+        if bandCount == 1:
+            shape: Tuple[int, ...] = (height, width)
+        else:
+            shape: Tuple[int, ...] = (height, width, bandCount)
+
+        self._pixelBuffer = memoryview(image.tobytes()).cast('B', shape=shape)
+
+        return self._pixelBuffer
+
+    @property
+    def _deferDrawing(self) -> bool:
+        """
+        Overrides the base implementation;  Auto fit needs every definition before it can allocate the image
+        """
+        return self._autoFit is True or super()._deferDrawing
+
+    def _cacheKeySettings(self) -> List:
+        """
+        Overrides the empty base implementation
+        """
+        return [
+            self._autoFit,
+            None if self._autoFit is True else self._imageSize,
+            self._colorMode,
+            self._spriteCache is not None,
+            self._imageEncoder.__class__.__name__,
+            self._imageEncoder.imageFormat,
+            self._imageEncoder.preset,
+            self._imageEncoder.encoderOptions,
+        ]
+
+    def _renderEncoded(self) -> bytes:
+
+        buffer: BytesIO = BytesIO()
+        self._imageEncoder.encode(image=self.render(), fp=buffer)
+
+        return buffer.getvalue()
+
+    def _createCanvas(self, imageSize: Size):
+
+        mode: str = self._colorMode.value
+
+        self._img = Image.new(mode=mode, size=(int(imageSize.width), int(imageSize.height)), color=self._backgroundColor())
+
+        self._imgDraw    = self._newDraw(image=self._img)
+        self._lineDrawer = ImageLine(docWriter=self._imgDraw, diagramPadding=self._diagramPadding)
+
+    def _newDraw(self, image: Image) -> ImageDraw:
+        """
+        Instrumented diagrams count what they draw
+
+        Args:
+            image:  What to draw on
+        """
+        imageDraw: ImageDraw = ImageDraw.Draw(image)
+        if self._instrumentation is not None:
+            imageDraw = CountingImageDraw(imageDraw=imageDraw, counters=self._drawCounters)
+
+        return imageDraw
+
+    def _instrumentationChanged(self):
+        """
+        Overrides the empty base implementation.  Swaps the drawing object of a canvas that already exists
+        """
+        if self._img is not None:
+            self._imgDraw    = self._newDraw(image=self._img)
+            self._lineDrawer = ImageLine(docWriter=self._imgDraw, diagramPadding=self._diagramPadding)
+
+    def _instrumentationMark(self) -> InstrumentationCounters:
+        """
+        Overrides the empty base implementation
+        """
+        return replace(self._drawCounters)
+
+    def _instrumentationCounters(self, mark: InstrumentationCounters) -> InstrumentationCounters:
+        """
+        Overrides the empty base implementation.  Pasting a cached class sprite is not counted;  Drawing it is
+        """
+        return self._drawCounters.since(mark)
+
+    def _outputFileName(self) -> str:
+        """
+        Overrides the base implementation;  `write` adds the image format suffix
+        """
+        return self._addSuffix(fileName=self._fileName, suffix=self._imageEncoder.imageFormat.value)
+
+    def _backgroundColor(self) -> Union[int, Tuple[int, ...]]:
+        """
+        Pillow adds the background color to the palette of a 'P' image only if handed as an RGB tuple
+        """
+        if self._colorMode == ColorMode.PALETTE:
+            return ImageColor.getrgb(ImageDiagram.DEFAULT_BACKGROUND_COLOR)
+        else:
+            return ImageColor.getcolor(ImageDiagram.DEFAULT_BACKGROUND_COLOR, self._colorMode.value)
+
+    def _computeExtents(self) -> Size:
+        """
+        Computes the smallest image size that holds the queued definitions.  The right and bottom
+        edges get the same margins and gaps that `ImageCommon.toInternal` adds to the left and top edges
+
+        Returns:  The image size in pixels
+        """
+        maxX: float = 0.0
+        maxY: float = 0.0
+
+        for definition in self._deferredDefinitions:
+            if isinstance(definition, UmlLineDefinition):
+                positions: List[Position] = definition.linePositions
+            else:
+                pos:  Position = definition.position
+                size: Size     = definition.size
+                positions: List[Position] = [Position(x=pos.x + size.width, y=pos.y + size.height)]
+
+            for position in positions:
+                iPos: InternalPosition = self.__toInternal(position=position)
+                maxX = max(maxX, iPos.x)
+                maxY = max(maxY, iPos.y)
+
         if self._headerText is not None and self._headerText != '':
+            headerWidth, headerHeight = self._headerFont.getsize(self._headerText)
+            maxX = max(maxX, LEFT_MARGIN + headerWidth)
 
-            xy = [LEFT_MARGIN, TOP_MARGIN / 2]
-            self._imgDraw.text(xy=xy, fill=ImageDiagram.DEFAULT_TEXT_COLOR, font=self._headerFont, text=self._headerText)
+        width:  int = ceil(maxX) + self._diagramPadding.leftMargin + self._diagramPadding.verticalGap + 1
+        height: int = ceil(maxY) + self._diagramPadding.topMargin  + self._diagramPadding.horizontalGap + 1
 
-        adjustedFileName: str = self._addSuffix(fileName=self._fileName, suffix=ImageDiagram.DEFAULT_IMAGE_FORMAT)
+        self.logger.debug(f'Auto fit extents: {width=} {height=}')
 
-        self.logger.info(f'{adjustedFileName=}')
-        self._img.save(adjustedFileName, ImageDiagram.DEFAULT_IMAGE_FORMAT)
+        return Size(width=width, height=height)
 
-    def _drawClassSymbol(self, classDefinition: ClassDefinition):
+    def _drawDeferred(self, definition: DeferredDefinition):
+        """
+        Overrides the empty base implementation
+        """
+        if isinstance(definition, ClassDefinition):
+            self._drawClass(classDefinition=definition)
+        elif isinstance(definition, UmlLineDefinition):
+            self._lineDrawer.draw(lineDefinition=definition)
+        elif isinstance(definition, EllipseDefinition):     # Check before its RectangleDefinition parent
+            self._drawEllipse(definition=definition)
+        else:
+            self._drawRectangle(definition=definition)
 
-        imgDraw: ImageDraw = self._imgDraw
+    def _drawClass(self, classDefinition: ClassDefinition):
 
         position: Position = classDefinition.position
         size:     Size     = classDefinition.size
 
         iPos: InternalPosition = ImageCommon.toInternal(position=position, horizontalGap=self.horizontalGap, verticalGap=self.verticalGap)
 
-        x0 = iPos.x
-        y0 = iPos.y
+        fieldReprs:  BaseDiagram.FieldsRepr  = self._buildFields(classDefinition.fields)
+        methodReprs: BaseDiagram.MethodsRepr = []
+        if classDefinition.displayMethods is True:
+            methodReprs = self._buildMethods(classDefinition.methods, classDefinition.displayMethodParameters)
+
+        if self._spriteCache is None or self._colorMode == ColorMode.PALETTE:
+            self._drawClassSymbol(rectX=iPos.x, rectY=iPos.y, size=size)
+            self._drawClassName(classDefinition=classDefinition, rectX=iPos.x, rectY=iPos.y, symbolWidth=size.width)
+            self._drawClassBody(rectX=iPos.x, rectY=iPos.y, shapeWidth=size.width, fieldReprs=fieldReprs, methodReprs=methodReprs)
+        else:
+            self._pasteClassSprite(iPos=iPos, size=size, fieldReprs=fieldReprs, methodReprs=methodReprs)
+            self._drawClassName(classDefinition=classDefinition, rectX=iPos.x, rectY=iPos.y, symbolWidth=size.width)
+
+    def _drawClassBody(self, rectX: float, rectY: float, shapeWidth: float, fieldReprs: BaseDiagram.FieldsRepr, methodReprs: BaseDiagram.MethodsRepr):
+
+        separatorPosition:       SeparatorPosition = self._drawSeparator(rectX=rectX, rectY=rectY, shapeWidth=shapeWidth)
+        fieldSeparatorPosition:  SeparatorPosition = self._drawFields(fieldReprs=fieldReprs, separatorPosition=separatorPosition)
+        methodSeparatorPosition: SeparatorPosition = self._drawSeparator(rectX=rectX, rectY=fieldSeparatorPosition.y, shapeWidth=shapeWidth)
+
+        self._drawMethods(methodReprs=methodReprs, separatorPosition=methodSeparatorPosition)
+
+    def _pasteClassSprite(self, iPos: InternalPosition, size: Size, fieldReprs: BaseDiagram.FieldsRepr, methodReprs: BaseDiagram.MethodsRepr):
+        """
+        Pastes everything but the class name.  Pillow snaps coordinates to whole pixels, so the sprite is keyed
+        on the fractional part of the position and pasted at the whole pixel part
+
+        Args:
+            iPos:         The class position on the canvas
+            size:         The class size
+            fieldReprs:   The field text lines
+            methodReprs:  The method text lines;  Empty if the class does not display them
+        """
+        wholeX: int = floor(iPos.x)
+        wholeY: int = floor(iPos.y)
+
+        fractionX: float = iPos.x - wholeX
+        fractionY: float = iPos.y - wholeY
+
+        key: Tuple = (self._colorMode, self._fontSize, size.width, size.height, fractionX, fractionY, tuple(fieldReprs), tuple(methodReprs))
+
+        sprite: Optional[ClassSprite] = self._spriteCache.retrieve(key)
+        if sprite is None:
+            sprite = self._renderClassSprite(fractionX=fractionX, fractionY=fractionY, size=size, fieldReprs=fieldReprs, methodReprs=methodReprs)
+            self._spriteCache.store(key, sprite)
+
+        self._img.paste(sprite.image, box=(wholeX + sprite.offsetX, wholeY + sprite.offsetY), mask=sprite.mask)
+
+    def _renderClassSprite(self, fractionX: float, fractionY: float, size: Size,
+                           fieldReprs: BaseDiagram.FieldsRepr, methodReprs: BaseDiagram.MethodsRepr) -> ClassSprite:
+        """
+        Draws the class onto a private canvas with the regular drawing methods.  Long text may overflow the
+        class symbol, so the canvas is generous;  The sprite is then cropped to the pixels that were drawn
+        """
+        margin:    int = ImageDiagram.SPRITE_MARGIN
+        lineCount: int = len(fieldReprs) + len(methodReprs) + 3
+        textWidth: int = max([self._font.getsize(textRepr)[0] for textRepr in fieldReprs + methodReprs], default=0)
+
+        spriteWidth:  int = ceil(max(size.width, textWidth + ImageDiagram.X_NUDGE_FACTOR)) + (2 * margin) + 1
+        spriteHeight: int = ceil(size.height) + (lineCount * (self._fontSize + ImageDiagram.Y_NUDGE_FACTOR)) + (2 * margin)
+
+        backgroundColor = self._backgroundColor()
+        spriteImage:  Image = Image.new(mode=self._colorMode.value, size=(spriteWidth, spriteHeight), color=backgroundColor)
+
+        canvasDraw: ImageDraw = self._imgDraw
+        self._imgDraw = self._newDraw(image=spriteImage)
+        try:
+            rectX: float = margin + fractionX
+            rectY: float = margin + fractionY
+            self._drawClassSymbol(rectX=rectX, rectY=rectY, size=size)
+            self._drawClassBody(rectX=rectX, rectY=rectY, shapeWidth=size.width, fieldReprs=fieldReprs, methodReprs=methodReprs)
+        finally:
+            self._imgDraw = canvasDraw
+        #
+        # The mask selects every pixel that differs from the background in any band
+        #
+        background: Image = Image.new(mode=spriteImage.mode, size=spriteImage.size, color=backgroundColor)
+        bands:      Tuple = ImageChops.difference(spriteImage, background).split()
+
+        mask: Image = bands[0]
+        for band in bands[1:]:
+            mask = ImageChops.lighter(mask, band)
+        mask = mask.point(lambda value: 255 if value > 0 else 0)
+
+        bbox: Tuple[int, int, int, int] = mask.getbbox()
+
+        return ClassSprite(image=spriteImage.crop(bbox), mask=mask.crop(bbox), offsetX=bbox[0] - margin, offsetY=bbox[1] - margin)
+
+    def _drawEllipse(self, definition: EllipseDefinition):
+
+        xy = self.__toInternalCoordinates(definition=definition)
+        self._imgDraw.ellipse(xy=xy, fill=None, outline=ImageDiagram.DEFAULT_LINE_COLOR, width=1)
+
+    def _drawRectangle(self, definition: RectangleDefinition):
+
+        xy = self.__toInternalCoordinates(definition=definition)
+        self._imgDraw.rectangle(xy=xy, fill=None, outline=ImageDiagram.DEFAULT_LINE_COLOR, width=1)
+
+    def _drawClassSymbol(self, rectX: float, rectY: float, size: Size):
+
+        imgDraw: ImageDraw = self._imgDraw
+
+        x0 = rectX
+        y0 = rectY
         x1 = x0 + size.width
         y1 = y0 + size.height
         xy = [x0, y0, x1, y1]
@@ -311,3 +676,18 @@ class ImageDiagram(BaseDiagram):
         return iPos
 
 
+
+    def __queue(self, definition: DeferredDefinition):
+        """
+        A request after `render` starts the drawing over;  The canvas already holds the earlier queued
+        definitions and the header, so they are all drawn again on a new one
+
+        Args:
+            definition:  The definition to draw on the next `render`
+        """
+        if self._rendered is True:
+            self._rendered = False
+            if self._autoFit is False:
+                self._createCanvas(imageSize=self._imageSize)
+
+        self._deferredDefinitions.append(definition)
@@ -0,0 +1,140 @@
+
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Union
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from PIL import Image
+
+from pyumldiagrams.image.EncoderPreset import EncoderPreset
+from pyumldiagrams.image.ImageFormat import ImageFormat
+
+EncoderOptions = Dict[str, Any]
+"""
+Syntactic sugar for the keyword arguments handed to the Pillow image writer
+"""
+PresetOptions = Dict[ImageFormat, EncoderOptions]
+
+
+class ImageEncoder:
+    """
+    Writes the rendered UML image in the requested format.  The encoder options are the preset
+    options for the image format, updated with any caller supplied options.
+
+    Subclass and override `encode` to plug in a different encoder;  Then hand an instance to
+    `pyumldiagrams.image.ImageDiagram.ImageDiagram.imageEncoder`
+    """
+    PRESET_OPTIONS: final = {
+        EncoderPreset.DEFAULT: {},
+        EncoderPreset.FAST: {
+            ImageFormat.PNG:  {'compress_level': 1},
+            ImageFormat.JPG:  {'quality': 75},
+            ImageFormat.GIF:  {'optimize': False},
+            ImageFormat.WEBP: {'lossless': True, 'quality': 0, 'method': 0},
+            ImageFormat.TIFF: {'compression': 'raw'},
+        },
+        EncoderPreset.SMALL: {
+            ImageFormat.PNG:  {'optimize': True},
+            ImageFormat.JPG:  {'quality': 60, 'optimize': True},
+            ImageFormat.GIF:  {'optimize': True},
+            ImageFormat.WEBP: {'lossless': True, 'quality': 100, 'method': 6},
+            ImageFormat.TIFF: {'compression': 'tiff_adobe_deflate'},
+        },
+    }
+    """
+    The diagrams are flat color line art;  So the lossless formats do well
+    """
+
+    PALETTE_FORMATS: final = [ImageFormat.PNG, ImageFormat.GIF, ImageFormat.BMP, ImageFormat.TIFF]
+    """
+    The formats the `EncoderPreset.SMALL` preset quantizes to a 256 color palette before encoding
+    """
+    JPEG_MODES: final = ['RGB', 'L']
+    """
+    The canvas modes the JPEG writer accepts;  Anything else is converted to RGB
+    """
+
+    def __init__(self, imageFormat: ImageFormat = ImageFormat.PNG, preset: EncoderPreset = EncoderPreset.DEFAULT, options: EncoderOptions = None):
+        """
+
+        Args:
+            imageFormat:  The output image format
+
+            preset:   The canned options to use
+
+            options:  Pillow writer options that override the preset ones
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._imageFormat: ImageFormat    = imageFormat
+        self._preset:      EncoderPreset  = preset
+        self._options:     EncoderOptions = {} if options is None else options
+
+    @property
+    def imageFormat(self) -> ImageFormat:
+        """
+        The output image format
+        """
+        return self._imageFormat
+
+    @property
+    def preset(self) -> EncoderPreset:
+        """
+        The canned options to start with.  See `pyumldiagrams.image.EncoderPreset.EncoderPreset`
+        """
+        return self._preset
+
+    @preset.setter
+    def preset(self, newValue: EncoderPreset):
+        self._preset = newValue
+
+    @property
+    def encoderOptions(self) -> EncoderOptions:
+        """
+        The options handed to the Pillow image writer;  The preset options updated with the caller supplied ones
+        """
+        presetOptions:  PresetOptions  = ImageEncoder.PRESET_OPTIONS[self._preset]
+        encoderOptions: EncoderOptions = dict(presetOptions.get(self._imageFormat, {}))
+
+        encoderOptions.update(self._options)
+
+        return encoderOptions
+
+    @encoderOptions.setter
+    def encoderOptions(self, newValue: EncoderOptions):
+        self._options = newValue
+
+    def encode(self, image: Image, fp: Union[str, BinaryIO]):
+        """
+        Write the image
+
+        Args:
+            image:  The rendered image
+
+            fp:     A file name or a binary file object
+        """
+        encoderOptions: EncoderOptions = self.encoderOptions
+        preparedImage:  Image          = self._prepareImage(image=image)
+
+        self.logger.debug(f'{self._imageFormat=} {encoderOptions=}')
+        preparedImage.save(fp, format=self._imageFormat.value, **encoderOptions)
+
+    def _prepareImage(self, image: Image) -> Image:
+        """
+        Converts the image to the mode best suited to the format and preset
+
+        Args:
+            image:  The rendered image
+
+        Returns:  The image to encode;  May be the input image
+        """
+        if self._preset == EncoderPreset.SMALL and self._imageFormat in ImageEncoder.PALETTE_FORMATS and image.mode == 'RGB':
+            return image.quantize(colors=256)
+        if self._imageFormat == ImageFormat.JPG and image.mode not in ImageEncoder.JPEG_MODES:
+            return image.convert('RGB')
+
+        return image
@@ -7,9 +7,9 @@ class ImageFormat(Enum):
     Used to specify the output format for the UML image.
     """
 
-    PNG = 'png'
-    JPG = 'jpeg'
-    BMP = 'bmp'
-    GIF = 'gif'
-
-
+    PNG  = 'png'
+    JPG  = 'jpeg'
+    BMP  = 'bmp'
+    GIF  = 'gif'
+    WEBP = 'webp'
+    TIFF = 'tiff'
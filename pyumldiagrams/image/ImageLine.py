@@ -96,7 +96,7 @@ class ImageLine(IDiagramLine):
         points:  DiamondPoints           = ImageCommon.computeDiamondVertices(internalSrc, internalDest)
         polygon: ImageLine.PolygonPoints = self.__toPolygonPoints(points)
 
-        self._imgDraw.polygon(xy=polygon, outline=ImageLine.DEFAULT_LINE_COLOR)
+        self._imgDraw.polygon(xy=polygon, outline=ImageLine.DEFAULT_LINE_COLOR, fill='black')
 
         newEndPoint: InternalPosition = points[3]
         xy:          ImageLine.PILPoints = self.__toPILPoints(linePositions=linePositions, newEndPoint=newEndPoint)
@@ -113,7 +113,7 @@ class ImageLine(IDiagramLine):
         points:  DiamondPoints           = ImageCommon.computeDiamondVertices(internalSrc, internalDest)
         polygon: ImageLine.PolygonPoints = self.__toPolygonPoints(points)
 
-        self._imgDraw.polygon(xy=polygon, outline=ImageLine.DEFAULT_LINE_COLOR, fill='black')
+        self._imgDraw.polygon(xy=polygon, outline=ImageLine.DEFAULT_LINE_COLOR)
 
         newEndPoint: InternalPosition = points[3]
         xy:          ImageLine.PILPoints = self.__toPILPoints(linePositions=linePositions, newEndPoint=newEndPoint)
@@ -0,0 +1,151 @@
+
+from typing import Hashable
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from dataclasses import dataclass
+
+from threading import Lock
+
+from PIL import Image
+
+from pyumldiagrams.Defaults import DEFAULT_SPRITE_CACHE_MAXIMUM_SIZE
+
+
+@dataclass
+class ClassSprite:
+    """
+    A pre-rendered class appearance.  The offsets place the sprite relative to the whole pixel
+    position of the class;  The mask selects the pixels that the class actually drew
+    """
+    image:   Image = None
+    mask:    Image = None
+    offsetX: int   = 0
+    offsetY: int   = 0
+
+    @property
+    def byteCount(self) -> int:
+        width, height = self.image.size
+        return width * height * (len(self.image.getbands()) + 1)
+
+
+class ImageSpriteCache:
+    """
+    A bounded, in memory cache of rendered class appearances.  Diagrams with many identical looking classes
+    rasterize the appearance once and paste it at each class position.  When the sprites exceed the maximum size
+    the least recently used ones are evicted.
+
+    A cache may be shared by the diagrams of a process;  See `processCache`
+    """
+    _processCache: 'ImageSpriteCache' = None
+
+    def __init__(self, maximumSize: int = DEFAULT_SPRITE_CACHE_MAXIMUM_SIZE):
+        """
+
+        Args:
+            maximumSize:  The maximum number of pixel bytes to keep.  See `pyumldiagrams.Defaults.DEFAULT_SPRITE_CACHE_MAXIMUM_SIZE`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maximumSize: int = maximumSize
+        self._size:        int = 0
+        self._hits:        int = 0
+        self._misses:      int = 0
+
+        self._sprites: OrderedDict = OrderedDict()
+        self._lock:    Lock        = Lock()
+
+    @classmethod
+    def processCache(cls) -> 'ImageSpriteCache':
+        """
+        Returns:  The cache shared by all the diagrams in this process
+        """
+        if cls._processCache is None:
+            cls._processCache = ImageSpriteCache()
+        return cls._processCache
+
+    @property
+    def maximumSize(self) -> int:
+        """
+        The maximum number of pixel bytes to keep
+        """
+        return self._maximumSize
+
+    @maximumSize.setter
+    def maximumSize(self, newValue: int):
+        with self._lock:
+            self._maximumSize = newValue
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of pixel bytes currently cached
+        """
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def retrieve(self, key: Hashable) -> Optional[ClassSprite]:
+        """
+        Args:
+            key:  Describes the class appearance
+
+        Returns:  The sprite or None if it is not cached
+        """
+        with self._lock:
+            sprite: Optional[ClassSprite] = self._sprites.get(key)
+            if sprite is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._sprites.move_to_end(key)     # Most recently used now
+
+        return sprite
+
+    def store(self, key: Hashable, sprite: ClassSprite):
+        """
+        Cache the sprite;  Then evict the least recently used sprites if we are over the maximum size
+
+        Args:
+            key:     Describes the class appearance
+            sprite:  The rendered appearance
+        """
+        with self._lock:
+            previous: Optional[ClassSprite] = self._sprites.pop(key, None)
+            if previous is not None:
+                self._size -= previous.byteCount
+
+            self._sprites[key] = sprite
+            self._size += sprite.byteCount
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all the sprites and reset the statistics
+        """
+        with self._lock:
+            self._sprites.clear()
+            self._size   = 0
+            self._hits   = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def _evict(self):
+
+        while self._size > self._maximumSize and len(self._sprites) > 0:
+            key, sprite = self._sprites.popitem(last=False)
+            self.logger.debug(f'Evicting sprite: {key}')
+            self._size -= sprite.byteCount
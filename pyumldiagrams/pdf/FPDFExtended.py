@@ -1,17 +1,68 @@
 
+from typing import BinaryIO
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import final
 
 from logging import Logger
 from logging import getLogger
 
+from math import sqrt
+
+from datetime import datetime
+
+from re import MULTILINE
+from re import Match
+from re import compile as regExCompile
+
+from zlib import compress
+
 from fpdf import FPDF
+from fpdf.errors import FPDFException
+from fpdf.fpdf import DocumentState
+from fpdf.fpdf import check_page
+from fpdf.util import escape_parens
+
+from pyumldiagrams.Defaults import DEFAULT_PDF_COMPRESSION_LEVEL
+from pyumldiagrams.Defaults import DEFAULT_PDF_COORDINATE_PRECISION
+
+from pyumldiagrams.pdf.FormXObject import FormXObject
+from pyumldiagrams.pdf.PdfFragment import PdfFragment
+from pyumldiagrams.pdf.PdfPreviousOutput import PdfPreviousOutput
+from pyumldiagrams.pdf.PdfSegment import PdfSegment
+from pyumldiagrams.pdf.StreamingBuffer import StreamingBuffer
+
+FormBounds = Tuple[float, float, float, float]
+"""
+Syntactic sugar for the left, top, right, and bottom of a form in document units
+"""
 
 
 class FPDFExtended(FPDF):
+    """
+    Adds forms, multi-line text objects, a configurable coordinate precision, streamed output, and incremental
+    updates.  The drawing methods that we use are overridden so that every coordinate is written with the same
+    number of decimals
 
+    The output overrides (`_putheader`, `_putpages`, `_endpage`, `streamTo`, `appendUpdate`) work on the fpdf2
+    2.3.5 internals:  `buffer`, `offsets`, `n`, `_newobj`, `DocumentState` and `check_page`.  setup.py pins that
+    version;  Check these overrides before moving the pin
+    """
     DEFAULT_PAGE_WIDTH:  final = 3000     # points
     DEFAULT_PAGE_HEIGHT: final = 1500     # points
 
+    STYLE_TO_OPERATOR: final = {'F': 'f', 'FD': 'B', 'DF': 'B'}
+
+    FPDF_COMPRESSION_LEVEL: final = 6      # What zlib compresses at by default
+
+    PROLOGUE_SEGMENT: final = 'prologue'     # What the page draws before the first segment
+    EPILOGUE_SEGMENT: final = 'epilogue'     # What the page draws after the last segment
+
+    FORM_PLACEMENT_PATTERN: final = regExCompile(rb'^(q 1 0 0 1 \S+ \S+ cm /)(FX\d+)( Do Q)$', MULTILINE)
+
     def __init__(self, headerText: str = ''):
 
         super().__init__(orientation='L', unit='pt', format=(FPDFExtended.DEFAULT_PAGE_HEIGHT, FPDFExtended.DEFAULT_PAGE_WIDTH))
@@ -20,6 +71,143 @@ class FPDFExtended(FPDF):
 
         self._headerText: str = headerText
 
+        self._formXObjects:  Dict[Hashable, FormXObject] = {}
+        self._pageContent:   bytearray                   = bytearray()
+        self._precision:     int                         = DEFAULT_PDF_COORDINATE_PRECISION
+        self._compression:   int                         = DEFAULT_PDF_COMPRESSION_LEVEL
+        self._streaming:     bool                        = False
+        self._pageObjects:   List[int]                   = []
+
+        self._segmentSettings: Optional[str] = None
+        self._segmentPage:     int           = 0
+        self._segmentStarts:   List[int]     = []
+        self._segmentKeys:     List[str]     = []
+
+    @property
+    def precision(self) -> int:
+        """
+        The number of decimals in the drawing coordinates
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, newValue: int):
+        self._precision = newValue
+
+    @property
+    def compressionLevel(self) -> int:
+        """
+        The deflate level of the streams;  0 writes them uncompressed
+        """
+        return self._compression
+
+    @compressionLevel.setter
+    def compressionLevel(self, newValue: int):
+        self._compression = newValue
+        self.set_compression(newValue > 0)
+
+    @property
+    def streaming(self) -> bool:
+        """
+        True if the document is written to an output stream as its pages complete
+        """
+        return self._streaming
+
+    def streamTo(self, outputStream: BinaryIO):
+        """
+        Write the document to the output stream instead of accumulating it in memory.  Each page is compressed and
+        written when it completes and its content is released;  The shared resources, the cross-reference
+        table, and the trailer are written by `output()`.  Then memory is bounded by the page being drawn.
+
+        Call it before any page completes.  Page links and the total page number alias are not supported
+        when streaming, because they need pages that are not yet drawn
+
+        Args:
+            outputStream:  A binary file like object;  The caller closes it after `output()`
+        """
+        if len(self.buffer) > 0 or self.page > 1:
+            raise FPDFException('Streaming must start before any page completes')
+
+        self.buffer     = StreamingBuffer(outputStream=outputStream)
+        self._streaming = True
+
+    def startSegments(self, settingsKey: str):
+        """
+        Write the current page as several content streams, so that an incremental update can replace some of
+        them;  See `beginSegment` and `appendUpdate`.  The page lists the segments in its piece dictionary.
+        What is drawn before the first segment and after the last one are segments too
+
+        Args:
+            settingsKey:  Describes the settings that the page is drawn with;  An update must use the same ones
+        """
+        self._segmentSettings = settingsKey
+        self._segmentPage     = self.page
+        self._segmentStarts   = [0]
+        self._segmentKeys     = [FPDFExtended.PROLOGUE_SEGMENT]
+
+    def beginSegment(self, key: str):
+        """
+        Subsequent drawing goes into a new segment
+
+        Args:
+            key:  Identifies what the segment draws
+        """
+        self._segmentStarts.append(self.contentLength)
+        self._segmentKeys.append(key)
+
+    def appendUpdate(self, outputStream: BinaryIO, previous: PdfPreviousOutput, segments: List[PdfSegment]):
+        """
+        Append an incremental update to a document that was written with segments.  The segments with content
+        become new content streams;  Then the page is rewritten to list `segments`, followed by a cross-reference
+        section for the new objects and a trailer that chains to the previous one.  The document cannot be used
+        afterwards
+
+        Args:
+            outputStream:  Positioned at the end of the previous document
+            previous:      Describes the previous document
+            segments:      The page's segments in drawing order;  The ones without content are already in the document
+        """
+        page: Dict = self.pages[self.page]
+
+        super()._endpage()      # _out writes to the buffer from now on
+
+        self.buffer  = StreamingBuffer(outputStream=outputStream, byteCount=previous.fileSize)
+        self.offsets = {}
+        self.n       = previous.size - 1
+
+        for segment in segments:
+            if segment.objectNumber == 0:
+                segment.objectNumber = self._newobj()
+                self._putStream(content=segment.content)
+
+        self.offsets[PdfPreviousOutput.PAGE_OBJECT] = len(self.buffer)
+        self._out(f'{PdfPreviousOutput.PAGE_OBJECT} 0 obj')
+        self._putPageDictionary(page=page, segments=segments, settingsKey=previous.settingsKey)
+
+        xrefOffset: int = len(self.buffer)
+        self._out('xref')
+        objectNumbers: List[int] = sorted(self.offsets)
+        runStart:      int       = 0
+        for index, objectNumber in enumerate(objectNumbers):
+            if index + 1 == len(objectNumbers) or objectNumbers[index + 1] != objectNumber + 1:
+                self._out(f'{objectNumbers[runStart]} {index + 1 - runStart}')
+                for runObjectNumber in objectNumbers[runStart:index + 1]:
+                    self._out(f'{self.offsets[runObjectNumber]:010} 00000 n ')
+                runStart = index + 1
+
+        self._out('trailer')
+        self._out('<<')
+        self._out(f'/Size {max(previous.size, self.n + 1)}')
+        self._out(f'/Root {previous.root} 0 R')
+        self._out(f'/Info {previous.info} 0 R')
+        self._out(f'/Prev {previous.startXref}')
+        self._out('>>')
+        self._out('startxref')
+        self._out(xrefOffset)
+        self._out('%%EOF')
+
+        self.state = DocumentState.CLOSED
+
     def header(self):
 
         self.set_font('Arial', 'B', 15)
@@ -33,8 +221,410 @@ class FPDFExtended(FPDF):
 
     def footer(self):
 
+        if self._segmentSettings is not None and self.page == self._segmentPage:
+            self.beginSegment(FPDFExtended.EPILOGUE_SEGMENT)
+
         self.set_y(-15)
 
         self.set_font('Arial', 'I', 15)
         # Print Left Aligned page number
         self.cell(0, 10, 'Page %s' % self.page_no(), 0, 0, 'L')
+
+    @check_page
+    def line(self, x1, y1, x2, y2):
+        """
+        Overrides the base implementation to honor the precision
+        """
+        self._out(f'{self._pdfX(x1)} {self._pdfY(y1)} m {self._pdfX(x2)} {self._pdfY(y2)} l S')
+
+    @check_page
+    def polyline(self, point_list, fill=False, polygon=False):
+        """
+        Overrides the base implementation to honor the precision.  Writes the path on a single line
+        """
+        operators: List[str] = []
+        operator:  str       = 'm'
+        for point in point_list:
+            operators.append(f'{self._pdfPoint(point[0], point[1])} {operator}')
+            operator = 'l'
+        if polygon is True:
+            operators.append('h')
+        if fill is True:
+            operators.append('B')
+        else:
+            operators.append('S')
+
+        self._out(' '.join(operators))
+
+    @check_page
+    def rect(self, x, y, w, h, style=None):
+        """
+        Overrides the base implementation to honor the precision
+        """
+        operator: str = FPDFExtended.STYLE_TO_OPERATOR.get(style, 'S')
+
+        self._out(f'{self._pdfX(x)} {self._pdfY(y)} {self._pdfNumber(w * self.k)} {self._pdfNumber(-h * self.k)} re {operator}')
+
+    @check_page
+    def ellipse(self, x, y, w, h, style=None):
+        """
+        Overrides the base implementation to honor the precision.  Four Bézier curves, like the base implementation
+        """
+        operator: str = FPDFExtended.STYLE_TO_OPERATOR.get(style, 'S')
+
+        cx: float = x + w / 2
+        cy: float = y + h / 2
+        rx: float = w / 2
+        ry: float = h / 2
+
+        lx: float = 4 / 3 * (sqrt(2) - 1) * rx
+        ly: float = 4 / 3 * (sqrt(2) - 1) * ry
+
+        self._out(f'{self._pdfPoint(cx + rx, cy)} m {self._pdfPoint(cx + rx, cy - ly)} {self._pdfPoint(cx + lx, cy - ry)} {self._pdfPoint(cx, cy - ry)} c')
+        self._out(f'{self._pdfPoint(cx - lx, cy - ry)} {self._pdfPoint(cx - rx, cy - ly)} {self._pdfPoint(cx - rx, cy)} c')
+        self._out(f'{self._pdfPoint(cx - rx, cy + ly)} {self._pdfPoint(cx - lx, cy + ry)} {self._pdfPoint(cx, cy + ry)} c')
+        self._out(f'{self._pdfPoint(cx + lx, cy + ry)} {self._pdfPoint(cx + rx, cy + ly)} {self._pdfPoint(cx + rx, cy)} c {operator}')
+
+    @check_page
+    def text(self, x, y, txt=''):
+        """
+        Overrides the base implementation to honor the precision
+        """
+        if not self.font_family:
+            raise FPDFException('No font set, you need to call set_font() beforehand')
+
+        textObject: str = f'BT {self._pdfX(x)} {self._pdfY(y)} Td ({self._encodeText(txt)}) Tj ET'
+        if self.underline and txt != '':
+            textObject = f'{textObject} {self._dounderline(x, y, txt)}'
+        if self.fill_color != self.text_color:
+            textObject = f'q {self.text_color} {textObject} Q'
+
+        self._out(textObject)
+
+    def textLines(self, x: float, y: float, lines: List[str], leading: float):
+        """
+        Output several lines of text as a single text object.  Each line starts `leading` below the previous one
+
+        Args:
+            x:        Abscissa of the first line
+            y:        Ordinate of the first line's baseline
+            lines:    The text lines
+            leading:  The distance between the baselines
+        """
+        if len(lines) == 0:
+            return
+        if not self.font_family:
+            raise FPDFException('No font set, you need to call set_font() beforehand')
+
+        operators: List[str] = [f'BT {self._pdfX(x)} {self._pdfY(y)} Td']
+        for lineNumber, line in enumerate(lines):
+            if lineNumber > 0:
+                operators.append(f'0 {self._pdfNumber(-leading * self.k)} Td')
+            operators.append(f'({self._encodeText(line)}) Tj')
+        operators.append('ET')
+
+        textObject: str = ' '.join(operators)
+        if self.fill_color != self.text_color:
+            textObject = f'q {self.text_color} {textObject} Q'
+
+        self._out(textObject)
+
+    def hasForm(self, key: Hashable) -> bool:
+        """
+        Args:
+            key:  Describes the drawing
+
+        Returns:  True if the drawing is already defined as a form
+        """
+        return key in self._formXObjects
+
+    def beginForm(self):
+        """
+        Subsequent drawing goes into a new form instead of onto the page.  Draw it as if the form's
+        origin were the top left corner of the page
+        """
+        self._pageContent = self.pages[self.page]['content']
+        self.pages[self.page]['content'] = bytearray()
+
+    def endForm(self, key: Hashable, bounds: FormBounds):
+        """
+        Stop capturing the form's drawing and resume drawing onto the page
+
+        Args:
+            key:     Describes the drawing;  Use it to place the form
+            bounds:  The form's extents relative to its origin;  The form clips to them
+        """
+        content: bytes = bytes(self.pages[self.page]['content'])
+        self.pages[self.page]['content'] = self._pageContent
+        self._pageContent = bytearray()
+
+        left, top, right, bottom = bounds
+        bbox: str = f'{self._pdfX(left)} {self._pdfY(bottom)} {self._pdfX(right)} {self._pdfY(top)}'
+
+        formName: str = f'FX{len(self._formXObjects) + 1}'
+        self._formXObjects[key] = FormXObject(name=formName, content=content, bbox=bbox)
+
+    def formContent(self, name: str) -> bytes:
+        """
+        Args:
+            name:  The resource name that the page content places
+
+        Returns:  The form's drawing operators;  Empty if the document has no such form
+        """
+        for formXObject in self._formXObjects.values():
+            if formXObject.name == name:
+                return formXObject.content
+
+        return b''
+
+    def placeForm(self, key: Hashable, x: float, y: float):
+        """
+        Draw a previously defined form
+
+        Args:
+            key:  Describes the drawing
+            x:    Where the form's origin goes
+            y:    Where the form's origin goes
+        """
+        formXObject: FormXObject = self._formXObjects[key]
+
+        self._out(f'q 1 0 0 1 {self._pdfNumber(x * self.k)} {self._pdfNumber(-y * self.k)} cm /{formXObject.name} Do Q')
+
+    @property
+    def contentLength(self) -> int:
+        """
+        The number of content bytes drawn on the current page;  Marks where a fragment starts
+        """
+        return len(self.pages[self.page]['content'])
+
+    def fragment(self, start: int) -> PdfFragment:
+        """
+        Args:
+            start:  The content length before the fragment was drawn
+
+        Returns:  What was drawn on the current page since `start` and the forms it places
+        """
+        return PdfFragment(content=self.contentSince(start), formXObjects=dict(self._formXObjects))
+
+    def contentSince(self, start: int) -> bytes:
+        """
+        Args:
+            start:  A previous content length
+
+        Returns:  What was drawn on the current page since then
+        """
+        return bytes(self.pages[self.page]['content'][start:])
+
+    def appendFragment(self, fragment: PdfFragment):
+        """
+        Append content drawn apart onto the current page.  The fragment's forms that this document already
+        defines are shared;  The others are added.  The placements are renamed to match
+
+        Args:
+            fragment:  Drawn with the same settings as this document
+        """
+        formNames: Dict[bytes, bytes] = {}
+        for key, formXObject in fragment.formXObjects.items():
+            if key not in self._formXObjects:
+                formName: str = f'FX{len(self._formXObjects) + 1}'
+                self._formXObjects[key] = FormXObject(name=formName, content=formXObject.content, bbox=formXObject.bbox)
+            formNames[formXObject.name.encode()] = self._formXObjects[key].name.encode()
+
+        def rename(match: Match) -> bytes:
+            return match.group(1) + formNames[match.group(2)] + match.group(3)
+
+        self.pages[self.page]['content'] += FPDFExtended.FORM_PLACEMENT_PATTERN.sub(rename, fragment.content)
+
+    def _pdfPoint(self, x: float, y: float) -> str:
+        return f'{self._pdfX(x)} {self._pdfY(y)}'
+
+    def _pdfX(self, x: float) -> str:
+        return self._pdfNumber(x * self.k)
+
+    def _pdfY(self, y: float) -> str:
+        """
+        The document's origin is at the bottom left
+        """
+        return self._pdfNumber((self.h - y) * self.k)
+
+    def _pdfNumber(self, value: float) -> str:
+        return f'{value:.{self._precision}f}'
+
+    def _encodeText(self, txt: str) -> str:
+        """
+        Encodes the text the same way `text` does
+        """
+        txt = self.normalize_text(txt)
+        if self.unifontsubset:
+            for char in txt:
+                self.current_font['subset'].append(ord(char))
+            return escape_parens(txt).encode('UTF-16BE').decode('latin-1')
+        else:
+            return escape_parens(txt)
+
+    def _endpage(self):
+        """
+        When streaming, write the completed page right away
+        """
+        super()._endpage()
+        if self._streaming is True:
+            self._putPage(self.page)
+
+    def _putheader(self):
+        """
+        When streaming the header precedes the first page;  Do not write it again
+        """
+        if len(self.buffer) == 0:
+            super()._putheader()
+
+    def _putpages(self):
+        """
+        When streaming the pages are already written;  Only the page tree root remains.  Pages with segments
+        have several content streams.  `FPDF` only compresses at the zlib default level
+        """
+        if self._streaming is True:
+            self._putPageTreeRoot()
+        elif self._segmentSettings is not None or self._compression not in (0, FPDFExtended.FPDF_COMPRESSION_LEVEL):
+            for pageNumber in range(1, self.page + 1):
+                self._putPage(pageNumber)
+            self._putPageTreeRoot()
+        else:
+            super()._putpages()
+
+    def _putPageTreeRoot(self):
+
+        pageWidth, pageHeight = self._defaultPageSize()
+
+        self.offsets[1] = len(self.buffer)
+        self._out('1 0 obj')
+        self._out('<</Type /Pages')
+        self._out('/Kids [' + ' '.join(f'{pageObject} 0 R' for pageObject in self._pageObjects) + ']')
+        self._out(f'/Count {len(self._pageObjects)}')
+        self._out(f'/MediaBox [0 0 {pageWidth:.2f} {pageHeight:.2f}]')
+        self._out('>>')
+        self._out('endobj')
+
+    def _putPage(self, pageNumber: int):
+        """
+        Write the page and its content the way `FPDF._putpages` does;  Then release the content
+
+        Args:
+            pageNumber:  The completed page
+        """
+        if len(self.annots[pageNumber]) > 0:
+            raise FPDFException('Page links are not supported when streaming, with segments, or at a non-default compression level')
+
+        self._putheader()
+
+        page:     Dict             = self.pages[pageNumber]
+        segments: List[PdfSegment] = self._pageSegments(pageNumber)
+
+        pageObject: int = self._newobj()
+        self._pageObjects.append(pageObject)
+        for index, segment in enumerate(segments):
+            segment.objectNumber = pageObject + 1 + index
+
+        if pageNumber == self._segmentPage:
+            self._putPageDictionary(page=page, segments=segments, settingsKey=self._segmentSettings)
+        else:
+            self._putPageDictionary(page=page, segments=segments)
+
+        for segment in segments:
+            self._newobj()
+            self._putStream(content=segment.content)
+
+        page['content'] = bytearray()
+
+    def _pageSegments(self, pageNumber: int) -> List[PdfSegment]:
+        """
+        Returns:  The page's segments;  A single unnamed one if the page has no segments
+        """
+        content: bytes = bytes(self.pages[pageNumber]['content'])
+
+        if self._segmentSettings is None or pageNumber != self._segmentPage:
+            return [PdfSegment(content=content)]
+
+        segmentEnds: List[int] = self._segmentStarts[1:] + [len(content)]
+
+        return [
+            PdfSegment(key=key, content=content[segmentStart:segmentEnd])
+            for key, segmentStart, segmentEnd in zip(self._segmentKeys, self._segmentStarts, segmentEnds)
+        ]
+
+    def _putPageDictionary(self, page: Dict, segments: List[PdfSegment], settingsKey: Optional[str] = None):
+        """
+        Args:
+            page:         The fpdf page
+            segments:     The page's content streams;  Already numbered
+            settingsKey:  If not None, the segments are listed in the page's piece dictionary
+        """
+        pageWidth, pageHeight = self._defaultPageSize()
+
+        self._out('<</Type /Page')
+        self._out('/Parent 1 0 R')
+        if page['w_pt'] != pageWidth or page['h_pt'] != pageHeight:
+            self._out(f'/MediaBox [0 0 {page["w_pt"]:.2f} {page["h_pt"]:.2f}]')
+        self._out('/Resources 2 0 R')
+        if self.pdf_version > '1.3':
+            self._out('/Group <</Type /Group /S /Transparency/CS /DeviceRGB>>')
+        if settingsKey is None:
+            self._out(f'/Contents {segments[0].objectNumber} 0 R>>')
+        else:
+            lastModified: datetime = getattr(self, 'creation_date', datetime.now())
+            segmentKeys:  str      = ' '.join(f'({segment.key})' for segment in segments)
+
+            self._out(f'/PieceInfo <</{PdfPreviousOutput.PIECE_INFO_NAME} <</LastModified (D:{lastModified:%Y%m%d%H%M%S}) '
+                      f'/Private <</Settings ({settingsKey}) /Segments [{segmentKeys}]>>>>>>')
+            self._out('/Contents [' + ' '.join(f'{segment.objectNumber} 0 R' for segment in segments) + ']>>')
+        self._out('endobj')
+
+    def _putStream(self, content: bytes, entries: str = ''):
+        """
+        Write the stream of the current object;  Compressed if the document is
+
+        Args:
+            content:  The stream's data
+            entries:  Additional stream dictionary entries;  Each followed by a space
+        """
+        if self.compress is True:
+            streamFilter: str   = '/Filter /FlateDecode '
+            stream:       bytes = compress(content, self._compression)
+        else:
+            streamFilter: str   = ''
+            stream:       bytes = content
+
+        self._out(f'<<{entries}{streamFilter}/Length {len(stream)}>>')
+        self._out('stream')
+        self._out(stream)
+        self._out('endstream')
+        self._out('endobj')
+
+    def _defaultPageSize(self) -> Tuple[float, float]:
+        """
+        Returns:  The width and height in points of the default page orientation
+        """
+        if self.def_orientation == 'P':
+            return self.dw_pt, self.dh_pt
+        else:
+            return self.dh_pt, self.dw_pt
+
+    def _putresources(self):
+        """
+        The forms share the page resources.  Write them before the resource dictionary so that it can
+        name them
+        """
+        for formXObject in self._formXObjects.values():
+            self._putFormXObject(formXObject)
+
+        super()._putresources()
+
+    def _putxobjectdict(self):
+
+        super()._putxobjectdict()
+        for formXObject in self._formXObjects.values():
+            self._out(f'/{formXObject.name} {formXObject.objectNumber} 0 R')
+
+    def _putFormXObject(self, formXObject: FormXObject):
+
+        formXObject.objectNumber = self._newobj()
+        self._putStream(content=formXObject.content, entries=f'/Type /XObject /Subtype /Form /BBox [{formXObject.bbox}] /Resources 2 0 R ')
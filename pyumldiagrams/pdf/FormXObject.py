@@ -0,0 +1,26 @@
+
+from dataclasses import dataclass
+
+
+@dataclass
+class FormXObject:
+    """
+    A drawing that the PDF document defines once and places many times.  The content is in
+    the document's space;  Placing the form translates it
+    """
+    name:         str   = ''
+    """
+    The resource name that the page content uses to place the form
+    """
+    content:      bytes = b''
+    """
+    The captured drawing operators
+    """
+    bbox:         str   = ''
+    """
+    The bounding box in the document's space;  Formatted for the form dictionary
+    """
+    objectNumber: int   = 0
+    """
+    Known once the form is written to the document
+    """
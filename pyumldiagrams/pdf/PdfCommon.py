@@ -3,6 +3,7 @@ from typing import Tuple
 from pyumldiagrams.Common import Common
 from pyumldiagrams.Definitions import Position
 
+from pyumldiagrams.Defaults import DEFAULT_PDF_COORDINATE_PRECISION
 from pyumldiagrams.Defaults import LEFT_MARGIN
 from pyumldiagrams.Defaults import TOP_MARGIN
 
@@ -31,13 +32,41 @@ class PdfCommon(Common):
         return points
 
     @classmethod
-    def convertPosition(cls, pos: Position, dpi: int, verticalGap: float, horizontalGap: float) -> Tuple[float, float]:
+    def convertLength(cls, pixelNumber: float, dpi: int, precision: int = DEFAULT_PDF_COORDINATE_PRECISION) -> float:
+        """
+        points = pixels * 72 / DPI;  Rounded instead of truncated
+
+        Args:
+            pixelNumber:  From the display
+            dpi:          dots per inch of source display
+            precision:    The number of decimals to keep
+
+        Returns:  A pdf point value
+        """
+        return round((pixelNumber * 72) / dpi, precision)
+
+    @classmethod
+    def convertPosition(cls, pos: Position, dpi: int, verticalGap: float, horizontalGap: float,
+                        precision: int = DEFAULT_PDF_COORDINATE_PRECISION) -> Tuple[float, float]:
 
-        x: float = PdfCommon.toPdfPoints(pos.x, dpi) + LEFT_MARGIN + verticalGap
-        y: float = PdfCommon.toPdfPoints(pos.y, dpi) + TOP_MARGIN + horizontalGap
+        x: float = round(((pos.x * 72) / dpi) + LEFT_MARGIN + verticalGap, precision)
+        y: float = round(((pos.y * 72) / dpi) + TOP_MARGIN + horizontalGap, precision)
 
         return x, y
 
+    @classmethod
+    def snapPosition(cls, pos: InternalPosition, precision: int = DEFAULT_PDF_COORDINATE_PRECISION) -> InternalPosition:
+        """
+        Rounds a computed position the same way the converted positions are rounded
+
+        Args:
+            pos:        A position in points
+            precision:  The number of decimals to keep
+
+        Returns:  The snapped position
+        """
+        return InternalPosition(round(pos.x, precision), round(pos.y, precision))
+
     @classmethod
     def pointInsidePolygon(cls, pos: InternalPosition, polygon: PolygonPoints) -> bool:
         """
@@ -82,8 +111,8 @@ class PdfCommon(Common):
     def buildScanPoints(cls, points: PolygonPoints) -> ScanPoints:
 
         minX: float = points[0].x
-        maxX: float = points[0].y
-        minY: float = points[0].x
+        maxX: float = points[0].x
+        minY: float = points[0].y
         maxY: float = points[0].y
 
         for point in points:
@@ -0,0 +1,132 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from zlib import compress
+
+from pyumldiagrams.Defaults import DEFAULT_PDF_COMPRESSION_LEVEL
+
+from pyumldiagrams.pdf.PdfDocumentObjects import PdfDocumentObjects
+
+XrefEntry = Tuple[int, int, int]
+"""
+Syntactic sugar for a cross-reference stream entry;  The type and the two fields
+"""
+
+
+class PdfCompactor:
+    """
+    Rewrites a complete document, as written by `FPDFExtended`, with a compressed cross-reference stream instead
+    of the cross-reference table and, optionally, with the objects that are not streams packed into compressed
+    object streams.  Both need PDF 1.5;  The header says so.  The object numbers do not change
+    """
+    PDF_VERSION_HEADER: final = b'%PDF-1.5\n'
+
+    OBJECTS_PER_STREAM: final = 100     # Viewers decompress a whole object stream to read any object in it
+
+    FREE_ENTRY:       final = 0
+    IN_FILE_ENTRY:    final = 1
+    COMPRESSED_ENTRY: final = 2
+
+    TYPE_FIELD_SIZE:   final = 1    # bytes
+    SECOND_FIELD_SIZE: final = 2    # Holds the generation number of the free entry, 65535, and the index in an object stream
+
+    def __init__(self, compressionLevel: int = DEFAULT_PDF_COMPRESSION_LEVEL, objectStreams: bool = False):
+        """
+
+        Args:
+            compressionLevel:  The deflate level of the new streams;  0 writes them uncompressed
+            objectStreams:     If True, pack the objects that are not streams into object streams
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._compressionLevel: int  = compressionLevel
+        self._objectStreams:    bool = objectStreams
+
+    def compact(self, document: bytes) -> bytes:
+        """
+        Args:
+            document:  A complete document with a single cross-reference table
+
+        Returns:  The compacted document
+        """
+        documentObjects: PdfDocumentObjects = PdfDocumentObjects.parse(document)
+
+        compacted: bytearray            = bytearray(PdfCompactor.PDF_VERSION_HEADER)
+        entries:   Dict[int, XrefEntry] = {0: (PdfCompactor.FREE_ENTRY, 0, 65535)}
+        packed:    List[int]            = []
+        for objectNumber, body in documentObjects.bodies.items():
+            if self._objectStreams is True and PdfDocumentObjects.isStream(body) is False:
+                packed.append(objectNumber)
+            else:
+                entries[objectNumber] = (PdfCompactor.IN_FILE_ENTRY, len(compacted), 0)
+                compacted += f'{objectNumber} 0 obj\n'.encode() + body + b'endobj\n'
+
+        streamNumber: int = max(documentObjects.bodies) + 1
+        for start in range(0, len(packed), PdfCompactor.OBJECTS_PER_STREAM):
+            streamObjects: List[int] = packed[start:start + PdfCompactor.OBJECTS_PER_STREAM]
+            for index, objectNumber in enumerate(streamObjects):
+                entries[objectNumber] = (PdfCompactor.COMPRESSED_ENTRY, streamNumber, index)
+
+            entries[streamNumber] = (PdfCompactor.IN_FILE_ENTRY, len(compacted), 0)
+            compacted += self._objectStream(streamNumber, [(objectNumber, documentObjects.bodies[objectNumber]) for objectNumber in streamObjects])
+            streamNumber += 1
+
+        xrefOffset: int = len(compacted)
+        entries[streamNumber] = (PdfCompactor.IN_FILE_ENTRY, xrefOffset, 0)
+        compacted += self._xrefStream(streamNumber, entries, documentObjects.root, documentObjects.info)
+        compacted += f'startxref\n{xrefOffset}\n%%EOF\n'.encode()
+
+        self.logger.debug(f'Compacted {len(document)} bytes to {len(compacted)};  {len(packed)} objects in object streams')
+
+        return bytes(compacted)
+
+    def _objectStream(self, streamNumber: int, streamObjects: List[Tuple[int, bytes]]) -> bytes:
+        """
+        The object numbers and offsets, then the objects themselves
+        """
+        objectData: bytearray = bytearray()
+        offsets:    List[str] = []
+        for objectNumber, body in streamObjects:
+            offsets.append(f'{objectNumber} {len(objectData)}')
+            objectData += body
+
+        offsetData: bytes = (' '.join(offsets) + '\n').encode()
+
+        return self._putStream(streamNumber, offsetData + objectData, f'/Type /ObjStm /N {len(streamObjects)} /First {len(offsetData)} ')
+
+    def _xrefStream(self, streamNumber: int, entries: Dict[int, XrefEntry], root: int, info: int) -> bytes:
+        """
+        Every object has an entry;  The offset field is as wide as the largest offset needs
+        """
+        size:       int = streamNumber + 1
+        offsetSize: int = max(1, (max(entry[1] for entry in entries.values()).bit_length() + 7) // 8)
+
+        entryData: bytearray = bytearray()
+        for objectNumber in range(size):
+            entryType, field2, field3 = entries.get(objectNumber, (PdfCompactor.FREE_ENTRY, 0, 0))
+            entryData += entryType.to_bytes(PdfCompactor.TYPE_FIELD_SIZE, 'big')
+            entryData += field2.to_bytes(offsetSize, 'big')
+            entryData += field3.to_bytes(PdfCompactor.SECOND_FIELD_SIZE, 'big')
+
+        fieldSizes: str = f'{PdfCompactor.TYPE_FIELD_SIZE} {offsetSize} {PdfCompactor.SECOND_FIELD_SIZE}'
+
+        return self._putStream(streamNumber, bytes(entryData), f'/Type /XRef /Size {size} /Root {root} 0 R /Info {info} 0 R /W [{fieldSizes}] ')
+
+    def _putStream(self, objectNumber: int, content: bytes, entries: str) -> bytes:
+        """
+        Like `FPDFExtended._putStream`
+        """
+        if self._compressionLevel > 0:
+            streamFilter: str   = '/Filter /FlateDecode '
+            stream:       bytes = compress(content, self._compressionLevel)
+        else:
+            streamFilter: str   = ''
+            stream:       bytes = content
+
+        return f'{objectNumber} 0 obj\n<<{entries}{streamFilter}/Length {len(stream)}>>\nstream\n'.encode() + stream + b'\nendstream\nendobj\n'
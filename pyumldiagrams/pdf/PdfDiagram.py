@@ -1,6 +1,10 @@
 
 
+from typing import Any
+from typing import Dict
+from typing import List
 from typing import Tuple
+from typing import cast
 from typing import final
 
 from logging import Logger
@@ -8,12 +12,30 @@ from logging import getLogger
 
 from os import sep as osSep
 
+from math import ceil
+
+from itertools import repeat
+
+from dataclasses import fields
+
+from concurrent.futures import ProcessPoolExecutor
+
 from datetime import datetime
 
+from hashlib import sha256
+
+from re import compile as regExCompile
+
 from pkg_resources import resource_filename
 
 from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.BaseDiagram import DeferredDefinition
+from pyumldiagrams.BaseDiagram import DeferredDefinitions
+from pyumldiagrams.DiagramInstrumentation import InstrumentationCounters
+from pyumldiagrams.RenderProfiler import RenderProfiler
 from pyumldiagrams.Defaults import DEFAULT_LINE_WIDTH
+from pyumldiagrams.Defaults import DEFAULT_PDF_COMPRESSION_LEVEL
+from pyumldiagrams.Defaults import DEFAULT_PDF_COORDINATE_PRECISION
 from pyumldiagrams.Definitions import DisplayMethodParameters
 from pyumldiagrams.Internal import SeparatorPosition
 
@@ -25,10 +47,17 @@ from pyumldiagrams.Definitions import UmlLineDefinition
 from pyumldiagrams.Definitions import Position
 from pyumldiagrams.Definitions import RectangleDefinition
 from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import TextDefinition
+from pyumldiagrams.UnsupportedException import UnsupportedException
 
 from pyumldiagrams.pdf.PdfCommon import PdfCommon
+from pyumldiagrams.pdf.PdfCompactor import PdfCompactor
 from pyumldiagrams.pdf.PdfLine import PdfDiagramLine
 from pyumldiagrams.pdf.FPDFExtended import FPDFExtended
+from pyumldiagrams.pdf.PdfFragment import PdfFragment
+from pyumldiagrams.pdf.PdfLinearizer import PdfLinearizer
+from pyumldiagrams.pdf.PdfPreviousOutput import PdfPreviousOutput
+from pyumldiagrams.pdf.PdfSegment import PdfSegment
 
 
 class PdfDiagram(BaseDiagram):
@@ -50,6 +79,23 @@ class PdfDiagram(BaseDiagram):
 
     FIRST_METHOD_Y_OFFSET: final = 7
 
+    FORM_MARGIN: final = 1     # points;  Room for the stroke around a class form
+
+    MINIMUM_COORDINATE_PRECISION: final = 0
+    MAXIMUM_COORDINATE_PRECISION: final = 3
+
+    MINIMUM_COMPRESSION_LEVEL: final = 0
+    MAXIMUM_COMPRESSION_LEVEL: final = 9
+
+    RUNS_PER_PROCESS:                final = 4     # Smaller runs even out the processes' share of expensive definitions
+    MINIMUM_DEFINITIONS_PER_PROCESS: final = 100   # Fewer draw faster than a render process starts;  See `renderProcesses`
+
+    DEFINITION_KEY_LENGTH: final = 16   # hexadecimal digits
+
+    FILL_OPERATORS: final = {b'f', b'F', b'f*', b'B', b'B*', b'b', b'b*'}
+
+    FILL_PIXEL_PATTERN: final = regExCompile(rb'^(\S+) (\S+) m \1 \2 l S$')     # PdfDiagramLine fills a diamond with these
+
     def __init__(self, fileName: str, dpi: int, docDisplayMethodParameters: DisplayMethodParameters = DisplayMethodParameters.DISPLAY, headerText: str = ''):
         """
 
@@ -83,14 +129,23 @@ class PdfDiagram(BaseDiagram):
         diagramPadding:   DiagramPadding = DiagramPadding()
         self._lineDrawer: PdfDiagramLine = PdfDiagramLine(pdf=pdf, diagramPadding=diagramPadding, dpi=dpi)
 
-        self._diagramPadding: DiagramPadding = diagramPadding
+        self._diagramPadding:  DiagramPadding = diagramPadding
+        self._useForms:        bool           = False
+        self._precision:       int            = DEFAULT_PDF_COORDINATE_PRECISION
+        self._streamOutput:    bool           = False
+        self._renderProcesses: int            = 1
+        self._incremental:     bool           = False
+        self._linearize:       bool           = False
+        self._compression:     int            = DEFAULT_PDF_COMPRESSION_LEVEL
+        self._objectStreams:   bool           = False
+        self._compressedXref:  bool           = False
 
     @property
     def docTimeStamp(self) -> datetime:
         """
-        Overrides the empty base implementation
+        Overrides the empty base implementation.  None until pinned;  Then the document carries the time it was written
         """
-        return self._pdf.creation_date
+        return getattr(self._pdf, 'creation_date', None)
 
     @docTimeStamp.setter
     def docTimeStamp(self, timeStamp: datetime):
@@ -99,6 +154,148 @@ class PdfDiagram(BaseDiagram):
         """
         self._pdf.creation_date = timeStamp
 
+    @property
+    def useFormXObjects(self) -> bool:
+        """
+        If True, each distinct class appearance and line decoration is defined once as a form XObject and placed
+        wherever it is used;  Only the class names are drawn individually.  Diagrams with many look-alike classes
+        or relationships get much smaller content streams.  Set it before drawing anything
+        """
+        return self._useForms
+
+    @useFormXObjects.setter
+    def useFormXObjects(self, newValue: bool):
+        self._useForms            = newValue
+        self._lineDrawer.useForms = newValue
+
+    @property
+    def coordinatePrecision(self) -> int:
+        """
+        The number of decimals (0 to 3) in the drawing coordinates.  Every position is converted and rounded once,
+        including the computed arrow head and diamond vertices, so lines meet their decorations exactly.  Fewer
+        decimals make smaller documents.  See `pyumldiagrams.Defaults.DEFAULT_PDF_COORDINATE_PRECISION`
+        """
+        return self._precision
+
+    @coordinatePrecision.setter
+    def coordinatePrecision(self, newValue: int):
+
+        if newValue < PdfDiagram.MINIMUM_COORDINATE_PRECISION or newValue > PdfDiagram.MAXIMUM_COORDINATE_PRECISION:
+            raise UnsupportedException(f'Coordinate precision must be between 0 and 3: `{newValue}`')
+
+        self._precision            = newValue
+        self._pdf.precision        = newValue
+        self._lineDrawer.precision = newValue
+
+    @property
+    def streamOutput(self) -> bool:
+        """
+        If True, `write()` streams the document to the file as its pages complete instead of assembling it in
+        memory first.  The document is the same either way.  Ignored when a diagram cache is used, because
+        the cache needs the whole document
+        """
+        return self._streamOutput
+
+    @streamOutput.setter
+    def streamOutput(self, newValue: bool):
+        self._streamOutput = newValue
+
+    @property
+    def renderProcesses(self) -> int:
+        """
+        The number of processes that draw the diagram.  With more than one, drawing is queued until `write()`;  Then
+        the queued definitions are split, in drawing order, into runs that a process pool draws.  The page content
+        of the runs is merged in order and the forms that they define are shared.  The document is the same as when
+        drawing in this process.  Worth it for large diagrams, especially ones with many composition lines.
+
+        Starting a render process costs about as much as drawing 60 definitions, so each one is given at least
+        `MINIMUM_DEFINITIONS_PER_PROCESS` of them;  Smaller diagrams use fewer processes or are drawn in this process
+        """
+        return self._renderProcesses
+
+    @renderProcesses.setter
+    def renderProcesses(self, newValue: int):
+
+        if newValue < 1:
+            raise UnsupportedException(f'Need at least one render process: `{newValue}`')
+
+        self._renderProcesses = newValue
+
+    @property
+    def incrementalUpdates(self) -> bool:
+        """
+        If True, `write()` draws each definition into a content stream of its own and the page lists them.  When the
+        file already has such a document, drawn with the same settings, only the definitions that it does not have are
+        drawn;  They are appended as an incremental update that also drops the definitions that are gone.  So rewriting
+        a diagram after a small edit costs about as much as the edit.  Each update makes the file larger.
+
+        Not supported with form XObjects.  The diagram cache and the render processes are not used
+        """
+        return self._incremental
+
+    @incrementalUpdates.setter
+    def incrementalUpdates(self, newValue: bool):
+        self._incremental = newValue
+
+    @property
+    def linearize(self) -> bool:
+        """
+        If True, `write()` writes a linearized ("fast web view") document.  The objects that the page needs come
+        first;  So a viewer can display the diagram before the rest of the file arrives.  The document is assembled
+        in memory;  So `streamOutput` is ignored.
+
+        Not supported with incremental updates
+        """
+        return self._linearize
+
+    @linearize.setter
+    def linearize(self, newValue: bool):
+        self._linearize = newValue
+
+    @property
+    def compressionLevel(self) -> int:
+        """
+        The deflate level (0 to 9) of the content streams.  0 writes them uncompressed, which is the fastest write;
+        9 makes the smallest documents.  See `pyumldiagrams.Defaults.DEFAULT_PDF_COMPRESSION_LEVEL`
+        """
+        return self._compression
+
+    @compressionLevel.setter
+    def compressionLevel(self, newValue: int):
+
+        if newValue < PdfDiagram.MINIMUM_COMPRESSION_LEVEL or newValue > PdfDiagram.MAXIMUM_COMPRESSION_LEVEL:
+            raise UnsupportedException(f'Compression level must be between 0 and 9: `{newValue}`')
+
+        self._compression          = newValue
+        self._pdf.compressionLevel = newValue
+
+    @property
+    def objectStreams(self) -> bool:
+        """
+        If True, `write()` packs the objects that are not streams, the page and the font dictionaries for example,
+        into compressed object streams.  They need a compressed cross-reference table;  So it implies `compressedXref`
+        """
+        return self._objectStreams
+
+    @objectStreams.setter
+    def objectStreams(self, newValue: bool):
+        self._objectStreams = newValue
+
+    @property
+    def compressedXref(self) -> bool:
+        """
+        If True, `write()` writes the cross-reference table as a compressed stream.  Like `linearize`, the document
+        is assembled in memory;  So `streamOutput` is ignored.
+
+        Object streams and compressed cross-reference tables need PDF 1.5.  Not supported with linearized documents
+        or with incremental updates
+        """
+        return self._compressedXref
+
+    @compressedXref.setter
+    def compressedXref(self, newValue: bool):
+        self._compressedXref = newValue
+
     def retrieveResourcePath(self, bareFileName: str) -> str:
         """
         Overrides the empty base implementation
@@ -127,26 +324,10 @@ class PdfDiagram(BaseDiagram):
         Args:
             classDefinition:    The class definition
         """
-
-        position:      Position = classDefinition.position
-        verticalGap:   float    = self._diagramPadding.verticalGap
-        horizontalGap: float    = self._diagramPadding.horizontalGap
-
-        x, y = PdfCommon.convertPosition(pos=position, dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
-        self.logger.debug(f'x,y: ({x},{y})')
-
-        methodReprs: BaseDiagram.MethodsRepr = self._buildMethods(classDefinition.methods, classDefinition.displayMethodParameters)
-        fieldReprs:  BaseDiagram.FieldsRepr  = self._buildFields(classDefinition.fields)
-
-        symbolWidth: float = self._drawClassSymbol(classDefinition, rectX=x, rectY=y)
-
-        separatorPosition: SeparatorPosition = self._drawSeparator(rectX=x, rectY=y, shapeWidth=symbolWidth)
-        fieldSeparatorPosition: SeparatorPosition = self._drawFields(fieldReprs=fieldReprs, separatorPosition=separatorPosition)
-
-        methodSeparatorPosition: SeparatorPosition = self._drawSeparator(rectX=x, rectY=fieldSeparatorPosition.y, shapeWidth=symbolWidth)
-
-        if classDefinition.displayMethods is True:
-            self._drawMethods(methodReprs=methodReprs, separatorPosition=methodSeparatorPosition)
+        if self._deferDrawing is True:
+            self._deferredDefinitions.append(classDefinition)
+        else:
+            self._drawClass(classDefinition=classDefinition)
 
     def drawUmlLine(self, lineDefinition: UmlLineDefinition):
         """
@@ -156,7 +337,10 @@ class PdfDiagram(BaseDiagram):
         Args:
             lineDefinition:   A UML Line definition
         """
-        self._lineDrawer.draw(lineDefinition=lineDefinition)
+        if self._deferDrawing is True:
+            self._deferredDefinitions.append(lineDefinition)
+        else:
+            self._lineDrawer.draw(lineDefinition=lineDefinition)
 
     def drawEllipse(self, definition: EllipseDefinition):
         """
@@ -165,9 +349,10 @@ class PdfDiagram(BaseDiagram):
         Args:
             definition:     It's definition
         """
-
-        x, y, width, height = self.__convertDefinition(definition)
-        self._pdf.ellipse(x=x, y=y, w=width, h=height, style=definition.renderStyle)
+        if self._deferDrawing is True:
+            self._deferredDefinitions.append(definition)
+        else:
+            self._drawEllipse(definition=definition)
 
     def drawRectangle(self, definition: RectangleDefinition):
         """
@@ -177,9 +362,10 @@ class PdfDiagram(BaseDiagram):
             definition:  The rectangle definition
 
         """
-
-        x, y, width, height = self.__convertDefinition(definition)
-        self._pdf.rect(x=x, y=y, w=width, h=height, style=definition.renderStyle)
+        if self._deferDrawing is True:
+            self._deferredDefinitions.append(definition)
+        else:
+            self._drawRectangle(definition=definition)
 
     def drawText(self, position: Position, text: str):
         """
@@ -190,15 +376,299 @@ class PdfDiagram(BaseDiagram):
             position:  The display's x, y position
             text:   The text to display
         """
-
-        x, y = PdfCommon.convertPosition(position, dpi=self._dpi, verticalGap=self.verticalGap, horizontalGap=self.horizontalGap)
-        self._pdf.text(x=x, y=y, txt=text)
+        if self._deferDrawing is True:
+            self._deferredDefinitions.append(TextDefinition(position=position, text=text))
+        else:
+            self._drawText(position=position, text=text)
 
     def write(self):
         """
         Call this method when you are done with placing the diagram onto a PDF document.
+
+        The diagram cache is skipped unless `docTimeStamp` is pinned;  Otherwise the document carries the time
+        it is written, and a cached document would carry the time of an earlier write
+        """
+        if self._incremental is True:
+            self._writeIncrementally()
+        elif self._diagramCache is None or self.docTimeStamp is None:
+            self._drawDeferredDefinitions()
+            self._outputDocument()
+        else:
+            self._writeCachedOutput(fileName=self._fileName, render=self._renderPdf)
+
+    def _outputDocument(self):
+
+        if self._linearize is True or self._compacted is True:
+            document: bytes = self._rewriteDocument(bytes(self._pdf.output()))
+            with open(self._fileName, 'wb') as outputFile:
+                outputFile.write(document)
+        elif self._streamOutput is True:
+            with open(self._fileName, 'wb') as outputFile:
+                self._pdf.streamTo(outputFile)
+                self._pdf.output()
+        else:
+            self._pdf.output(self._fileName)
+
+    def _writeIncrementally(self):
+        """
+        Update the previous document if we can;  Else write a new one with a segment per definition
+        """
+        if self._useForms is True:
+            raise UnsupportedException('Incremental updates do not support form XObjects')
+        if self._linearize is True or self._compacted is True:
+            raise UnsupportedException('Incremental updates cannot be linearized or have compressed cross-reference tables')
+
+        settingsKey:    str       = self._computeSettingsKey()
+        definitionKeys: List[str] = [self.__computeDefinitionKey(definition) for definition in self._deferredDefinitions]
+
+        previous: PdfPreviousOutput = PdfPreviousOutput.read(self._fileName)
+
+        if previous is None or previous.settingsKey != settingsKey or previous.segmentKeys[0] != FPDFExtended.PROLOGUE_SEGMENT \
+                or previous.segmentKeys[-1] != FPDFExtended.EPILOGUE_SEGMENT:
+            self._pdf.startSegments(settingsKey=settingsKey)
+            for definitionKey, definition in zip(definitionKeys, self._deferredDefinitions):
+                self._pdf.beginSegment(key=definitionKey)
+                self._drawDeferred(definition=definition)
+            self._outputDocument()
+        else:
+            self.__appendUpdate(previous=previous, definitionKeys=definitionKeys)
+
+    def _drawDeferred(self, definition: DeferredDefinition):
+        """
+        Overrides the empty base implementation
         """
-        self._pdf.output(self._fileName)
+        if isinstance(definition, ClassDefinition):
+            self._drawClass(classDefinition=definition)
+        elif isinstance(definition, UmlLineDefinition):
+            self._lineDrawer.draw(lineDefinition=definition)
+        elif isinstance(definition, TextDefinition):
+            self._drawText(position=definition.position, text=definition.text)
+        elif isinstance(definition, EllipseDefinition):     # Check before its RectangleDefinition parent
+            self._drawEllipse(definition=definition)
+        else:
+            self._drawRectangle(definition=definition)
+
+    @property
+    def _deferDrawing(self) -> bool:
+        """
+        Overrides the base implementation;  The render processes and the incremental updates need every definition
+        """
+        return self._renderProcesses > 1 or self._incremental is True or super()._deferDrawing
+
+    def _drawDeferredDefinitions(self):
+        """
+        Overrides the base implementation to draw in the render processes
+        """
+        definitionCount: int = len(self._deferredDefinitions)
+        processCount:    int = self._renderProcessCount(definitionCount=definitionCount)
+
+        if processCount < 2:
+            super()._drawDeferredDefinitions()
+        else:
+            runLength: int = ceil(definitionCount / (processCount * PdfDiagram.RUNS_PER_PROCESS))
+            runs: List[DeferredDefinitions] = [
+                self._deferredDefinitions[start:start + runLength] for start in range(0, definitionCount, runLength)
+            ]
+            self.logger.info(f'Drawing {definitionCount} definitions in {len(runs)} runs on {processCount} processes')
+
+            with self._profilerPhase(RenderProfiler.DRAW_PHASE), ProcessPoolExecutor(max_workers=processCount) as executor:
+                for fragment in executor.map(PdfDiagram._drawFragment, repeat(self._fragmentSettings()), runs):
+                    self._pdf.appendFragment(fragment)
+
+    def _renderProcessCount(self, definitionCount: int) -> int:
+        """
+        Args:
+            definitionCount:  The number of queued definitions
+
+        Returns:  The number of render processes worth starting;  Less than two draws in this process
+        """
+        return min(self._renderProcesses, definitionCount // PdfDiagram.MINIMUM_DEFINITIONS_PER_PROCESS)
+
+    def _fragmentSettings(self) -> Dict[str, Any]:
+        """
+        Returns:  What a render process needs to set up a diagram like this one
+        """
+        return {
+            'dpi':                        self._dpi,
+            'docDisplayMethodParameters': self._docDisplayMethodParameters,
+            'headerText':                 self._headerText,
+            'fontSize':                   self._fontSize,
+            'diagramPadding':             self._diagramPadding,
+            'useFormXObjects':            self._useForms,
+            'coordinatePrecision':        self._precision,
+        }
+
+    @classmethod
+    def _drawFragment(cls, settings: Dict[str, Any], definitions: DeferredDefinitions) -> PdfFragment:
+        """
+        Runs in a render process
+
+        Args:
+            settings:     See `_fragmentSettings`
+            definitions:  A run of the queued definitions
+
+        Returns:  The page content of the run
+        """
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=settings['dpi'],
+                                         docDisplayMethodParameters=settings['docDisplayMethodParameters'],
+                                         headerText=settings['headerText'])
+        diagram.fontSize            = settings['fontSize']
+        diagram.useFormXObjects     = settings['useFormXObjects']
+        diagram.coordinatePrecision = settings['coordinatePrecision']
+        for paddingField in fields(DiagramPadding):     # The line drawer shares the padding instance
+            setattr(diagram._diagramPadding, paddingField.name, getattr(settings['diagramPadding'], paddingField.name))
+
+        start: int = diagram._pdf.contentLength
+        for definition in definitions:
+            diagram._drawDeferred(definition=definition)
+
+        return diagram._pdf.fragment(start=start)
+
+    def _cacheKeySettings(self) -> List:
+        """
+        Overrides the empty base implementation
+        """
+        return [self._useForms, self._precision, self._linearize, self._compression, self._objectStreams, self._compressedXref]
+
+    def _instrumentationMark(self) -> int:
+        """
+        Overrides the empty base implementation
+        """
+        return self._pdf.contentLength
+
+    def _instrumentationCounters(self, mark: int) -> InstrumentationCounters:
+        """
+        Overrides the empty base implementation.  Counts the content operations that were added to the page;
+        Each is on its own line.  A form placement counts once, however much the form draws.
+
+        A filled decoration counts as one polygon fill, like the image backend counts it.  The composition
+        diamond is filled with a run of single pixel lines;  The run is one fill and none of its lines are
+        primitives.  A placed form counts the fills it draws
+
+        Args:
+            mark:  The page content length before the call
+        """
+        content: bytes = self._pdf.contentSince(mark)
+
+        operations, fillRuns = self.__countOperations(content)
+        polygonFills: int = fillRuns
+        for placement in FPDFExtended.FORM_PLACEMENT_PATTERN.finditer(content):
+            formContent: bytes = self._pdf.formContent(placement.group(2).decode())
+            polygonFills += self.__countOperations(formContent)[1]
+
+        return InstrumentationCounters(primitives=len(operations),
+                                       textRuns=content.count(b') Tj'),
+                                       polygonFills=polygonFills + sum(1 for operation in operations if operation.rsplit(b' ', 1)[-1] in PdfDiagram.FILL_OPERATORS))
+
+    def _renderPdf(self) -> bytes:
+
+        self._drawDeferredDefinitions()
+
+        return self._rewriteDocument(bytes(self._pdf.output()))
+
+    @property
+    def _compacted(self) -> bool:
+        """
+        True if the document gets a compressed cross-reference table
+        """
+        return self._objectStreams is True or self._compressedXref is True
+
+    def _rewriteDocument(self, document: bytes) -> bytes:
+        """
+        Args:
+            document:  The document that fpdf wrote
+
+        Returns:  The linearized or compacted document;  Else the document unchanged
+        """
+        if self._linearize is True and self._compacted is True:
+            raise UnsupportedException('Linearized documents cannot have compressed cross-reference tables')
+
+        if self._linearize is True:
+            document = PdfLinearizer().linearize(document)
+        elif self._compacted is True:
+            document = PdfCompactor(compressionLevel=self._compression, objectStreams=self._objectStreams).compact(document)
+
+        return document
+
+    def _drawClass(self, classDefinition: ClassDefinition):
+
+        position:      Position = classDefinition.position
+        verticalGap:   float    = self._diagramPadding.verticalGap
+        horizontalGap: float    = self._diagramPadding.horizontalGap
+
+        x, y = PdfCommon.convertPosition(pos=position, dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap, precision=self._precision)
+        self.logger.debug(f'x,y: ({x},{y})')
+
+        fieldReprs:  BaseDiagram.FieldsRepr  = self._buildFields(classDefinition.fields)
+        methodReprs: BaseDiagram.MethodsRepr = []
+        if classDefinition.displayMethods is True:
+            methodReprs = self._buildMethods(classDefinition.methods, classDefinition.displayMethodParameters)
+
+        if self._useForms is False:
+            symbolWidth: float = self._drawClassSymbol(classDefinition, rectX=x, rectY=y)
+            self._drawClassBody(rectX=x, rectY=y, symbolWidth=symbolWidth, fieldReprs=fieldReprs, methodReprs=methodReprs)
+        else:
+            self._placeClassForm(classDefinition=classDefinition, rectX=x, rectY=y, fieldReprs=fieldReprs, methodReprs=methodReprs)
+            self._drawClassName(classDefinition=classDefinition, rectX=x, rectY=y)
+
+    def _drawClassBody(self, rectX: float, rectY: float, symbolWidth: float, fieldReprs: BaseDiagram.FieldsRepr, methodReprs: BaseDiagram.MethodsRepr):
+
+        separatorPosition:      SeparatorPosition = self._drawSeparator(rectX=rectX, rectY=rectY, shapeWidth=symbolWidth)
+        fieldSeparatorPosition: SeparatorPosition = self._drawFields(fieldReprs=fieldReprs, separatorPosition=separatorPosition)
+
+        methodSeparatorPosition: SeparatorPosition = self._drawSeparator(rectX=rectX, rectY=fieldSeparatorPosition.y, shapeWidth=symbolWidth)
+
+        self._drawMethods(methodReprs=methodReprs, separatorPosition=methodSeparatorPosition)
+
+    def _placeClassForm(self, classDefinition: ClassDefinition, rectX: float, rectY: float,
+                        fieldReprs: BaseDiagram.FieldsRepr, methodReprs: BaseDiagram.MethodsRepr):
+        """
+        Places everything but the class name;  Defines the form the first time we see this class appearance
+
+        Args:
+            classDefinition:  The class definition
+            rectX:            x position
+            rectY:            y position
+            fieldReprs:       The field text lines
+            methodReprs:      The method text lines;  Empty if the class does not display them
+        """
+        size: Size  = classDefinition.size
+        key:  Tuple = (size.width, size.height, self._fontSize, tuple(fieldReprs), tuple(methodReprs))
+
+        if self._pdf.hasForm(key) is False:
+
+            convertedWidth, convertedHeight = self.__convertSize(size=size)
+            #
+            # Long text may overflow the class symbol;  Generously bound it
+            #
+            textWidth:  float = max([self._pdf.get_string_width(textRepr) for textRepr in fieldReprs + methodReprs], default=0)
+            lineCount:  int   = len(fieldReprs) + len(methodReprs) + 4
+            textHeight: float = (lineCount * (self._fontSize + PdfDiagram.Y_NUDGE_FACTOR)) + PdfDiagram.FIRST_METHOD_Y_OFFSET
+
+            margin: float = PdfDiagram.FORM_MARGIN
+            bounds = (-margin, -margin, max(convertedWidth, PdfDiagram.X_NUDGE_FACTOR + textWidth) + margin, max(convertedHeight, textHeight) + margin)
+
+            self._pdf.beginForm()
+            self._pdf.rect(x=0, y=0, w=convertedWidth, h=convertedHeight, style=PdfDiagram.FPDF_DRAW)
+            self._drawClassBody(rectX=0, rectY=0, symbolWidth=convertedWidth, fieldReprs=fieldReprs, methodReprs=methodReprs)
+            self._pdf.endForm(key=key, bounds=bounds)
+
+        self._pdf.placeForm(key=key, x=rectX, y=rectY)
+
+    def _drawEllipse(self, definition: EllipseDefinition):
+
+        x, y, width, height = self.__convertDefinition(definition)
+        self._pdf.ellipse(x=x, y=y, w=width, h=height, style=definition.renderStyle)
+
+    def _drawRectangle(self, definition: RectangleDefinition):
+
+        x, y, width, height = self.__convertDefinition(definition)
+        self._pdf.rect(x=x, y=y, w=width, h=height, style=definition.renderStyle)
+
+    def _drawText(self, position: Position, text: str):
+
+        x, y = PdfCommon.convertPosition(position, dpi=self._dpi, verticalGap=self.verticalGap, horizontalGap=self.horizontalGap, precision=self._precision)
+        self._pdf.text(x=x, y=y, txt=text)
 
     def _drawClassSymbol(self, classDefinition: ClassDefinition, rectX: float, rectY: float) -> float:
         """
@@ -220,14 +690,20 @@ class PdfDiagram(BaseDiagram):
         convertedWidth, convertedHeight = self.__convertSize(size=size)
         self._pdf.rect(x=rectX, y=rectY, w=convertedWidth, h=convertedHeight, style=PdfDiagram.FPDF_DRAW)
 
+        self._drawClassName(classDefinition=classDefinition, rectX=rectX, rectY=rectY)
+
+        return convertedWidth
+
+    def _drawClassName(self, classDefinition: ClassDefinition, rectX: float, rectY: float):
+
+        symbolWidth: float = classDefinition.size.width
+
         nameWidth: int = self._pdf.get_string_width(classDefinition.name)
         textX: float = rectX + ((symbolWidth / 2) - (nameWidth / 2))
         textY: float = rectY + self._fontSize
 
         self._pdf.text(x=textX, y=textY, txt=classDefinition.name)
 
-        return convertedWidth
-
     def _drawSeparator(self, rectX: float, rectY: float, shapeWidth: float) -> SeparatorPosition:
         """
         Draws the UML separator between the class name and the start of the class definition
@@ -256,22 +732,17 @@ class PdfDiagram(BaseDiagram):
         x: float = separatorPosition.x + PdfDiagram.X_NUDGE_FACTOR
         y: float = separatorPosition.y + PdfDiagram.Y_NUDGE_FACTOR + PdfDiagram.FIRST_METHOD_Y_OFFSET
 
-        for methodRepr in methodReprs:
-
-            self._pdf.text(x=x, y=y, txt=methodRepr)
-
-            y = y + self._fontSize
+        self._pdf.textLines(x=x, y=y, lines=methodReprs, leading=self._fontSize)
 
     def _drawFields(self, fieldReprs: BaseDiagram.FieldsRepr, separatorPosition: SeparatorPosition) -> SeparatorPosition:
 
         x: float = separatorPosition.x + PdfDiagram.X_NUDGE_FACTOR
         y: float = separatorPosition.y + PdfDiagram.Y_NUDGE_FACTOR + 8
 
-        for fieldRepr in fieldReprs:
-            self._pdf.text(x=x, y=y, txt=fieldRepr)
-            y = y + self._fontSize + 2
+        leading: float = self._fontSize + 2
+        self._pdf.textLines(x=x, y=y, lines=fieldReprs, leading=leading)
 
-        y = y - self._fontSize - 2  # adjust for last addition
+        y = y + (leading * (len(fieldReprs) - 1))   # The last line's baseline
 
         return SeparatorPosition(x=x, y=y)
 
@@ -283,14 +754,73 @@ class PdfDiagram(BaseDiagram):
 
         Returns: a tuple of x, y, width height
         """
-        x, y = PdfCommon.convertPosition(definition.position, dpi=self._dpi, verticalGap=self.verticalGap, horizontalGap=self.horizontalGap)
+        x, y = PdfCommon.convertPosition(definition.position, dpi=self._dpi, verticalGap=self.verticalGap, horizontalGap=self.horizontalGap,
+                                         precision=self._precision)
         width, height = self.__convertSize(definition.size)
 
         return x, y, width, height
 
     def __convertSize(self, size: Size) -> Tuple[float, float]:
 
-        width:  float = PdfCommon.toPdfPoints(size.width, self._dpi)
-        height: float = PdfCommon.toPdfPoints(size.height, self._dpi)
+        width:  float = PdfCommon.convertLength(size.width, self._dpi, precision=self._precision)
+        height: float = PdfCommon.convertLength(size.height, self._dpi, precision=self._precision)
 
         return width, height
+
+    def __appendUpdate(self, previous: PdfPreviousOutput, definitionKeys: List[str]):
+        """
+        Reuse the content streams of the definitions that the previous document has and draw the others
+
+        Args:
+            previous:        The document to update
+            definitionKeys:  Identify the queued definitions
+        """
+        writtenSegments: Dict[str, List[int]] = {}
+        for segmentKey, objectNumber in zip(previous.segmentKeys, previous.contents):
+            writtenSegments.setdefault(segmentKey, []).append(objectNumber)
+
+        segments: List[PdfSegment] = [PdfSegment(key=FPDFExtended.PROLOGUE_SEGMENT, objectNumber=previous.contents[0])]
+        drawnCount: int = 0
+        for definitionKey, definition in zip(definitionKeys, self._deferredDefinitions):
+            objectNumbers: List[int] = writtenSegments.get(definitionKey, [])
+            if len(objectNumbers) > 0:
+                segments.append(PdfSegment(key=definitionKey, objectNumber=objectNumbers.pop(0)))
+            else:
+                start: int = self._pdf.contentLength
+                self._drawDeferred(definition=definition)
+                segments.append(PdfSegment(key=definitionKey, content=self._pdf.contentSince(start=start)))
+                drawnCount += 1
+        segments.append(PdfSegment(key=FPDFExtended.EPILOGUE_SEGMENT, objectNumber=previous.contents[-1]))
+
+        if [segment.objectNumber for segment in segments] == previous.contents:
+            self.logger.info(f'{self._fileName} is up to date')
+        else:
+            self.logger.info(f'Updating {self._fileName};  Drew {drawnCount} of {len(definitionKeys)} definitions')
+            with open(self._fileName, 'ab') as outputFile:
+                self._pdf.appendUpdate(outputStream=outputFile, previous=previous, segments=segments)
+
+    def __computeDefinitionKey(self, definition: DeferredDefinition) -> str:
+        """
+        Returns:  A stable hash of the definition;  Identifies its segment
+        """
+        return sha256(repr(definition).encode('utf-8')).hexdigest()[:PdfDiagram.DEFINITION_KEY_LENGTH]
+
+    def __countOperations(self, content: bytes) -> Tuple[List[bytes], int]:
+        """
+        Args:
+            content:  Drawing operators, one operation per line
+
+        Returns:  The operations that are not fill pixels and the number of runs of fill pixels
+        """
+        operations: List[bytes] = []
+        fillRuns:   int         = 0
+        inFillRun:  bool        = False
+        for operation in content.splitlines():
+            if PdfDiagram.FILL_PIXEL_PATTERN.match(operation) is None:
+                operations.append(operation)
+                inFillRun = False
+            elif inFillRun is False:
+                fillRuns += 1
+                inFillRun = True
+
+        return operations, fillRuns
@@ -0,0 +1,141 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import final
+
+from re import Match
+from re import compile as regExCompile
+
+from pyumldiagrams.UnsupportedException import UnsupportedException
+
+
+class PdfDocumentObjects:
+    """
+    The objects of a complete document, as written by `FPDFExtended`, with a single cross-reference table.
+    The documents that rewrite a finished document use it;  See `parse`
+    """
+    HEADER_PATTERN:     final = regExCompile(rb'^%PDF-\d\.\d\n')
+    STARTXREF_PATTERN:  final = regExCompile(rb'startxref\s+(\d+)\s+%%EOF\s*$')
+    SUBSECTION_PATTERN: final = regExCompile(rb'(\d+) (\d+)\n')
+    ENTRY_PATTERN:      final = regExCompile(rb'(\d{10}) (\d{5}) ([nf]) ?\r?\n')
+    ROOT_PATTERN:       final = regExCompile(rb'/Root (\d+) 0 R')
+    INFO_PATTERN:       final = regExCompile(rb'/Info (\d+) 0 R')
+    OBJECT_PATTERN:     final = regExCompile(rb'^(\d+) 0 obj\n')
+    # Skip string literals so that we only find actual references
+    REFERENCE_PATTERN:  final = regExCompile(rb'\((?:\\.|[^\\)])*\)|(\d+) 0 R')
+
+    STREAM_KEYWORD: final = b'>>\nstream\n'
+
+    def __init__(self):
+
+        self.header: bytes            = b''
+        self.root:   int              = 0
+        self.info:   int              = 0
+        self.bodies: Dict[int, bytes] = {}      # What is between each object's `obj` and `endobj` keywords
+
+    @classmethod
+    def parse(cls, document: bytes) -> 'PdfDocumentObjects':
+        """
+        Args:
+            document:  The complete document
+
+        Returns:  Its objects;  Raises an `UnsupportedException` if the document has been updated
+        """
+        documentObjects: PdfDocumentObjects = PdfDocumentObjects()
+
+        documentObjects.header = cls._search(PdfDocumentObjects.HEADER_PATTERN, document, 'Not a PDF document').group(0)
+
+        xrefStart: int            = int(cls._search(PdfDocumentObjects.STARTXREF_PATTERN, document, 'No cross-reference table').group(1))
+        offsets:   Dict[int, int] = cls._readXref(document, xrefStart)
+        trailer:   bytes          = document[xrefStart:]
+
+        documentObjects.root   = int(cls._search(PdfDocumentObjects.ROOT_PATTERN, trailer, 'No catalog').group(1))
+        documentObjects.info   = int(cls._search(PdfDocumentObjects.INFO_PATTERN, trailer, 'No information dictionary').group(1))
+        documentObjects.bodies = cls._readBodies(document, offsets, xrefStart)
+
+        return documentObjects
+
+    @classmethod
+    def dictionary(cls, body: bytes) -> bytes:
+        """
+        Returns:  The object without its stream data
+        """
+        streamStart: int = body.find(PdfDocumentObjects.STREAM_KEYWORD)
+        if streamStart == -1:
+            return body
+
+        return body[:streamStart + 2]
+
+    @classmethod
+    def isStream(cls, body: bytes) -> bool:
+        return PdfDocumentObjects.STREAM_KEYWORD in body
+
+    @classmethod
+    def references(cls, data: bytes) -> List[int]:
+        """
+        Returns:  The object numbers that the data refers to;  Ignores the ones in string literals
+        """
+        return [int(match.group(1)) for match in PdfDocumentObjects.REFERENCE_PATTERN.finditer(data) if match.group(1) is not None]
+
+    @classmethod
+    def _readXref(cls, document: bytes, xrefStart: int) -> Dict[int, int]:
+
+        if document[xrefStart:xrefStart + 5] != b'xref\n':
+            raise UnsupportedException('Cannot rewrite documents with cross-reference streams')
+
+        trailerStart: int = document.index(b'trailer', xrefStart)
+        if b'/Prev' in document[trailerStart:]:
+            raise UnsupportedException('Cannot rewrite updated documents')
+
+        offsets:  Dict[int, int] = {}
+        position: int            = xrefStart + 5
+        while position < trailerStart:
+            subsection: Match = cls._match(PdfDocumentObjects.SUBSECTION_PATTERN, document, position)
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            position = subsection.end()
+            for objectNumber in range(first, first + count):
+                entry: Match = cls._match(PdfDocumentObjects.ENTRY_PATTERN, document, position)
+                if entry.group(3) == b'n':
+                    offsets[objectNumber] = int(entry.group(1))
+                position = entry.end()
+
+        return offsets
+
+    @classmethod
+    def _readBodies(cls, document: bytes, offsets: Dict[int, int], xrefStart: int) -> Dict[int, bytes]:
+        """
+        An object ends where the next one starts
+        """
+        bodies:         Dict[int, bytes] = {}
+        orderedObjects: List[int]        = sorted(offsets, key=lambda objectNumber: offsets[objectNumber])
+        for index, objectNumber in enumerate(orderedObjects):
+            objectEnd:  int   = offsets[orderedObjects[index + 1]] if index + 1 < len(orderedObjects) else xrefStart
+            pdfObject:  bytes = document[offsets[objectNumber]:objectEnd]
+            objectLine: Match = cls._match(PdfDocumentObjects.OBJECT_PATTERN, pdfObject, 0)
+            if int(objectLine.group(1)) != objectNumber:
+                raise UnsupportedException(f'Cross-reference table does not match object {objectNumber}')
+            body: bytes = pdfObject[objectLine.end():].rstrip(b'\r\n')
+            if body.endswith(b'endobj') is False:
+                raise UnsupportedException(f'Unterminated object {objectNumber}')
+            bodies[objectNumber] = body[:-len(b'endobj')]
+
+        return bodies
+
+    @classmethod
+    def _search(cls, pattern, data: bytes, failMessage: str) -> Match:
+
+        match: Optional[Match] = pattern.search(data)
+        if match is None:
+            raise UnsupportedException(failMessage)
+
+        return match
+
+    @classmethod
+    def _match(cls, pattern, data: bytes, position: int) -> Match:
+
+        match: Optional[Match] = pattern.match(data, position)
+        if match is None:
+            raise UnsupportedException(f'Malformed document at {position}')
+
+        return match
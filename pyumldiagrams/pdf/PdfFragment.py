@@ -0,0 +1,24 @@
+
+from typing import Dict
+from typing import Hashable
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pyumldiagrams.pdf.FormXObject import FormXObject
+
+
+@dataclass
+class PdfFragment:
+    """
+    Page content drawn apart from the document, for example by another process.  The fragment names its
+    forms on its own;  The document renames them when it appends the fragment
+    """
+    content:      bytes                       = b''
+    """
+    The drawing operators
+    """
+    formXObjects: Dict[Hashable, FormXObject] = field(default_factory=dict)
+    """
+    The forms that the content places
+    """
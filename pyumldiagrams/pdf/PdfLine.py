@@ -1,4 +1,6 @@
 
+from typing import List
+from typing import Tuple
 from typing import final
 
 from logging import Logger
@@ -8,10 +10,10 @@ from math import pi
 from math import sin
 from math import atan
 from math import cos
-from typing import Tuple
 
 from fpdf import FPDF
 
+from pyumldiagrams.Defaults import DEFAULT_PDF_COORDINATE_PRECISION
 from pyumldiagrams.IDiagramLine import IDiagramLine
 from pyumldiagrams.UnsupportedException import UnsupportedException
 
@@ -39,15 +41,43 @@ class PdfDiagramLine(IDiagramLine):
     INHERITANCE_ARROW_HEIGHT: final = 10
     DIAMOND_HEIGHT:           final = 8
 
+    FORM_MARGIN: final = 1     # points;  Room for the stroke around a decoration form
+
     def __init__(self, pdf: FPDF, diagramPadding: DiagramPadding, dpi: int):
 
         super().__init__(docMaker=pdf, diagramPadding=diagramPadding, dpi=dpi)
         self.logger: Logger = getLogger(__name__)
 
+        self._useForms:  bool = False
+        self._precision: int  = DEFAULT_PDF_COORDINATE_PRECISION
+
         # self._pdf: FPDF = pdf
         # self._dpi: int  = dpi
         # self._diagramPadding: diagramPadding  = diagramPadding
 
+    @property
+    def useForms(self) -> bool:
+        """
+        If True the arrow heads and diamonds are defined once per distinct shape as form XObjects and placed
+        at each line end.  Requires an `FPDFExtended` document
+        """
+        return self._useForms
+
+    @useForms.setter
+    def useForms(self, newValue: bool):
+        self._useForms = newValue
+
+    @property
+    def precision(self) -> int:
+        """
+        The number of decimals to keep in the converted positions and the computed vertices
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, newValue: int):
+        self._precision = newValue
+
     def draw(self, lineDefinition: UmlLineDefinition):
         """
         Draw the line described by the input parameter
@@ -85,10 +115,10 @@ class PdfDiagramLine(IDiagramLine):
         convertedSrc:  InternalPosition = endPoints[0]
         convertedDest: InternalPosition = endPoints[1]
 
-        points: ArrowPoints = self.__computeTheArrowVertices(convertedSrc, convertedDest)
-        self.__drawPolygon(points)
+        points: ArrowPoints = self.__snapPoints(self.__computeTheArrowVertices(convertedSrc, convertedDest))
+        self.__drawDecoration(lineType=LineType.Inheritance, points=points)
 
-        newEndPoint: InternalPosition = self.__computeMidPointOfBottomLine(points[0], points[2])
+        newEndPoint: InternalPosition = PdfCommon.snapPosition(self.__computeMidPointOfBottomLine(points[0], points[2]), precision=self._precision)
 
         self.__finishDrawingLine(linePositions=linePositions, newEndPoint=newEndPoint)
 
@@ -101,9 +131,8 @@ class PdfDiagramLine(IDiagramLine):
         convertedSrc:  InternalPosition = endPoints[0]
         convertedDest: InternalPosition = endPoints[1]
 
-        points: DiamondPoints = self.__computeDiamondVertices(convertedSrc, convertedDest)
-        self.__drawPolygon(points)
-        self.__fillInDiamond(points)
+        points: DiamondPoints = self.__snapPoints(self.__computeDiamondVertices(convertedSrc, convertedDest))
+        self.__drawDecoration(lineType=LineType.Composition, points=points)
 
         newEndPoint: InternalPosition = points[3]
 
@@ -119,8 +148,8 @@ class PdfDiagramLine(IDiagramLine):
         convertedSrc:  InternalPosition = endPoints[0]
         convertedDest: InternalPosition = endPoints[1]
 
-        points: ArrowPoints = self.__computeDiamondVertices(convertedSrc, convertedDest)
-        self.__drawPolygon(points)
+        points: ArrowPoints = self.__snapPoints(self.__computeDiamondVertices(convertedSrc, convertedDest))
+        self.__drawDecoration(lineType=LineType.Aggregation, points=points)
 
         newEndPoint: InternalPosition = points[3]
 
@@ -131,8 +160,8 @@ class PdfDiagramLine(IDiagramLine):
         verticalGap:   int = self._diagramPadding.verticalGap
         horizontalGap: int = self._diagramPadding.horizontalGap
 
-        x1, y1 = PdfCommon.convertPosition(pos=src, dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
-        x2, y2 = PdfCommon.convertPosition(pos=dest, dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
+        x1, y1 = PdfCommon.convertPosition(pos=src,  dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap, precision=self._precision)
+        x2, y2 = PdfCommon.convertPosition(pos=dest, dpi=self._dpi, verticalGap=verticalGap, horizontalGap=horizontalGap, precision=self._precision)
 
         convertedSrc:  InternalPosition = InternalPosition(x1, y1)
         convertedDest: InternalPosition = InternalPosition(x2, y2)
@@ -232,28 +261,59 @@ class PdfDiagramLine(IDiagramLine):
 
         return points
 
+    def __snapPoints(self, points: PolygonPoints) -> PolygonPoints:
+        """
+        Round the computed vertices like the converted positions;  Then the line end computed from them
+        is exactly on the drawn decoration
+        """
+        return [PdfCommon.snapPosition(point, precision=self._precision) for point in points]
+
+    def __drawDecoration(self, lineType: LineType, points: PolygonPoints):
+        """
+        Draws the arrow head or diamond at the end of a line.  With forms, the decoration is defined relative
+        to the line end (always the second vertex) and keyed on its rounded shape;  Lines in the same direction share it
+
+        Args:
+            lineType:  Which decoration
+            points:    The decoration vertices
+        """
+        if self._useForms is False:
+            self.__drawPolygon(points)
+            if lineType == LineType.Composition:
+                self.__fillInDiamond(points)
+        else:
+            lineEnd:  InternalPosition = points[1]
+            relative: PolygonPoints    = [InternalPosition(point.x - lineEnd.x, point.y - lineEnd.y) for point in points]
+
+            key: Tuple = (lineType, tuple((round(point.x, self._precision), round(point.y, self._precision)) for point in relative))
+
+            pdf = self._docMaker
+            if pdf.hasForm(key) is False:
+                margin: float = PdfDiagramLine.FORM_MARGIN
+                bounds = (
+                    min(point.x for point in relative) - margin,
+                    min(point.y for point in relative) - margin,
+                    max(point.x for point in relative) + margin,
+                    max(point.y for point in relative) + margin,
+                )
+                pdf.beginForm()
+                self.__drawPolygon(relative)
+                if lineType == LineType.Composition:
+                    self.__fillInDiamond(relative)
+                pdf.endForm(key=key, bounds=bounds)
+
+            pdf.placeForm(key=key, x=lineEnd.x, y=lineEnd.y)
+
     def __drawPolygon(self, points: PolygonPoints):
+        """
+        Draws the decoration outline as a single closed path
 
+        Args:
+            points:  The polygon vertices
+        """
         pdf: FPDF = self._docMaker
-        ptNumber: int = 0
-        for point in points:
-
-            x1: float = point.x
-            y1: float = point.y
-
-            if ptNumber == len(points) - 1:
-                nextPoint = points[0]
-                x2: float = nextPoint.x
-                y2: float = nextPoint.y
-                pdf.line(x1, y1, x2, y2)
-                break
-            else:
-                nextPoint = points[ptNumber + 1]
-                x2: float = nextPoint.x
-                y2: float = nextPoint.y
-                pdf.line(x1, y1, x2, y2)
 
-            ptNumber += 1
+        pdf.polygon([(point.x, point.y) for point in points])
 
     def __computeMidPointOfBottomLine(self, startPos: InternalPosition, endPos: InternalPosition) -> InternalPosition:
         """
@@ -314,30 +374,22 @@ class PdfDiagramLine(IDiagramLine):
             x += 1
 
     def __finishDrawingLine(self, linePositions: LinePositions, newEndPoint: InternalPosition):
+        """
+        Draws the line as a single path.  The decoration replaces the last position with the new end point
 
-        linePositionsCopy: LinePositions = linePositions[:-1]  # Makes a copy; remove last one
-
+        Args:
+            linePositions:  The points that describe the line
+            newEndPoint:    Where the line meets the decoration;  Already converted
+        """
         verticalGap:   int  = self._diagramPadding.verticalGap
         horizontalGap: int  = self._diagramPadding.horizontalGap
         dpi:           int  = self._dpi
         docMaker:      FPDF = self._docMaker
-        #
-        # Ok, ok, I get it.  This is not a Pythonic 'for' loop.  But, I am not a purist
-        #
-        numPositions: int      = len(linePositionsCopy)
-        currentPos:   Position = linePositionsCopy[0]
-        for idx in range(numPositions):
-
-            nextIdx: int = idx + 1
-            currentPos = linePositionsCopy[idx]
-            if nextIdx == numPositions:
-                break
-            nextPos: Position = linePositionsCopy[nextIdx]
-
-            curX, curY = PdfCommon.convertPosition(pos=currentPos, dpi=dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
-            nxtX, nxtY = PdfCommon.convertPosition(pos=nextPos, dpi=dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
 
-            docMaker.line(x1=curX, y1=curY, x2=nxtX, y2=nxtY)
+        pathPoints: List[Tuple[float, float]] = [
+            PdfCommon.convertPosition(pos=position, dpi=dpi, verticalGap=verticalGap, horizontalGap=horizontalGap, precision=self._precision)
+            for position in linePositions[:-1]
+        ]
+        pathPoints.append((newEndPoint.x, newEndPoint.y))
 
-        curX, curY = PdfCommon.convertPosition(pos=currentPos, dpi=dpi, verticalGap=verticalGap, horizontalGap=horizontalGap)
-        docMaker.line(x1=curX, y1=curY, x2=newEndPoint.x, y2=newEndPoint.y)
+        docMaker.polyline(pathPoints)
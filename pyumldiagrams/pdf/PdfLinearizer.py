@@ -0,0 +1,282 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from re import Match
+from re import compile as regExCompile
+
+from pyumldiagrams.UnsupportedException import UnsupportedException
+
+from pyumldiagrams.pdf.PdfDocumentObjects import PdfDocumentObjects
+
+BitFields = List[Tuple[int, int]]
+"""
+Syntactic sugar for hint table items;  Each is a value and its bit count
+"""
+
+
+class PdfLinearizer:
+    """
+    Rewrites a single page document, as written by `FPDFExtended`, as a linearized ("fast web view") document.
+    The objects that the page needs are renumbered and moved to the front, after the linearization parameters,
+    a cross-reference table for them, the catalog, and the hint stream.  So a viewer can display the page
+    before the rest of the document arrives and without seeking to its end first.
+
+    The hint tables follow the layout that qpdf writes:  Every first page object is its own shared object group
+    """
+    PAGES_PATTERN: final = regExCompile(rb'/Pages (\d+) 0 R')
+    KIDS_PATTERN:  final = regExCompile(rb'/Kids \[([^\]]*)\]')
+
+    PAGE_TABLE_HEADER_SIZE:  final = 36     # bytes
+    PADDED_NUMBER_WIDTH:     final = 10     # Room for any offset in a linearized document
+    SHARED_DENOMINATOR:      final = 1
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def linearize(self, document: bytes) -> bytes:
+        """
+        Args:
+            document:  A complete single page document with a single cross-reference table
+
+        Returns:  The linearized document
+        """
+        documentObjects: PdfDocumentObjects = PdfDocumentObjects.parse(document)
+
+        header:  bytes            = documentObjects.header
+        bodies:  Dict[int, bytes] = documentObjects.bodies
+        catalog: int              = documentObjects.root
+        info:    int              = documentObjects.info
+
+        pageTree: int       = int(self._search(PdfLinearizer.PAGES_PATTERN, PdfDocumentObjects.dictionary(bodies[catalog]), 'No page tree').group(1))
+        kids:     List[int] = PdfDocumentObjects.references(self._search(PdfLinearizer.KIDS_PATTERN, bodies[pageTree], 'No pages').group(1))
+        if len(kids) != 1:
+            raise UnsupportedException(f'Only single page documents can be linearized: `{len(kids)}` pages')
+
+        firstPageObjects: List[int] = self._firstPageObjects(bodies=bodies, page=kids[0], excluded={pageTree, catalog})
+        otherObjects:     List[int] = [
+            objectNumber for objectNumber in sorted(bodies) if objectNumber not in firstPageObjects and objectNumber != catalog
+        ]
+        #
+        # The other objects come first in the numbering;  The first page section numbers come last, starting
+        # with the linearization parameters, the catalog, and the hint stream
+        #
+        firstSectionStart: int = len(otherObjects) + 1
+        parametersNumber:  int = firstSectionStart
+        catalogNumber:     int = firstSectionStart + 1
+        hintNumber:        int = firstSectionStart + 2
+
+        renumbering: Dict[int, int] = {catalog: catalogNumber}
+        for index, objectNumber in enumerate(otherObjects):
+            renumbering[objectNumber] = index + 1
+        for index, objectNumber in enumerate(firstPageObjects):
+            renumbering[objectNumber] = hintNumber + 1 + index
+
+        size: int = hintNumber + 1 + len(firstPageObjects)
+
+        catalogObject:     bytes       = self._renumberObject(bodies[catalog], catalogNumber, renumbering)
+        firstPageSection:  List[bytes] = [self._renumberObject(bodies[objectNumber], renumbering[objectNumber], renumbering) for objectNumber in firstPageObjects]
+        otherSection:      List[bytes] = [self._renumberObject(bodies[objectNumber], renumbering[objectNumber], renumbering) for objectNumber in otherObjects]
+
+        values: Dict[str, int] = {'L': 0, 'H': 0, 'HLength': 0, 'E': 0, 'T': 0, 'Prev': 0, 'FirstXref': 0, 'PageOffset': 0}
+        linearized: bytes = b''
+        for _ in range(2):     # The first pass computes the offsets;  The second one writes them
+            linearized, values = self._layout(header=header, values=values, parametersNumber=parametersNumber,
+                                              catalogObject=catalogObject, hintNumber=hintNumber,
+                                              firstPageSection=firstPageSection, firstPageNumber=renumbering[kids[0]],
+                                              otherSection=otherSection, size=size,
+                                              catalogNumber=catalogNumber, infoNumber=renumbering[info])
+        self.logger.debug(f'Linearized {len(bodies)} objects;  {len(firstPageObjects)} on the first page')
+
+        return linearized
+
+    def _layout(self, header: bytes, values: Dict[str, int], parametersNumber: int, catalogObject: bytes, hintNumber: int,
+                firstPageSection: List[bytes], firstPageNumber: int, otherSection: List[bytes], size: int,
+                catalogNumber: int, infoNumber: int) -> Tuple[bytes, Dict[str, int]]:
+        """
+        Lays out the document with the values of the previous pass.  The values are padded to a fixed width,
+        so the layout does not move when they change
+
+        Returns:  The document and the values that it should have
+        """
+        width: int = PdfLinearizer.PADDED_NUMBER_WIDTH
+
+        parameters: bytes = (
+            f'{parametersNumber} 0 obj\n'
+            f'<</Linearized 1 /L {values["L"]:<{width}} /H [{values["H"]:<{width}} {values["HLength"]:<{width}}] '
+            f'/O {firstPageNumber} /E {values["E"]:<{width}} /N 1 /T {values["T"]:<{width}}>>\n'
+            f'endobj\n'
+        ).encode()
+
+        hintStream:   bytes = self._hintStream(hintNumber=hintNumber, firstPageSection=firstPageSection, pageOffset=values['PageOffset'])
+        firstSection: List[bytes] = [parameters, catalogObject, hintStream] + firstPageSection
+
+        # Only the number of entries changes the size of the first page cross-reference table
+        firstXrefSize: int = len(self._firstXref([0] * len(firstSection), parametersNumber, size, catalogNumber, infoNumber, values['Prev']))
+
+        offset:         int       = len(header) + len(parameters) + firstXrefSize
+        sectionOffsets: List[int] = [len(header)]
+        for pdfObject in firstSection[1:]:
+            sectionOffsets.append(offset)
+            offset += len(pdfObject)
+        firstPageEnd: int = offset
+
+        otherOffsets: List[int] = []
+        for pdfObject in otherSection:
+            otherOffsets.append(offset)
+            offset += len(pdfObject)
+
+        mainXref: bytes = b'xref\n' + f'0 {len(otherSection) + 1}\n'.encode() + b'0000000000 65535 f \n'
+        mainXref += b''.join(f'{otherOffset:010} 00000 n \n'.encode() for otherOffset in otherOffsets)
+        mainXref += f'trailer\n<</Size {len(otherSection) + 1}>>\nstartxref\n{len(header) + len(parameters)}\n%%EOF\n'.encode()
+
+        hintOffset: int = sectionOffsets[2]
+        hintLength: int = len(hintStream)
+        newValues: Dict[str, int] = {
+            'L':          offset + len(mainXref),
+            'H':          hintOffset,
+            'HLength':    hintLength,
+            'E':          firstPageEnd,
+            'T':          offset + len(f'xref\n0 {len(otherSection) + 1}'),     # The end of line before the first entry
+            'Prev':       offset,
+            'FirstXref':  len(header) + len(parameters),
+            'PageOffset': sectionOffsets[3] - hintLength,   # Hint table offsets do not count the hint stream
+        }
+        firstXref: bytes = self._firstXref(sectionOffsets, parametersNumber, size, catalogNumber, infoNumber, values['Prev'])
+
+        document: bytes = header + parameters + firstXref + b''.join(firstSection[1:]) + b''.join(otherSection) + mainXref
+
+        return document, newValues
+
+    def _firstXref(self, sectionOffsets: List[int], parametersNumber: int, size: int, catalogNumber: int, infoNumber: int, mainXrefOffset: int) -> bytes:
+        """
+        The first page cross-reference table;  Its trailer links to the main cross-reference table
+        """
+        firstXref: bytes = f'xref\n{parametersNumber} {len(sectionOffsets)}\n'.encode()
+        firstXref += b''.join(f'{sectionOffset:010} 00000 n \n'.encode() for sectionOffset in sectionOffsets)
+        firstXref += (
+            f'trailer\n<</Size {size} /Root {catalogNumber} 0 R /Info {infoNumber} 0 R '
+            f'/Prev {mainXrefOffset:<{PdfLinearizer.PADDED_NUMBER_WIDTH}}>>\nstartxref\n0\n%%EOF\n'
+        ).encode()
+
+        return firstXref
+
+    def _hintStream(self, hintNumber: int, firstPageSection: List[bytes], pageOffset: int) -> bytes:
+        """
+        The page offset hint table followed by the shared object hint table.  With a single page all the
+        page offset table entries take no bits
+
+        Args:
+            hintNumber:        The hint stream's object number
+            firstPageSection:  The first page objects
+            pageOffset:        Where the page object is, not counting the hint stream
+        """
+        objectLengths: List[int] = [len(pdfObject) for pdfObject in firstPageSection]
+        pageLength:    int       = sum(objectLengths)
+
+        pageTable: bytes = self._packBits([[
+            (len(firstPageSection), 32),   # The least number of objects in a page
+            (pageOffset, 32),               # The location of the first page's page object
+            (0, 16),                        # Bits for the number of objects
+            (pageLength, 32),               # The least page length
+            (0, 16),                        # Bits for the page length
+            (0, 32),                        # The least content stream offset
+            (0, 16),                        # Bits for the content stream offset
+            (pageLength, 32),               # The least content stream length;  Like qpdf, the page length
+            (0, 16),                        # Bits for the content stream length
+            (0, 16),                        # Bits for the number of shared object references
+            (0, 16),                        # Bits for the shared object identifiers
+            (0, 16),                        # Bits for the numerators
+            (PdfLinearizer.SHARED_DENOMINATOR, 16),
+        ]])
+
+        leastLength: int = min(objectLengths)
+        lengthBits:  int = (max(objectLengths) - leastLength).bit_length()
+
+        sharedTable: bytes = self._packBits([
+            [
+                (0, 32),                        # No shared objects section
+                (0, 32),
+                (len(firstPageSection), 32),    # Entries for the first page
+                (len(firstPageSection), 32),    # All the entries
+                (0, 16),                        # Bits for the number of objects in a group;  One each
+                (leastLength, 32),
+                (lengthBits, 16),
+            ],
+            [(objectLength - leastLength, lengthBits) for objectLength in objectLengths],
+            [(0, 1) for _ in objectLengths],    # No signatures
+        ])
+
+        hintTables: bytes = pageTable + sharedTable
+
+        return (
+            f'{hintNumber} 0 obj\n<</S {len(pageTable)} /Length {len(hintTables)}>>\nstream\n'.encode()
+            + hintTables
+            + b'\nendstream\nendobj\n'
+        )
+
+    def _packBits(self, itemGroups: List[BitFields]) -> bytes:
+        """
+        Each group of items starts on a byte boundary
+
+        Args:
+            itemGroups:  The items in table order
+
+        Returns:  The packed table
+        """
+        packed: bytearray = bytearray()
+        for itemGroup in itemGroups:
+            accumulator: int = 0
+            bitCount:    int = 0
+            for value, valueBits in itemGroup:
+                accumulator = (accumulator << valueBits) | value
+                bitCount += valueBits
+            padding: int = (8 - bitCount % 8) % 8
+            packed += (accumulator << padding).to_bytes((bitCount + padding) // 8, 'big')
+
+        return bytes(packed)
+
+    def _firstPageObjects(self, bodies: Dict[int, bytes], page: int, excluded: Set[int]) -> List[int]:
+        """
+        Returns:  The page object and every object that it needs, in document order after the page object
+        """
+        needed:  Set[int]  = {page}
+        pending: List[int] = [page]
+        while len(pending) > 0:
+            for objectNumber in PdfDocumentObjects.references(PdfDocumentObjects.dictionary(bodies[pending.pop()])):
+                if objectNumber not in needed and objectNumber not in excluded:
+                    needed.add(objectNumber)
+                    pending.append(objectNumber)
+
+        return [page] + [objectNumber for objectNumber in sorted(needed) if objectNumber != page]
+
+    def _renumberObject(self, body: bytes, newNumber: int, renumbering: Dict[int, int]) -> bytes:
+        """
+        Only the dictionary part of a stream object can have references
+        """
+        dictionary: bytes = PdfDocumentObjects.dictionary(body)
+
+        def renumber(match: Match) -> bytes:
+            if match.group(1) is None:
+                return match.group(0)
+            return f'{renumbering[int(match.group(1))]} 0 R'.encode()
+
+        renumbered: bytes = PdfDocumentObjects.REFERENCE_PATTERN.sub(renumber, dictionary)
+
+        return f'{newNumber} 0 obj\n'.encode() + renumbered + body[len(dictionary):] + b'endobj\n'
+
+    def _search(self, pattern, data: bytes, failMessage: str) -> Match:
+
+        match: Optional[Match] = pattern.search(data)
+        if match is None:
+            raise UnsupportedException(failMessage)
+
+        return match
@@ -0,0 +1,175 @@
+
+from typing import BinaryIO
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from os import SEEK_END
+
+from re import Match
+from re import compile as regExCompile
+
+
+class PdfPreviousOutput:
+    """
+    What an incremental update needs from an incrementally updatable document written before.  Only the tail of
+    the file, the cross-reference sections, and the page object are read;  So reading costs the same for any size
+    of diagram.  See `read`
+    """
+    PIECE_INFO_NAME: final = 'PyUmlDiagrams'
+    """
+    The application name in the page piece dictionary;  The private data lists the page's segments
+    """
+    PAGE_OBJECT:     final = 3      # fpdf writes the first page first
+    TAIL_SIZE:       final = 1024
+    XREF_ENTRY_SIZE: final = 20
+    READ_SIZE:       final = 64 * 1024
+
+    STARTXREF_PATTERN:  final = regExCompile(rb'startxref\s+(\d+)\s+%%EOF\s*$')
+    SIZE_PATTERN:       final = regExCompile(rb'/Size (\d+)')
+    ROOT_PATTERN:       final = regExCompile(rb'/Root (\d+) 0 R')
+    INFO_PATTERN:       final = regExCompile(rb'/Info (\d+) 0 R')
+    PREV_PATTERN:       final = regExCompile(rb'/Prev (\d+)')
+    CONTENTS_PATTERN:   final = regExCompile(rb'/Contents \[([^\]]*)\]')
+    REFERENCE_PATTERN:  final = regExCompile(rb'(\d+) 0 R')
+    PIECE_INFO_PATTERN: final = regExCompile(rb'/' + PIECE_INFO_NAME.encode() + rb' <<[^>]*/Private <</Settings \(([^)]*)\) /Segments \[([^\]]*)\]>>')
+    KEY_PATTERN:        final = regExCompile(rb'\(([^)]*)\)')
+
+    def __init__(self):
+
+        self.fileSize:    int       = 0
+        self.startXref:   int       = 0             # The offset of the latest cross-reference section
+        self.size:        int       = 0             # One more than the highest object number
+        self.root:        int       = 0
+        self.info:        int       = 0
+        self.settingsKey: str       = ''            # Describes the settings that the document was drawn with
+        self.contents:    List[int] = []            # The page's content streams
+        self.segmentKeys: List[str] = []            # What each content stream draws
+
+    @classmethod
+    def read(cls, fileName: str) -> Optional['PdfPreviousOutput']:
+        """
+        Args:
+            fileName:  Fully qualified file name
+
+        Returns:  None if there is no such file or if it is not an incrementally updatable document
+        """
+        logger: Logger = getLogger(__name__)
+        try:
+            with open(fileName, 'rb') as inputFile:
+                return cls._read(inputFile)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.info(f'Cannot update {fileName} incrementally: {e}')
+            return None
+
+    @classmethod
+    def _read(cls, inputFile: BinaryIO) -> 'PdfPreviousOutput':
+
+        previous: PdfPreviousOutput = PdfPreviousOutput()
+
+        previous.fileSize = inputFile.seek(0, SEEK_END)
+        inputFile.seek(max(0, previous.fileSize - PdfPreviousOutput.TAIL_SIZE))
+
+        previous.startXref = int(cls._search(PdfPreviousOutput.STARTXREF_PATTERN, inputFile.read(), 'No cross-reference table').group(1))
+
+        trailer, pageOffset = cls._findObject(inputFile, previous.startXref, PdfPreviousOutput.PAGE_OBJECT)
+
+        previous.size = int(cls._search(PdfPreviousOutput.SIZE_PATTERN, trailer, 'No trailer size').group(1))
+        previous.root = int(cls._search(PdfPreviousOutput.ROOT_PATTERN, trailer, 'No catalog').group(1))
+        previous.info = int(cls._search(PdfPreviousOutput.INFO_PATTERN, trailer, 'No information dictionary').group(1))
+
+        pageObject: bytes = cls._readObject(inputFile, pageOffset)
+
+        contents:  bytes = cls._search(PdfPreviousOutput.CONTENTS_PATTERN,   pageObject, 'Page has a single content stream').group(1)
+        pieceInfo: Match = cls._search(PdfPreviousOutput.PIECE_INFO_PATTERN, pageObject, 'Page has no segments')
+
+        previous.contents    = [int(objectNumber) for objectNumber in PdfPreviousOutput.REFERENCE_PATTERN.findall(contents)]
+        previous.settingsKey = pieceInfo.group(1).decode()
+        previous.segmentKeys = [key.decode() for key in PdfPreviousOutput.KEY_PATTERN.findall(pieceInfo.group(2))]
+
+        if len(previous.contents) != len(previous.segmentKeys):
+            raise ValueError('Segments do not match the content streams')
+
+        return previous
+
+    @classmethod
+    def _findObject(cls, inputFile: BinaryIO, startXref: int, objectNumber: int) -> Tuple[bytes, int]:
+        """
+        Follow the cross-reference sections from the latest to the first until one has the object
+
+        Returns:  The latest trailer dictionary and the object's offset
+        """
+        trailer:       Optional[bytes] = None
+        objectOffset:  Optional[int]   = None
+        sectionOffset: Optional[int]   = startXref
+        while objectOffset is None and sectionOffset is not None:
+            sectionTrailer, objectOffset = cls._readXrefSection(inputFile, sectionOffset, objectNumber)
+            if trailer is None:
+                trailer = sectionTrailer
+            prevMatch: Optional[Match] = PdfPreviousOutput.PREV_PATTERN.search(sectionTrailer)
+            sectionOffset = None if prevMatch is None else int(prevMatch.group(1))
+
+        if objectOffset is None:
+            raise ValueError(f'No object {objectNumber}')
+
+        return trailer, objectOffset
+
+    @classmethod
+    def _readXrefSection(cls, inputFile: BinaryIO, sectionOffset: int, objectNumber: int) -> Tuple[bytes, Optional[int]]:
+        """
+        Skips over the entries except the one we are looking for
+
+        Returns:  The section's trailer dictionary and the object's offset;  None if the section does not have the object
+        """
+        inputFile.seek(sectionOffset)
+        if inputFile.readline().strip() != b'xref':
+            raise ValueError(f'No cross-reference section at {sectionOffset}')
+
+        objectOffset: Optional[int] = None
+        while True:
+            line: bytes = inputFile.readline().strip()
+            if line == b'trailer':
+                break
+            first, count = (int(value) for value in line.split())
+            entriesStart: int = inputFile.tell()
+            if first <= objectNumber < first + count:
+                inputFile.seek(entriesStart + (objectNumber - first) * PdfPreviousOutput.XREF_ENTRY_SIZE)
+                entry: List[bytes] = inputFile.read(PdfPreviousOutput.XREF_ENTRY_SIZE).split()
+                if entry[2] == b'n':
+                    objectOffset = int(entry[0])
+            inputFile.seek(entriesStart + count * PdfPreviousOutput.XREF_ENTRY_SIZE)
+
+        trailer, found, _ = inputFile.read(PdfPreviousOutput.TAIL_SIZE).partition(b'startxref')
+        if found == b'':
+            raise ValueError(f'No trailer for the cross-reference section at {sectionOffset}')
+
+        return trailer, objectOffset
+
+    @classmethod
+    def _readObject(cls, inputFile: BinaryIO, objectOffset: int) -> bytes:
+
+        inputFile.seek(objectOffset)
+
+        pdfObject: bytes = b''
+        while b'endobj' not in pdfObject:
+            chunk: bytes = inputFile.read(PdfPreviousOutput.READ_SIZE)
+            if chunk == b'':
+                raise ValueError(f'Unterminated object at {objectOffset}')
+            pdfObject += chunk
+
+        return pdfObject[:pdfObject.index(b'endobj')]
+
+    @classmethod
+    def _search(cls, pattern, data: bytes, failMessage: str) -> Match:
+
+        match: Optional[Match] = pattern.search(data)
+        if match is None:
+            raise ValueError(failMessage)
+
+        return match
@@ -0,0 +1,22 @@
+
+from dataclasses import dataclass
+
+
+@dataclass
+class PdfSegment:
+    """
+    One of the content streams of an incrementally updatable page.  A segment either carries new content
+    or refers to a content stream that the document already has
+    """
+    key:          str   = ''
+    """
+    Identifies what the segment draws
+    """
+    content:      bytes = b''
+    """
+    The drawing operators;  Empty when the segment is already in the document
+    """
+    objectNumber: int   = 0
+    """
+    The content stream's object;  Known once the segment is in the document
+    """
@@ -0,0 +1,30 @@
+
+from typing import BinaryIO
+from typing import Union
+
+
+class StreamingBuffer:
+    """
+    Stands in for the in memory document buffer of `FPDF`.  Appended bytes are written to the output stream
+    immediately;  Only the number of bytes written is kept, which is all that `FPDF` needs to compute the
+    object offsets of the cross-reference table
+    """
+    def __init__(self, outputStream: BinaryIO, byteCount: int = 0):
+        """
+
+        Args:
+            outputStream:  A binary file like object
+            byteCount:     The number of bytes already in the output;  Non-zero when appending to a document
+        """
+        self._outputStream: BinaryIO = outputStream
+        self._byteCount:    int      = byteCount
+
+    def __iadd__(self, data: Union[bytes, bytearray]) -> 'StreamingBuffer':
+
+        self._outputStream.write(data)
+        self._byteCount += len(data)
+
+        return self
+
+    def __len__(self) -> int:
+        return self._byteCount
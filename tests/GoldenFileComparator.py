@@ -0,0 +1,254 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from functools import reduce
+
+from hashlib import sha256
+
+from re import DOTALL
+from re import compile as regExCompile
+from re import Pattern
+
+from zlib import decompress
+
+from PIL import Image
+from PIL import ImageChops
+
+BoundingBox = Tuple[int, int, int, int]
+"""
+Syntactic sugar for the left, upper, right, and lower pixel bounds;  The right and lower bounds are exclusive, like Pillow's
+"""
+
+
+@dataclass
+class ImageDifference:
+    sameGeometry:      bool                  = True
+    """
+    False if the images differ in size or mode;  Then nothing else is compared
+    """
+    differingPixels:   int                   = 0
+    """
+    The pixels with a color channel that differs by more than the tolerance
+    """
+    boundingBox:       Optional[BoundingBox] = None
+    """
+    Encloses the differing pixels;  None when there are none
+    """
+    largestDifference: int                   = 0
+    diffImage:         Optional[Image.Image] = field(default=None, repr=False)
+    """
+    The standard image faded, with the differing pixels in red;  None when there are none
+    """
+
+
+class GoldenFileComparator:
+    """
+    Compares generated documents to the standard (golden) files in process, so that the tests neither shell
+    out to `diff` nor need poppler's `pdftotext`.
+
+    PDF files match when their page content streams and their text hash the same.  The content streams are
+    decompressed and their numbers rounded to `NUMBER_PRECISION`, so that the document metadata (creation date,
+    producer) and the last digit of a font metric do not matter.
+
+    PNG files are compared pixel by pixel, so the encoder settings do not matter.  A pixel differs when any of its
+    color channels differs by more than a tolerance;  The images match when no more than a number of pixels
+    differ.  Pillow's band operations do the work, in about ten milliseconds for a 1280x1024 image
+    """
+    NUMBER_PRECISION: int = 1
+
+    DIFF_FADE:  int                  = 64      # The standard image keeps this much of its contrast in the diff image
+    DIFF_COLOR: Tuple[int, int, int] = (255, 0, 0)
+
+    OBJECT_PATTERN:    Pattern = regExCompile(rb'(\d+)\s+\d+\s+obj(.*?)endobj', DOTALL)
+    STREAM_PATTERN:    Pattern = regExCompile(rb'stream\r?\n(.*?)\nendstream', DOTALL)
+    CONTENTS_PATTERN:  Pattern = regExCompile(rb'/Contents\s*(\[[^\]]*\]|\d+\s+\d+\s+R)')
+    REFERENCE_PATTERN: Pattern = regExCompile(rb'(\d+)\s+\d+\s+R')
+    PAGE_PATTERN:      Pattern = regExCompile(rb'/Type\s*/Page\b(?!s)')
+    NUMBER_PATTERN:    Pattern = regExCompile(rb'(?<![\w.])-?\d*\.?\d+(?![\w.])')
+    TEXT_PATTERN:      Pattern = regExCompile(rb'\(((?:\\.|[^\\)])*)\)\s*Tj', DOTALL)
+    ESCAPE_PATTERN:    Pattern = regExCompile(rb'\\([()\\])')
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def comparePdf(self, standardFileName: str, generatedFileName: str) -> bool:
+        """
+        Args:
+            standardFileName:   The golden file
+            generatedFileName:  The file the test wrote
+
+        Returns:  True if the page content and the text are the same
+        """
+        contentSame: bool = self.pdfContentHash(standardFileName) == self.pdfContentHash(generatedFileName)
+        textSame:    bool = self.pdfTextHash(standardFileName) == self.pdfTextHash(generatedFileName)
+        if contentSame is False:
+            self.logger.warning(f'Page content differs: {standardFileName} {generatedFileName}')
+        if textSame is False:
+            self.logger.warning(f'Text differs: {standardFileName} {generatedFileName}')
+
+        return contentSame and textSame
+
+    def comparePng(self, standardFileName: str, generatedFileName: str, tolerance: int = 0, pixelTolerance: int = 0, diffFileName: str = None) -> bool:
+        """
+        Args:
+            standardFileName:   The golden image
+            generatedFileName:  The image the test wrote
+            tolerance:          The largest difference in any color channel of a pixel that still matches
+            pixelTolerance:     The number of pixels that may differ
+            diffFileName:       If not None, where to write the diff image when the images do not match
+
+        Returns:  True if the images have the same size and mode and no more than `pixelTolerance` pixels differ
+        """
+        difference: ImageDifference = self.diffPng(standardFileName=standardFileName, generatedFileName=generatedFileName, tolerance=tolerance)
+        matches:    bool            = difference.sameGeometry is True and difference.differingPixels <= pixelTolerance
+        if matches is False:
+            self.logger.warning(f'Images differ: {standardFileName} {generatedFileName} {difference}')
+            if difference.diffImage is not None and diffFileName is not None:
+                difference.diffImage.save(diffFileName)
+                self.logger.warning(f'Wrote diff image: {diffFileName}')
+
+        return matches
+
+    def diffPng(self, standardFileName: str, generatedFileName: str, tolerance: int = 0) -> ImageDifference:
+        """
+        Args:
+            standardFileName:   The golden image
+            generatedFileName:  The image the test wrote
+            tolerance:          The largest difference in any color channel of a pixel that still matches
+
+        Returns:  How the images differ
+        """
+        with Image.open(standardFileName) as standardImage, Image.open(generatedFileName) as generatedImage:
+            return self.diffImages(standardImage=standardImage, generatedImage=generatedImage, tolerance=tolerance)
+
+    def diffImages(self, standardImage: Image, generatedImage: Image, tolerance: int = 0) -> ImageDifference:
+        """
+        Args:
+            standardImage:   The golden image
+            generatedImage:  The image to compare to it
+            tolerance:       The largest difference in any color channel of a pixel that still matches
+
+        Returns:  How the images differ
+        """
+        if standardImage.size != generatedImage.size or standardImage.mode != generatedImage.mode:
+            self.logger.warning(f'Image geometry differs: {standardImage.size} {standardImage.mode} {generatedImage.size} {generatedImage.mode}')
+            return ImageDifference(sameGeometry=False)
+
+        standardImage  = self.__comparableImage(standardImage)
+        generatedImage = self.__comparableImage(generatedImage)
+
+        difference:       Image                 = ImageChops.difference(standardImage, generatedImage)
+        differenceBounds: Optional[BoundingBox] = difference.getbbox()
+        if differenceBounds is None:
+            return ImageDifference()
+        #
+        # Differences are usually local, so only look at where they are.  A pixel differs by its largest channel
+        # difference;  The lookup table marks the ones over the tolerance
+        #
+        largest: Image = reduce(ImageChops.lighter, difference.crop(differenceBounds).split())
+        mask:    Image = largest.point([0 if value <= tolerance else 255 for value in range(256)])
+
+        largestDifference: int = largest.getextrema()[1]
+        differingPixels:   int = mask.histogram()[255]
+        if differingPixels == 0:
+            return ImageDifference(largestDifference=largestDifference)
+
+        left, upper, right, lower = mask.getbbox()
+        x, y = differenceBounds[:2]
+
+        return ImageDifference(differingPixels=differingPixels,
+                               boundingBox=(left + x, upper + y, right + x, lower + y),
+                               largestDifference=largestDifference,
+                               diffImage=self.__diffImage(standardImage=standardImage, mask=mask, maskBounds=differenceBounds))
+
+    def pdfContentHash(self, fileName: str) -> str:
+        """
+        Args:
+            fileName:  A PDF file
+
+        Returns:  The hash of the normalized content streams of its pages, in page order
+        """
+        digest = sha256()
+        for contentStream in self._pageContentStreams(fileName):
+            normalized: bytes = GoldenFileComparator.NUMBER_PATTERN.sub(self.__roundNumber, contentStream)
+            digest.update(b' '.join(normalized.split()))
+            digest.update(b'\n')
+
+        return digest.hexdigest()
+
+    def pdfTextHash(self, fileName: str) -> str:
+        """
+        Args:
+            fileName:  A PDF file
+
+        Returns:  The hash of the text that its pages show, in drawing order
+        """
+        digest = sha256()
+        for contentStream in self._pageContentStreams(fileName):
+            for text in GoldenFileComparator.TEXT_PATTERN.findall(contentStream):
+                digest.update(GoldenFileComparator.ESCAPE_PATTERN.sub(rb'\1', text))
+                digest.update(b'\n')
+
+        return digest.hexdigest()
+
+    def _pageContentStreams(self, fileName: str) -> List[bytes]:
+        """
+        An incremental update appends new versions of objects, so the last definition of an object number wins
+        """
+        with open(fileName, 'rb') as pdfFile:
+            document: bytes = pdfFile.read()
+
+        objects: Dict[int, bytes] = {int(objectNumber): body for objectNumber, body in GoldenFileComparator.OBJECT_PATTERN.findall(document)}
+
+        contentStreams: List[bytes] = []
+        for body in objects.values():
+            if GoldenFileComparator.PAGE_PATTERN.search(body) is None:
+                continue
+            contents = GoldenFileComparator.CONTENTS_PATTERN.search(body)
+            if contents is None:
+                continue
+            for reference in GoldenFileComparator.REFERENCE_PATTERN.findall(contents.group(1)):
+                contentStreams.append(self.__decodeStream(objects.get(int(reference), b'')))
+
+        return contentStreams
+
+    def __decodeStream(self, body: bytes) -> bytes:
+
+        stream = GoldenFileComparator.STREAM_PATTERN.search(body)
+        if stream is None:
+            return b''
+        data: bytes = stream.group(1)
+        if b'/FlateDecode' in body[:stream.start()]:
+            data = decompress(data)
+
+        return data
+
+    def __roundNumber(self, number) -> bytes:
+        return f'{float(number.group(0)):.{GoldenFileComparator.NUMBER_PRECISION}f}'.encode()
+
+    def __comparableImage(self, image: Image) -> Image:
+        """
+        Palette indices and alpha are not colors that difference can compare
+        """
+        if image.mode in ('L', 'RGB'):
+            return image
+        return image.convert('RGB')
+
+    def __diffImage(self, standardImage: Image, mask: Image, maskBounds: BoundingBox) -> Image:
+
+        fade:      int   = GoldenFileComparator.DIFF_FADE
+        diffImage: Image = standardImage.convert('L').point([255 - fade + value * fade // 255 for value in range(256)]).convert('RGB')
+
+        diffImage.paste(GoldenFileComparator.DIFF_COLOR, maskBounds, mask)
+
+        return diffImage
@@ -1,5 +1,6 @@
 
 from typing import List
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
@@ -10,6 +11,10 @@ from importlib import import_module
 
 from glob import glob
 
+from io import StringIO
+
+from concurrent.futures import ProcessPoolExecutor
+
 from unittest import TestResult
 from unittest import TextTestRunner
 from unittest.suite import TestSuite
@@ -20,6 +25,12 @@ from argparse import ArgumentParser
 from argparse import Namespace
 
 
+ModuleOutcome = Tuple[str, int, int, int]
+"""
+Syntactic sugar for the text report of one test module, the number of tests run, failures, and errors
+"""
+
+
 class TestAll:
     """
     The class that can run our unit tests in various formats
@@ -49,6 +60,30 @@ class TestAll:
         else:
             return 0
 
+    def runParallelTextTestRunner(self, processes: int = None) -> int:
+        """
+        Runs each test module in a pool of processes;  The tests write their files in their own
+        directories, so they do not collide
+
+        Args:
+            processes:  The number of processes;  Defaults to the number of CPUs
+
+        Returns:  1 if any test failed or raised an error, else 0
+        """
+        failures: int = 0
+        errors:   int = 0
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for report, testsRun, moduleFailures, moduleErrors in executor.map(_runTestModule, self.__getTestableModuleNames()):
+                print(report)
+                failures += moduleFailures
+                errors   += moduleErrors
+                self.logger.info(f'Ran {testsRun} tests;  failures={moduleFailures} errors={moduleErrors}')
+
+        if failures != 0 or errors != 0:
+            return 1
+        else:
+            return 0
+
     def runHtmlTestRunner(self) -> int:
 
         runner = HTMLTestRunner(report_name=f'{TestAll.REPORT_NAME}', combine_reports=True, add_timestamp=True)
@@ -123,6 +158,21 @@ class TestAll:
         return testModules
 
 
+def _runTestModule(module: str) -> ModuleOutcome:
+    """
+    Runs in a pool process, so it is a module function;  The runner result does not pickle, so return its counts
+    """
+    from tests.TestBase import TestBase
+
+    TestBase.setUpLogging()
+
+    report:     StringIO   = StringIO()
+    testModule             = import_module(module.replace('/', '.'))
+    status:     TestResult = TextTestRunner(stream=report, verbosity=TestAll.VERBOSITY_VERBOSE).run(testModule.suite())
+
+    return report.getvalue(), status.testsRun, len(status.failures), len(status.errors)
+
+
 def main():
 
     if ".." not in sysPath:
@@ -139,6 +189,12 @@ def main():
                            '--cleanup',
                            action='store_true',
                            help='Clean up generated tests')
+    cliParser.add_argument('-j',
+                           '--jobs',
+                           type=int,
+                           nargs='?',
+                           const=0,
+                           help='Run the test modules in parallel processes;  Without a number, one per CPU')
 
     testAll: TestAll = TestAll()
 
@@ -146,6 +202,8 @@ def main():
 
     if args.produce_html_results:
         status: int = testAll.runHtmlTestRunner()
+    elif args.jobs is not None:
+        status: int = testAll.runParallelTextTestRunner(processes=args.jobs if args.jobs > 0 else None)
     else:
         status: int = testAll.runTextTestRunner()
 
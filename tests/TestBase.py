@@ -4,6 +4,10 @@ import json
 import logging
 import logging.config
 
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
 from unittest import TestCase
 
 from pkg_resources import resource_filename
@@ -42,3 +46,22 @@ class TestBase(TestCase):
         fqFileName = resource_filename(TestBase.RESOURCES_PACKAGE_NAME, JSON_LOGGING_CONFIG_FILENAME)
 
         return fqFileName
+
+    def _setUpOutputDirectory(self):
+        """
+        Gives the test its own directory for the files that it writes, so that tests can run in parallel
+        processes without writing over each other's files.  The directory is removed after the test
+        """
+        outputDirectory: TemporaryDirectory = TemporaryDirectory(prefix=f'{self.id()}-')
+
+        self.addCleanup(outputDirectory.cleanup)
+        self._outputDirectory: str = outputDirectory.name
+
+    def _outputFileName(self, fileName: str) -> str:
+        """
+        Args:
+            fileName:  A file name without a directory
+
+        Returns:  The file name in the test's output directory;  See `_setUpOutputDirectory`
+        """
+        return osPathJoin(self._outputDirectory, fileName)
@@ -0,0 +1,124 @@
+
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from os import utime
+
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyumldiagrams.DiagramCache import DiagramCache
+
+from tests.TestBase import TestBase
+
+
+class TestDiagramCache(TestBase):
+
+    OUTPUT_SIZE: int = 100
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagramCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestDiagramCache.clsLogger
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._cacheDirectory:     str                = osPathJoin(self._temporaryDirectory.name, 'diagramCache')
+
+    def tearDown(self):
+        self._temporaryDirectory.cleanup()
+
+    def testCreatesDirectory(self):
+
+        diagramCache: DiagramCache = DiagramCache(cacheDirectory=self._cacheDirectory)
+
+        self.assertEqual(0, diagramCache.size, 'A new cache should be empty')
+
+    def testStoreRetrieve(self):
+
+        diagramCache: DiagramCache = DiagramCache(cacheDirectory=self._cacheDirectory)
+        output:       bytes        = b'x' * TestDiagramCache.OUTPUT_SIZE
+
+        diagramCache.store('key1', output)
+
+        self.assertEqual(output, diagramCache.retrieve('key1'), 'Should get back what we stored')
+        self.assertEqual(TestDiagramCache.OUTPUT_SIZE, diagramCache.size, 'Incorrect cache size')
+
+    def testMiss(self):
+
+        diagramCache: DiagramCache    = DiagramCache(cacheDirectory=self._cacheDirectory)
+        output:       Optional[bytes] = diagramCache.retrieve('notCached')
+
+        self.assertIsNone(output, 'Should be a cache miss')
+
+    def testEvictLeastRecentlyUsed(self):
+
+        diagramCache: DiagramCache = DiagramCache(cacheDirectory=self._cacheDirectory, maximumSize=2 * TestDiagramCache.OUTPUT_SIZE)
+
+        self._storeAged(diagramCache, key='oldest', age=3)
+        self._storeAged(diagramCache, key='older',  age=2)
+
+        diagramCache.retrieve('oldest')         # Now the most recently used
+        diagramCache.store('newest', b'z' * TestDiagramCache.OUTPUT_SIZE)
+
+        self.assertIsNone(diagramCache.retrieve('older'),     'Least recently used should be evicted')
+        self.assertIsNotNone(diagramCache.retrieve('oldest'), 'Recently used should be kept')
+        self.assertIsNotNone(diagramCache.retrieve('newest'), 'Newest should be kept')
+
+        self.assertEqual(2 * TestDiagramCache.OUTPUT_SIZE, diagramCache.size, 'Cache should be at its maximum size')
+
+    def testShrinkMaximumSize(self):
+
+        diagramCache: DiagramCache = DiagramCache(cacheDirectory=self._cacheDirectory)
+
+        self._storeAged(diagramCache, key='older', age=2)
+        self._storeAged(diagramCache, key='newer', age=1)
+
+        diagramCache.maximumSize = TestDiagramCache.OUTPUT_SIZE
+
+        self.assertIsNone(diagramCache.retrieve('older'),    'Should have been evicted')
+        self.assertIsNotNone(diagramCache.retrieve('newer'), 'Should have been kept')
+
+    def testClear(self):
+
+        diagramCache: DiagramCache = DiagramCache(cacheDirectory=self._cacheDirectory)
+
+        diagramCache.store('key1', b'x' * TestDiagramCache.OUTPUT_SIZE)
+        diagramCache.clear()
+
+        self.assertEqual(0, diagramCache.size, 'Cleared cache should be empty')
+
+    def _storeAged(self, diagramCache: DiagramCache, key: str, age: int):
+        """
+        Store an entry and make it look like it was last used `age` hours ago
+        """
+        diagramCache.store(key, b'y' * TestDiagramCache.OUTPUT_SIZE)
+
+        fqFileName: str = osPathJoin(self._cacheDirectory, f'{key}{DiagramCache.CACHE_FILE_SUFFIX}')
+        lastUsed:   int = 1_000_000_000 - (age * 3600)
+        utime(fqFileName, (lastUsed, lastUsed))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagramCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -130,6 +130,20 @@ class TestDiagramCommon(TestBase):
         self.assertEqual(1122.0, scanPoints.endScan.x, 'Max x is not correct for diamond')
         self.assertEqual(476.0, scanPoints.endScan.y, 'Max y is not correct for diamond')
 
+    def testBuildScanPointsBelowDiagonal(self):
+        """
+        The scan should not mix up x and y when the polygon is lower than it is to the right
+        """
+        lowDiamond: PolygonPoints = [InternalPosition(point.x - 1000.0, point.y) for point in self.diamond]
+
+        scanPoints: ScanPoints = PdfCommon.buildScanPoints(points=lowDiamond)
+
+        self.assertEqual(114.0, scanPoints.startScan.x, 'Minimum X not correct for low diamond')
+        self.assertEqual(460.0, scanPoints.startScan.y, 'Minimum Y not correct for low diamond')
+
+        self.assertEqual(122.0, scanPoints.endScan.x, 'Max x is not correct for low diamond')
+        self.assertEqual(476.0, scanPoints.endScan.y, 'Max y is not correct for low diamond')
+
 
 def suite() -> TestSuite:
     """You need to change the name of the test class here also."""
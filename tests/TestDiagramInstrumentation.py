@@ -0,0 +1,196 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyumldiagrams.BaseDiagram import BaseDiagram
+from pyumldiagrams.DiagramInstrumentation import DiagramInstrumentation
+from pyumldiagrams.DiagramInstrumentation import InstrumentationCounters
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import LinePositions
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import UmlLineDefinition
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from tests.TestBase import TestBase
+
+RecordedSpan = Tuple[str, InstrumentationCounters]
+
+
+class RecordingInstrumentation(DiagramInstrumentation):
+
+    def __init__(self):
+        super().__init__()
+        self.spans: List[RecordedSpan] = []
+
+    def span(self, fileName: str, name: str, seconds: float, counters: InstrumentationCounters):
+        self.spans.append((name, counters))
+
+
+class TestDiagramInstrumentation(TestBase):
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagramInstrumentation.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestDiagramInstrumentation.clsLogger
+
+        self._setUpOutputDirectory()
+
+    def tearDown(self):
+        pass
+
+    def testCountersSince(self):
+
+        mark:     InstrumentationCounters = InstrumentationCounters(primitives=2, textRuns=1)
+        counters: InstrumentationCounters = InstrumentationCounters(primitives=5, textRuns=1, polygonFills=1)
+
+        self.assertEqual(InstrumentationCounters(primitives=3, polygonFills=1), counters.since(mark), 'Incorrect difference')
+
+    def testNotInstrumented(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName('NotInstrumented.pdf'), dpi=72)
+
+        for methodName in BaseDiagram.INSTRUMENTED_METHODS:
+            self.assertNotIn(methodName, diagram.__dict__, f'{methodName} should not be wrapped')
+
+    def testPdfSpans(self):
+
+        fileName:        str                      = self._outputFileName('Instrumented.pdf')
+        diagram:         PdfDiagram               = PdfDiagram(fileName=fileName, dpi=72)
+        instrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        diagram.instrumentation = instrumentation
+        self._drawAggregation(diagram=diagram)
+
+        spanNames: List[str] = [name for name, counters in instrumentation.spans]
+        self.assertEqual(['drawClass', 'drawClass', 'drawUmlLine', 'write'], spanNames, 'Incorrect spans')
+
+        name, classCounters = instrumentation.spans[0]
+        self.assertGreater(classCounters.primitives, 0, 'Drawing a class emits primitives')
+        self.assertEqual(1, classCounters.textRuns, 'The class has only a name')
+
+        name, writeCounters = instrumentation.spans[-1]
+        self.assertEqual(osPath.getsize(fileName), writeCounters.bytesWritten, 'Incorrect bytes written')
+
+    def testImageSpans(self):
+
+        fileName:        str                      = self._outputFileName('Instrumented.png')
+        diagram:         ImageDiagram             = ImageDiagram(fileName=fileName)
+        instrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        diagram.instrumentation = instrumentation
+        self._drawAggregation(diagram=diagram)
+
+        name, lineCounters = instrumentation.spans[2]
+        self.assertEqual(InstrumentationCounters(primitives=2), lineCounters, 'The aggregation diamond is hollow')
+
+        name, writeCounters = instrumentation.spans[-1]
+        self.assertEqual(osPath.getsize(fileName), writeCounters.bytesWritten, 'Incorrect bytes written')
+
+    def testBackendsCountLinesAlike(self):
+
+        for useFormXObjects in [False, True]:
+            for lineType in [LineType.Composition, LineType.Aggregation]:
+                pdfDiagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName('Line.pdf'), dpi=72)
+                pdfDiagram.useFormXObjects = useFormXObjects
+
+                pdfCounters:   InstrumentationCounters = self._countLine(diagram=pdfDiagram, lineType=lineType)
+                imageCounters: InstrumentationCounters = self._countLine(diagram=ImageDiagram(fileName=self._outputFileName('Line.png')), lineType=lineType)
+
+                self.assertEqual(imageCounters, pdfCounters, f'Backends should count alike; {lineType=} {useFormXObjects=}')
+                self.assertEqual(1 if lineType == LineType.Composition else 0, pdfCounters.polygonFills, f'Only the composition diamond is filled; {useFormXObjects=}')
+
+    def testDeferredDrawingCountedByWrite(self):
+
+        diagram:         ImageDiagram             = ImageDiagram(fileName=self._outputFileName('AutoFit.png'), autoFit=True)
+        instrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        diagram.instrumentation = instrumentation
+        self._drawAggregation(diagram=diagram)
+
+        drawnPrimitives: int = sum(counters.primitives for name, counters in instrumentation.spans[:-1])
+        self.assertEqual(0, drawnPrimitives, 'Auto fit queues the drawing')
+
+        directDiagram:         ImageDiagram             = ImageDiagram(fileName=self._outputFileName('Direct.png'))
+        directInstrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        directDiagram.instrumentation = directInstrumentation
+        self._drawAggregation(diagram=directDiagram)
+
+        directPrimitives: int = sum(counters.primitives for name, counters in directInstrumentation.spans[:-1])
+
+        name, writeCounters = instrumentation.spans[-1]
+        self.assertEqual(directPrimitives, writeCounters.primitives, 'Write draws the queued classes and aggregation')
+
+    def testRemoveInstrumentation(self):
+
+        diagram:         PdfDiagram               = PdfDiagram(fileName=self._outputFileName('Removed.pdf'), dpi=72)
+        instrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        diagram.instrumentation = instrumentation
+        diagram.instrumentation = None
+        self._drawAggregation(diagram=diagram)
+
+        self.assertEqual(0, len(instrumentation.spans), 'Removed instrumentation should not receive spans')
+        self.assertNotIn('drawClass', diagram.__dict__, 'Methods should be unwrapped')
+
+    def _countLine(self, diagram: BaseDiagram, lineType: LineType) -> InstrumentationCounters:
+        """
+        Returns:  What drawing a bent line of the type counted
+        """
+        instrumentation: RecordingInstrumentation = RecordingInstrumentation()
+
+        diagram.instrumentation = instrumentation
+
+        linePositions: LinePositions = [Position(600, 208), Position(600, 150), Position(650, 150), Position(650, 93)]
+        diagram.drawUmlLine(lineDefinition=UmlLineDefinition(lineType=lineType, linePositions=linePositions))
+
+        name, counters = instrumentation.spans[0]
+
+        return counters
+
+    def _drawAggregation(self, diagram: BaseDiagram):
+
+        cat:  ClassDefinition = ClassDefinition(name='Gato', position=Position(536, 19), size=Size(height=74, width=113))
+        opie: ClassDefinition = ClassDefinition(name='Opie', position=Position(495, 208), size=Size(width=216, height=87))
+
+        diagram.drawClass(classDefinition=cat)
+        diagram.drawClass(classDefinition=opie)
+
+        linePositions: LinePositions     = [Position(600, 208), Position(600, 93)]
+        opieToCat:     UmlLineDefinition = UmlLineDefinition(lineType=LineType.Aggregation, linePositions=linePositions)
+
+        diagram.drawUmlLine(lineDefinition=opieToCat)
+        diagram.write()
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagramInstrumentation))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
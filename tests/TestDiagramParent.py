@@ -1,8 +1,6 @@
 from datetime import datetime
 from typing import final
 
-from os import system as osSystem
-
 from pkg_resources import resource_filename
 
 from pyumldiagrams.BaseDiagram import BaseDiagram
@@ -21,6 +19,7 @@ from pyumldiagrams.Definitions import UmlLineDefinitions
 
 from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
 
+from tests.GoldenFileComparator import GoldenFileComparator
 from tests.TestBase import TestBase
 from tests.TestBase import BEND_TEST_XML_FILE
 from tests.TestBase import LARGE_CLASS_XML_FILE
@@ -38,10 +37,8 @@ class TestDiagramParent(TestBase):
     BASE_IMAGE_RESOURCE_PACKAGE_NAME: str = f'{BASE_FILES_PACKAGE_NAME}.image'
     BASE_PDF_RESOURCE_PACKAGE_NAME:   str = f'{BASE_FILES_PACKAGE_NAME}.pdf'
 
-    EXTERNAL_DIFF_PROGRAM:    str = 'diff'
-    EXTERNAL_PDF_DIFF_SCRIPT: str = './scripts/diffpdf.sh'
-
     STANDARD_SUFFIX: str = '-Standard'
+    DIFF_SUFFIX:     str = '-Diff'
 
     KNOWABLE_DATE: datetime = datetime(2020, 3, 1, 8, 30)
 
@@ -55,17 +52,18 @@ class TestDiagramParent(TestBase):
         fqFileName: str = resource_filename(TestDiagramParent.BASE_PDF_RESOURCE_PACKAGE_NAME, pdfFileName)
         return fqFileName
 
-    def _runDiff(self, baseFileName: str, standardFileName) -> int:
+    def _compareImages(self, baseFileName: str, standardFileName: str, tolerance: int = 0, pixelTolerance: int = 0, diffFileName: str = None) -> bool:
 
-        status: int = osSystem(f'{TestDiagramParent.EXTERNAL_DIFF_PROGRAM} {baseFileName} {standardFileName}')
+        comparator: GoldenFileComparator = GoldenFileComparator()
 
-        return status
+        return comparator.comparePng(standardFileName=standardFileName, generatedFileName=baseFileName,
+                                     tolerance=tolerance, pixelTolerance=pixelTolerance, diffFileName=diffFileName)
 
-    def _runPdfDiff(self, baseFileName: str, standardFileName) -> int:
+    def _comparePdfs(self, baseFileName: str, standardFileName: str) -> bool:
 
-        status: int = osSystem(f'{TestDiagramParent.EXTERNAL_PDF_DIFF_SCRIPT} {baseFileName} {standardFileName}')
+        comparator: GoldenFileComparator = GoldenFileComparator()
 
-        return status
+        return comparator.comparePdf(standardFileName=standardFileName, generatedFileName=baseFileName)
 
     def _buildCar(self) -> ClassDefinition:
 
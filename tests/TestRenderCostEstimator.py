@@ -0,0 +1,125 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyumldiagrams.DiagramFeatures import DiagramFeatures
+from pyumldiagrams.RenderCostEstimator import CalibrationSample
+from pyumldiagrams.RenderCostEstimator import Coefficients
+from pyumldiagrams.RenderCostEstimator import RenderCostEstimator
+from pyumldiagrams.RenderCostEstimator import RenderEstimate
+from pyumldiagrams.UnsupportedException import UnsupportedException
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import FieldDefinition
+from pyumldiagrams.Definitions import LinePositions
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.Definitions import MethodDefinition
+from pyumldiagrams.Definitions import ParameterDefinition
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import UmlLineDefinition
+
+from tests.TestBase import TestBase
+
+
+class TestRenderCostEstimator(TestBase):
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestRenderCostEstimator.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRenderCostEstimator.clsLogger
+
+        self._setUpOutputDirectory()
+
+    def tearDown(self):
+        pass
+
+    def testFeaturesFromDefinitions(self):
+
+        cat: ClassDefinition = ClassDefinition(name='Cat', position=Position(100, 50), size=Size(width=100, height=80))
+        cat.fields  = [FieldDefinition(name='name', parameterType='str', defaultValue=None)]
+        cat.methods = [MethodDefinition(name='meow', returnType='', parameters=[ParameterDefinition(name='times', parameterType='int', defaultValue='1')])]
+
+        dog: ClassDefinition = ClassDefinition(name='Dog', position=Position(300, 50), size=Size(width=100, height=80))
+
+        linePositions: LinePositions = [Position(300, 90), Position(250, 90), Position(250, 100), Position(200, 100)]
+        lines: List[UmlLineDefinition] = [
+            UmlLineDefinition(lineType=LineType.Inheritance, linePositions=linePositions),
+            UmlLineDefinition(lineType=LineType.Composition, linePositions=linePositions[:2]),
+        ]
+
+        features: DiagramFeatures = DiagramFeatures.fromDefinitions(classDefinitions=[cat, dog], umlLineDefinitions=lines, canvasSize=Size(width=640, height=480))
+
+        self.assertEqual(2, features.classCount, 'Wrong class count')
+        self.assertEqual(4, features.textLines, 'Two names, a field, and a method')
+        self.assertEqual(len('Cat' + 'Dog' + 'namestr' + 'meow' + 'timesint1'), features.textCharacters, 'Missing default values should not count')
+        self.assertEqual(4, features.lineSegments, 'Wrong segment count')
+        self.assertEqual(1, features.decorations, 'Wrong decoration count')
+        self.assertEqual(1, features.compositions, 'Wrong composition count')
+        self.assertEqual(640 * 480, features.canvasPixels, 'Should use the given canvas size')
+
+    def testFitRecoversCoefficients(self):
+
+        expected: Coefficients = {RenderCostEstimator.INTERCEPT: 0.5, 'classCount': 0.02, 'textLines': 0.003, 'compositions': 0.4}
+        samples:  List[CalibrationSample] = []
+        for classCount in [5, 20, 80]:
+            for linesPerClass in [1, 4, 9]:
+                for compositions in [0, classCount // 2, classCount - 1]:
+                    features: DiagramFeatures = DiagramFeatures(classCount=classCount, textLines=classCount * linesPerClass, compositions=compositions)
+                    samples.append((features, RenderCostEstimator.predict(expected, features)))
+
+        fitted: Coefficients = RenderCostEstimator.fit(samples)
+
+        for name, value in fitted.items():
+            self.assertAlmostEqual(expected.get(name, 0.0), value, places=6, msg=f'Wrong coefficient: {name}')
+
+    def testEstimateGrowsWithFeatures(self):
+
+        estimator: RenderCostEstimator = RenderCostEstimator()
+
+        small: RenderEstimate = estimator.estimate(DiagramFeatures(classCount=10, textLines=40, compositions=2, canvasPixels=640 * 480), RenderCostEstimator.PDF_BACKEND)
+        large: RenderEstimate = estimator.estimate(DiagramFeatures(classCount=100, textLines=400, compositions=20, canvasPixels=640 * 480), RenderCostEstimator.PDF_BACKEND)
+
+        self.assertGreater(large.seconds, small.seconds, 'A larger diagram should take longer')
+        self.assertGreater(large.bytes, small.bytes, 'A larger diagram should be larger')
+
+    def testUnknownBackend(self):
+
+        estimator: RenderCostEstimator = RenderCostEstimator()
+
+        self.assertRaises(UnsupportedException, lambda: estimator.estimate(DiagramFeatures(), 'svg'))
+
+    def testSaveLoad(self):
+
+        fileName:  str                 = self._outputFileName('RenderCost.json')
+        estimator: RenderCostEstimator = RenderCostEstimator()
+
+        estimator.save(fileName)
+        loaded: RenderCostEstimator = RenderCostEstimator.load(fileName)
+
+        self.assertEqual(estimator.coefficients, loaded.coefficients, 'Coefficients did not round trip')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestRenderCostEstimator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
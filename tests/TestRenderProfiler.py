@@ -0,0 +1,123 @@
+
+from logging import Logger
+from logging import getLogger
+
+from pstats import Stats
+
+from time import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyumldiagrams.RenderProfiler import PhaseTimes
+from pyumldiagrams.RenderProfiler import RenderProfiler
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from tests.TestBase import TestBase
+
+
+class TestRenderProfiler(TestBase):
+
+    PHASE_SLEEP: float = 0.02   # seconds
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestRenderProfiler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRenderProfiler.clsLogger
+
+        self._setUpOutputDirectory()
+
+    def tearDown(self):
+        pass
+
+    def testNestedPhasesExclusive(self):
+
+        profiler: RenderProfiler = RenderProfiler()
+
+        with profiler.phase(RenderProfiler.ENCODE_PHASE):
+            with profiler.phase(RenderProfiler.DRAW_PHASE):
+                sleep(TestRenderProfiler.PHASE_SLEEP)
+
+        phaseTimes: PhaseTimes = profiler.phaseTimes
+        self.assertGreaterEqual(phaseTimes[RenderProfiler.DRAW_PHASE], TestRenderProfiler.PHASE_SLEEP, 'Inner phase time is missing')
+        self.assertLess(phaseTimes[RenderProfiler.ENCODE_PHASE], TestRenderProfiler.PHASE_SLEEP, 'Outer phase should not count the inner phase')
+
+    def testDiagramScopesProfile(self):
+
+        profiler: RenderProfiler = RenderProfiler()
+        diagram:  PdfDiagram     = PdfDiagram(fileName=self._outputFileName('Profiled.pdf'), dpi=72)
+
+        diagram.profiler = profiler
+        diagram.drawClass(self._buildClass())
+        self.assertTrue(profiler.running, 'The first drawing call should start the profiler')
+
+        diagram.write()
+        self.assertFalse(profiler.running, 'Write should stop the profiler that the diagram started')
+
+        phaseTimes: PhaseTimes = profiler.phaseTimes
+        self.assertGreater(phaseTimes[RenderProfiler.DRAW_PHASE], 0.0, 'No draw time')
+        self.assertGreater(phaseTimes[RenderProfiler.ENCODE_PHASE], 0.0, 'No encode time')
+
+        statsFileName: str = self._outputFileName('Profiled.prof')
+        profiler.dumpStats(statsFileName)
+        self.assertGreater(Stats(statsFileName).total_calls, 0, 'The dump should have the profiled calls')
+
+    def testStartedProfilerKeepsRunning(self):
+
+        profiler: RenderProfiler = RenderProfiler()
+        diagram:  PdfDiagram     = PdfDiagram(fileName=self._outputFileName('Started.pdf'), dpi=72)
+
+        profiler.start()
+        diagram.profiler = profiler
+        diagram.drawClass(self._buildClass())
+        diagram.write()
+
+        self.assertTrue(profiler.running, 'The diagram should not stop a profiler that it did not start')
+        profiler.stop()
+
+    def testSampledStacks(self):
+
+        profiler: RenderProfiler = RenderProfiler(sampleInterval=0.001)
+        diagram:  ImageDiagram   = ImageDiagram(fileName=self._outputFileName('Sampled.png'))
+
+        diagram.profiler = profiler
+        for x in range(4):
+            diagram.drawClass(self._buildClass())
+        diagram.write()
+
+        self.assertGreater(len(profiler.stackSamples), 0, 'Should have sampled the rendering thread')
+
+        foldedFileName: str = self._outputFileName('Sampled.folded')
+        profiler.writeCollapsedStacks(foldedFileName)
+        with open(foldedFileName) as foldedFile:
+            stack, count = foldedFile.readline().rsplit(' ', 1)
+        self.assertIn(';', stack, 'A collapsed stack separates its frames with semicolons')
+
+    def _buildClass(self) -> ClassDefinition:
+        return ClassDefinition(name='Gato', position=Position(536, 19), size=Size(height=74, width=113))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestRenderProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,121 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import DefinitionType
+from pyumldiagrams.Definitions import MethodDefinition
+from pyumldiagrams.Definitions import UmlLineDefinition
+
+from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
+
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+from benchmarks.SyntheticDiagramGenerator import SyntheticDiagramSettings
+
+from tests.TestBase import TestBase
+
+
+class TestSyntheticDiagramGenerator(TestBase):
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSyntheticDiagramGenerator.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestSyntheticDiagramGenerator.clsLogger
+
+        self._setUpOutputDirectory()
+
+    def tearDown(self):
+        pass
+
+    def testSameSeedSameDiagram(self):
+
+        first:  SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(seed=7, classCount=30))
+        second: SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(seed=7, classCount=30))
+
+        self.assertEqual(first.classDefinitions,   second.classDefinitions,   'The same seed should make the same classes')
+        self.assertEqual(first.umlLineDefinitions, second.umlLineDefinitions, 'The same seed should make the same lines')
+
+    def testGenerateAgain(self):
+
+        generator: SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(seed=7, classCount=30))
+        lineDefinitions: List[UmlLineDefinition] = list(generator.umlLineDefinitions)
+
+        generator.generate()
+
+        self.assertEqual(30, len(generator.classDefinitions), 'Generating again should not add classes')
+        self.assertEqual(lineDefinitions, generator.umlLineDefinitions, 'Generating again should start from the seed')
+
+    def testDifferentSeedDifferentDiagram(self):
+
+        first:  SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(seed=7, classCount=30))
+        second: SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(seed=8, classCount=30))
+
+        self.assertNotEqual(first.umlLineDefinitions, second.umlLineDefinitions, 'A different seed should make different lines')
+
+    def testLineProbability(self):
+
+        everyClass: SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(classCount=30, lineProbability=1.0))
+        noClass:    SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(classCount=30, lineProbability=0.0))
+
+        self.assertEqual(29, len(everyClass.umlLineDefinitions), 'Every class but the first should have a line')
+        self.assertEqual(0,  len(noClass.umlLineDefinitions),    'No class should have a line')
+
+    def testXmlRoundTrip(self):
+        """
+        The visibilities are written but `ToClassDefinition` reads every method as public
+        """
+        generator:  SyntheticDiagramGenerator = self._generate(SyntheticDiagramSettings(classCount=12, maximumBends=3))
+        fqFileName: str                       = self._outputFileName('Synthetic.xml')
+
+        generator.writeXml(fqFileName=fqFileName)
+
+        toClassDefinition: ToClassDefinition = ToClassDefinition(fqFileName=fqFileName)
+        toClassDefinition.generateClassDefinitions()
+        toClassDefinition.generateUmlLineDefinitions()
+
+        visibilities: List[DefinitionType] = [methodDef.visibility for classDef in generator.classDefinitions for methodDef in classDef.methods]
+        self.assertIn(DefinitionType.Private, visibilities, 'The seed should make some private methods')
+
+        expectedClasses: List[ClassDefinition] = [self._allPublic(classDef) for classDef in generator.classDefinitions]
+        self.assertEqual(expectedClasses, toClassDefinition.classDefinitions, 'Classes did not round trip')
+        self.assertEqual(generator.umlLineDefinitions, toClassDefinition.umlLineDefinitions, 'Lines did not round trip')
+
+    def _generate(self, settings: SyntheticDiagramSettings) -> SyntheticDiagramGenerator:
+
+        generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(settings)
+        generator.generate()
+
+        return generator
+
+    def _allPublic(self, classDef: ClassDefinition) -> ClassDefinition:
+
+        publicClass: ClassDefinition = ClassDefinition(name=classDef.name, position=classDef.position, size=classDef.size)
+        for methodDef in classDef.methods:
+            publicClass.methods.append(MethodDefinition(name=methodDef.name, visibility=DefinitionType.Public, parameters=methodDef.parameters))
+
+        return publicClass
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSyntheticDiagramGenerator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -5,15 +5,24 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
+from os import path as osPath
 from os import remove as osRemove
 
 from datetime import datetime
 
 from time import strftime
 
+from tempfile import TemporaryDirectory
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from PIL import Image
+from PIL import ImageChops
+from PIL import ImageDraw
+
+from pyumldiagrams.DiagramCache import DiagramCache
+
 from pyumldiagrams.Definitions import ClassDefinition
 from pyumldiagrams.Definitions import ClassDefinitions
 from pyumldiagrams.Definitions import DefinitionType
@@ -23,14 +32,19 @@ from pyumldiagrams.Definitions import LineType
 from pyumldiagrams.Definitions import MethodDefinition
 from pyumldiagrams.Definitions import ParameterDefinition
 from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import RectangleDefinition
 from pyumldiagrams.Definitions import Size
 from pyumldiagrams.Definitions import UmlLineDefinition
 from pyumldiagrams.Definitions import UmlLineDefinitions
 
+from pyumldiagrams.image.ColorMode import ColorMode
 from pyumldiagrams.image.ImageDiagram import ImageDiagram
 from pyumldiagrams.image.ImageFormat import ImageFormat
+from pyumldiagrams.image.ImageSpriteCache import ImageSpriteCache
 from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
 
+from tests.GoldenFileComparator import GoldenFileComparator
+from tests.GoldenFileComparator import ImageDifference
 from tests.TestBase import TestBase
 from tests.TestConstants import TestConstants
 from tests.TestDiagramParent import TestDiagramParent
@@ -55,13 +69,15 @@ class TestImageDiagram(TestDiagramParent):
         self.logger:            Logger = TestImageDiagram.clsLogger
         self.unitTestTimeStamp: datetime = TestDiagramParent.KNOWABLE_DATE
 
+        self._setUpOutputDirectory()
+
     def tearDown(self):
         pass
 
     def testBasic(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-Basic'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram    = ImageDiagram(fileName=f'{fileName}')
         classDef: ClassDefinition = ClassDefinition(name=TestDiagramParent.BASE_TEST_CLASS_NAME,
@@ -77,7 +93,7 @@ class TestImageDiagram(TestDiagramParent):
     def testBasicFields(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicFields'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:         ImageDiagram    = ImageDiagram(fileName=fileName)
         fieldsTestClass: ClassDefinition = ClassDefinition(name='FieldsTestClass', position=Position(226, 102), size=Size(height=156, width=230))
@@ -96,7 +112,7 @@ class TestImageDiagram(TestDiagramParent):
     def testBasicHeader(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicHeader'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}', headerText=TestDiagramParent.UNIT_TEST_HEADER)
         classDef: ClassDefinition = self._buildCar()
@@ -109,7 +125,7 @@ class TestImageDiagram(TestDiagramParent):
     def testBasicMethod(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicMethod'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}')
 
@@ -132,7 +148,7 @@ class TestImageDiagram(TestDiagramParent):
     def testBasicMethods(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicMethods'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}')
 
@@ -146,7 +162,7 @@ class TestImageDiagram(TestDiagramParent):
     def testBends(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-Bends'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram = ImageDiagram(fileName=fileName)
 
@@ -172,7 +188,7 @@ class TestImageDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildBendTestFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BendsFromXmlInput'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram = ImageDiagram(fileName=fileName)
 
@@ -194,7 +210,7 @@ class TestImageDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildBigClassFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BigClass'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram = ImageDiagram(fileName=fileName)
         classDefinitions: ClassDefinitions = toClassDefinition.classDefinitions
@@ -210,7 +226,7 @@ class TestImageDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildNoMethodDisplayClassFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-CaptureShowMethodsFalse'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram = ImageDiagram(fileName=fileName)
         classDefinitions: ClassDefinitions = toClassDefinition.classDefinitions
@@ -224,7 +240,7 @@ class TestImageDiagram(TestDiagramParent):
     def testFillPage(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-FillPage'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}')
 
@@ -246,12 +262,41 @@ class TestImageDiagram(TestDiagramParent):
 
         self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='Fill Page image file should be identical')
 
+    def testFillPageSpriteCache(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-FillPage'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
+
+        spriteCache: ImageSpriteCache = ImageSpriteCache()
+        diagram:     ImageDiagram     = ImageDiagram(fileName=f'{fileName}')
+
+        diagram.spriteCache = spriteCache
+
+        widthInterval:  int = TestImageDiagram.CELL_WIDTH // 10
+        heightInterval: int = TestImageDiagram.CELL_HEIGHT // 10
+
+        for x in range(0, TestImageDiagram.TEST_LAST_X_POSITION):
+            scrX: int = (x * TestImageDiagram.CELL_WIDTH) + (widthInterval * x)
+
+            for y in range(0, TestImageDiagram.TEST_LAST_Y_POSITION):
+
+                scrY: int = (y * TestImageDiagram.CELL_HEIGHT) + (y * heightInterval)
+                classDef: ClassDefinition = ClassDefinition(name=f'{TestImageDiagram.BASE_TEST_CLASS_NAME}{x}{y}',
+                                                            position=Position(scrX, scrY),
+                                                            size=Size(width=TestImageDiagram.CELL_WIDTH, height=TestImageDiagram.CELL_HEIGHT))
+                diagram.drawClass(classDef)
+
+        diagram.write()
+
+        self.assertEqual(1, len(spriteCache), 'All the classes look alike')
+        self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='Sprites should not change the image')
+
     def testMethodParametersDisplay(self):
 
         toClassDefinition: ToClassDefinition = self._buildDisplayMethodParametersTest()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-MethodParametersDisplay'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram:  ImageDiagram = ImageDiagram(fileName=fileName)
 
@@ -271,7 +316,7 @@ class TestImageDiagram(TestDiagramParent):
     def testMinimalInheritance(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-MinimalInheritance'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}')
 
@@ -298,7 +343,7 @@ class TestImageDiagram(TestDiagramParent):
         headerText: str = f'{TestDiagramParent.UNIT_TEST_SOPHISTICATED_HEADER} - {today}'
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-SophisticatedHeader'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}', headerText=headerText)
         classDef: ClassDefinition = self._buildCar()
@@ -312,7 +357,7 @@ class TestImageDiagram(TestDiagramParent):
     def testSophisticatedLayout(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-SophisticatedLayout'
-        fileName: str = f'{baseName}.{ImageFormat.PNG.value}'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
 
         diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}')
 
@@ -335,6 +380,169 @@ class TestImageDiagram(TestDiagramParent):
 
         self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='Sophisticated Layout image file should be identical')
 
+    def testAutoFit(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-AutoFit'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
+
+        diagram: ImageDiagram = ImageDiagram(fileName=f'{fileName}', autoFit=True)
+
+        classDefinitions: ClassDefinitions = [
+            self._buildCar(),
+            self._buildCat(),
+            self._buildOpie(),
+            self._buildNameTestCase(),
+            self._buildElectricCar()
+        ]
+        for classDefinition in classDefinitions:
+            diagram.drawClass(classDefinition=classDefinition)
+
+        lineDefinitions: UmlLineDefinitions = self._buildSophisticatedLineDefinitions()
+        for lineDefinition in lineDefinitions:
+            diagram.drawUmlLine(lineDefinition=lineDefinition)
+
+        diagram.write()
+        #
+        # Opie is the right most class, NamesTestCase is the bottom most;  Both get the margin and gap again
+        #
+        generatedImage: Image = Image.open(fileName)
+        self.assertEqual((848, 564), generatedImage.size, 'Auto fit image is not the expected size')
+        #
+        # The auto fit image should be the top left corner of the fixed size one
+        #
+        standardFileName: str   = self._getFullyQualifiedImagePath(f'{TestConstants.TEST_FILE_NAME}-SophisticatedLayout{TestDiagramParent.STANDARD_SUFFIX}.{ImageFormat.PNG.value}')
+        standardImage:    Image = Image.open(standardFileName).crop((0, 0, 848, 564))
+
+        self.assertIsNone(ImageChops.difference(generatedImage, standardImage).getbbox(), 'Auto fit drawing should match the standard')
+
+        generatedImage.close()
+        osRemove(fileName)
+
+    def testWebPFormat(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-WebPFormat'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.WEBP.value}')
+
+        diagram:  ImageDiagram    = ImageDiagram(fileName=self._outputFileName(baseName), imageFormat=ImageFormat.WEBP)
+        classDef: ClassDefinition = self._buildCar()
+
+        diagram.drawClass(classDef)
+        diagram.write()
+
+        generatedImage: Image = Image.open(fileName)
+        self.assertEqual('WEBP', generatedImage.format, 'Should have written a WebP image')
+
+        generatedImage.close()
+        osRemove(fileName)
+
+    def testPaletteColorMode(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-PaletteColorMode'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
+
+        self._drawMinimalInheritance(fileName=fileName, colorMode=ColorMode.PALETTE)
+
+        generatedImage: Image = Image.open(fileName)
+        self.assertEqual(ColorMode.PALETTE.value, generatedImage.mode, 'Should have written a palette image')
+        self.assertEqual(2, len(generatedImage.getcolors()), 'Should only have the background and line colors')
+
+        generatedImage.close()
+        osRemove(fileName)
+
+    def testGrayscaleColorMode(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-GrayscaleColorMode'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
+
+        self._drawMinimalInheritance(fileName=fileName, colorMode=ColorMode.GRAYSCALE)
+
+        generatedImage: Image = Image.open(fileName)
+        self.assertEqual(ColorMode.GRAYSCALE.value, generatedImage.mode, 'Should have written a grayscale image')
+
+        generatedImage.close()
+        osRemove(fileName)
+
+    def testPixelBuffer(self):
+
+        diagram: ImageDiagram = ImageDiagram(fileName='NotWritten', autoFit=True)
+
+        diagram.drawClass(self._buildCar())
+
+        pixels: memoryview = diagram.pixelBuffer()
+        image:  Image      = diagram.render()
+
+        width, height = image.size
+        self.assertEqual((height, width, 3), pixels.shape, 'RGB pixel buffer is shaped incorrectly')
+        self.assertTrue(pixels.readonly, 'Pixel buffer should be read-only')
+        self.assertEqual(image.tobytes(), pixels.tobytes(), 'Pixel buffer does not match the canvas')
+
+    def testPixelBufferSingleBand(self):
+
+        diagram: ImageDiagram = ImageDiagram(fileName='NotWritten', colorMode=ColorMode.GRAYSCALE, imageSize=Size(width=300, height=200))
+
+        diagram.drawClass(self._buildCat())
+
+        pixels: memoryview = diagram.pixelBuffer()
+
+        self.assertEqual((200, 300), pixels.shape, 'Grayscale pixel buffer is shaped incorrectly')
+
+    def testPixelBufferCopiedOncePerDraw(self):
+
+        diagram: ImageDiagram = ImageDiagram(fileName='NotWritten', imageSize=Size(width=600, height=400))
+
+        diagram.drawClass(self._buildCat())
+
+        pixels: memoryview = diagram.pixelBuffer()
+        self.assertIs(pixels, diagram.pixelBuffer(), 'Should not copy the canvas again')
+
+        diagram.drawRectangle(RectangleDefinition(position=Position(x=20, y=20), size=Size(width=20, height=20)))
+        redrawnPixels: memoryview = diagram.pixelBuffer()
+
+        self.assertIsNot(pixels, redrawnPixels, 'Drawing should release the copy')
+        self.assertFalse(pixels.tobytes() == redrawnPixels.tobytes(), 'The copy should not follow the drawing')
+
+    def testQueuedDrawAfterRender(self):
+
+        with TemporaryDirectory() as cacheDirectory:
+            for autoFit in [True, False]:
+                diagram:  ImageDiagram = self._queuingDiagram(autoFit=autoFit, cacheDirectory=cacheDirectory)
+                expected: ImageDiagram = self._queuingDiagram(autoFit=autoFit, cacheDirectory=cacheDirectory)
+
+                diagram.drawClass(self._buildCat())
+                diagram.render()
+                diagram.drawClass(self._buildOpie())
+
+                expected.drawClass(self._buildCat())
+                expected.drawClass(self._buildOpie())
+
+                rendered:         Image = diagram.render()
+                expectedRendered: Image = expected.render()
+                self.assertEqual(expectedRendered.size, rendered.size, f'Should fit the later class; {autoFit=}')
+                self.assertFalse(expectedRendered.tobytes() != rendered.tobytes(), f'Should draw the later class once and the rest again; {autoFit=}')
+
+    def testDiagramCache(self):
+
+        baseName: str = f'{TestConstants.TEST_FILE_NAME}-Basic'
+        fileName: str = self._outputFileName(f'{baseName}.{ImageFormat.PNG.value}')
+
+        with TemporaryDirectory() as cacheDirectory:
+            diagramCache: DiagramCache = DiagramCache(cacheDirectory=cacheDirectory)
+
+            self._drawCachedBasic(fileName=fileName, diagramCache=diagramCache)
+            cachedSize: int = diagramCache.size
+            self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='Rendered cached image should be identical')
+
+            self._drawCachedBasic(fileName=fileName, diagramCache=diagramCache)
+            self.assertEqual(cachedSize, diagramCache.size, 'Same diagram should have hit the cache')
+            self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='Image from the cache should be identical')
+
+            diagram: ImageDiagram = ImageDiagram(fileName=fileName)
+            diagram.diagramCache = diagramCache
+            diagram.drawClass(self._buildCat())
+            diagram.write()
+            self.assertGreater(diagramCache.size, cachedSize, 'Different diagram should have missed the cache')
+            osRemove(fileName)
+
     UNADJUSTED_NAME: str = '/user/hasii/bogus'
     EXPECTED_SUFFIX: str = f'{ImageFormat.PNG.value}'
     EXPECTED_NAME:   str = f'{UNADJUSTED_NAME}.{EXPECTED_SUFFIX}'
@@ -381,18 +589,121 @@ class TestImageDiagram(TestDiagramParent):
         partialPath: str = '/tests/resources/basefiles/image/'    # needs to match resource package name
         self.assertTrue(partialPath in actualName, 'Name does not match')
 
-    def _assertIdenticalFiles(self, baseName: str, generatedFileName: str, failMessage: str, removeTestFile: bool = True) -> None:
+    def testCompareImagesTolerance(self):
+
+        standardFileName: str = self._getFullyQualifiedImagePath('Test-Basic-Standard.png')
+
+        generatedFileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-BasicNudged.{ImageFormat.PNG.value}')
+
+        with Image.open(standardFileName) as standardImage:
+            nudged: Image = standardImage.copy()
+        red, green, blue = nudged.getpixel((0, 0))
+        nudged.putpixel((0, 0), (red - 3, green, blue))
+        nudged.save(generatedFileName)
+
+        self.assertFalse(self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName), 'One pixel is off')
+        self.assertTrue(self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName, tolerance=3), 'Within the tolerance')
+
+    def testDiffImages(self):
+
+        with Image.open(self._getFullyQualifiedImagePath('Test-Basic-Standard.png')) as standardImage:
+            standardImage.load()
+        changedImage: Image = standardImage.copy()
+        ImageDraw.Draw(changedImage).rectangle([100, 200, 109, 204], fill=(0, 0, 0))
+
+        comparator: GoldenFileComparator = GoldenFileComparator()
+        difference: ImageDifference      = comparator.diffImages(standardImage=standardImage, generatedImage=changedImage)
+
+        self.assertEqual(50, difference.differingPixels, 'Wrong differing pixel count')
+        self.assertEqual((100, 200, 110, 205), difference.boundingBox, 'Wrong bounding box')
+        self.assertEqual(GoldenFileComparator.DIFF_COLOR, difference.diffImage.getpixel((100, 200)), 'Differing pixels should be marked')
+        self.assertNotEqual(GoldenFileComparator.DIFF_COLOR, difference.diffImage.getpixel((0, 0)), 'Matching pixels should not be marked')
+
+        sameDifference: ImageDifference = comparator.diffImages(standardImage=standardImage, generatedImage=standardImage.copy())
+        self.assertEqual(ImageDifference(), sameDifference, 'Identical images have no difference')
+
+    def testCompareImagesPixelTolerance(self):
+
+        standardFileName:  str = self._getFullyQualifiedImagePath('Test-Basic-Standard.png')
+        generatedFileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-BasicSpeck.{ImageFormat.PNG.value}')
+        diffFileName:      str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-BasicSpeck{TestDiagramParent.DIFF_SUFFIX}.{ImageFormat.PNG.value}')
+
+        with Image.open(standardFileName) as standardImage:
+            speckled: Image = standardImage.copy()
+        ImageDraw.Draw(speckled).rectangle([10, 10, 11, 11], fill=(0, 0, 0))
+        speckled.save(generatedFileName)
+
+        self.assertTrue(self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName, pixelTolerance=4, diffFileName=diffFileName),
+                        'Four pixels may differ')
+        self.assertFalse(osPath.exists(diffFileName), 'No diff image for matching images')
+
+        self.assertFalse(self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName, pixelTolerance=3, diffFileName=diffFileName),
+                         'Only three pixels may differ')
+        self.assertTrue(osPath.exists(diffFileName), 'Should write the diff image')
+
+    def testCompareImagesActualFail(self):
+
+        standardFileName:  str = self._getFullyQualifiedImagePath('Test-Basic-Standard.png')
+        generatedFileName: str = self._getFullyQualifiedImagePath('Test-FillPage-Standard.png')
+
+        self.assertFalse(self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName), 'These are different diagrams')
+
+    def _drawCachedBasic(self, fileName: str, diagramCache: DiagramCache):
+
+        diagram:  ImageDiagram    = ImageDiagram(fileName=fileName)
+        classDef: ClassDefinition = ClassDefinition(name=TestDiagramParent.BASE_TEST_CLASS_NAME,
+                                                    size=Size(width=266, height=100),
+                                                    position=Position(x=107, y=30)
+                                                    )
+        diagram.diagramCache = diagramCache
+        diagram.drawClass(classDef)
+        diagram.write()
+
+    def _queuingDiagram(self, autoFit: bool, cacheDirectory: str) -> ImageDiagram:
+        """
+        Returns:  A diagram that queues its drawing until `render`;  Auto fit or a cache queues it
+        """
+        diagram: ImageDiagram = ImageDiagram(fileName='NotWritten', autoFit=autoFit, headerText='Queued Drawing')
+        if autoFit is False:
+            diagram.diagramCache = DiagramCache(cacheDirectory=cacheDirectory)
+
+        return diagram
+
+    def _drawMinimalInheritance(self, fileName: str, colorMode: ColorMode):
+
+        diagram: ImageDiagram = ImageDiagram(fileName=fileName, colorMode=colorMode)
+
+        cat:  ClassDefinition = ClassDefinition(name='Gato', position=Position(536, 19), size=Size(height=74, width=113))
+        opie: ClassDefinition = ClassDefinition(name='Opie', position=Position(495, 208), size=Size(width=216, height=87))
+
+        diagram.drawClass(classDefinition=cat)
+        diagram.drawClass(classDefinition=opie)
+
+        linePositions: LinePositions     = [Position(600, 208), Position(600, 93)]
+        opieToCat:     UmlLineDefinition = UmlLineDefinition(lineType=LineType.Inheritance, linePositions=linePositions)
+
+        diagram.drawUmlLine(lineDefinition=opieToCat)
+        diagram.write()
+
+    def _assertIdenticalFiles(self, baseName: str, generatedFileName: str, failMessage: str, removeTestFile: bool = True,
+                              tolerance: int = 0, pixelTolerance: int = 0) -> None:
         """
-        The side-affect here is that if the assertion passes then this method removes the generated file
+        The side-affect here is that if the assertion passes then this method removes the generated file.  If it
+        fails, the diff image is written to the test's output directory
 
         Args:
             baseName:           The base image file name
             generatedFileName:  The generated image file name
             failMessage:        The message to display if the image files fail comparison
+            tolerance:          The largest difference in any color channel of a pixel that still matches;  Only
+                                loosen it in a test that shows encoder drift
+            pixelTolerance:     The number of pixels that may differ
         """
-        standardFileName: str = self._getFullyQualifiedImagePath(f'{baseName}{TestDiagramParent.STANDARD_SUFFIX}.{ImageFormat.PNG.value}')
-        status:           int = self._runDiff(baseFileName=generatedFileName, standardFileName=standardFileName)
-        self.assertTrue(status == 0, f'{failMessage}')
+        standardFileName: str  = self._getFullyQualifiedImagePath(f'{baseName}{TestDiagramParent.STANDARD_SUFFIX}.{ImageFormat.PNG.value}')
+        diffFileName:     str  = self._outputFileName(f'{baseName}{TestDiagramParent.DIFF_SUFFIX}.{ImageFormat.PNG.value}')
+        identical:        bool = self._compareImages(baseFileName=generatedFileName, standardFileName=standardFileName,
+                                                     tolerance=tolerance, pixelTolerance=pixelTolerance, diffFileName=diffFileName)
+        self.assertTrue(identical, f'{failMessage}')
 
         if removeTestFile is True:
             self.logger.info(f'Removing: {generatedFileName}')
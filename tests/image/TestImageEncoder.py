@@ -0,0 +1,120 @@
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from PIL import Image
+from PIL import ImageColor
+from PIL import ImageDraw
+
+from pyumldiagrams.image.EncoderPreset import EncoderPreset
+from pyumldiagrams.image.ImageEncoder import EncoderOptions
+from pyumldiagrams.image.ImageEncoder import ImageEncoder
+from pyumldiagrams.image.ImageFormat import ImageFormat
+
+from tests.TestBase import TestBase
+
+
+class TestImageEncoder(TestBase):
+    """
+    Pillow reports these names as the format of an image it opened
+    """
+    PILLOW_FORMAT_NAMES = {
+        ImageFormat.PNG:  'PNG',
+        ImageFormat.JPG:  'JPEG',
+        ImageFormat.BMP:  'BMP',
+        ImageFormat.GIF:  'GIF',
+        ImageFormat.WEBP: 'WEBP',
+        ImageFormat.TIFF: 'TIFF',
+    }
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestImageEncoder.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestImageEncoder.clsLogger
+
+        self._image: Image = Image.new(mode='RGB', size=(200, 100), color=ImageColor.getrgb('LightYellow'))
+
+        imgDraw: ImageDraw = ImageDraw.Draw(self._image)
+        imgDraw.rectangle(xy=[10, 10, 150, 80], fill=None, outline='Black', width=1)
+        imgDraw.text(xy=[20, 20], fill='Black', text='TestClassName')
+
+    def tearDown(self):
+        pass
+
+    def testDefaultPresetOptions(self):
+
+        encoder: ImageEncoder = ImageEncoder(imageFormat=ImageFormat.PNG)
+
+        self.assertEqual({}, encoder.encoderOptions, 'Default preset should use the Pillow defaults')
+
+    def testFastPresetOptions(self):
+
+        encoder: ImageEncoder = ImageEncoder(imageFormat=ImageFormat.PNG, preset=EncoderPreset.FAST)
+
+        self.assertEqual({'compress_level': 1}, encoder.encoderOptions, 'Incorrect fast PNG options')
+
+    def testOptionsOverridePreset(self):
+
+        encoder: ImageEncoder = ImageEncoder(imageFormat=ImageFormat.WEBP, preset=EncoderPreset.SMALL, options={'method': 4})
+
+        expectedOptions: EncoderOptions = {'lossless': True, 'quality': 100, 'method': 4}
+        self.assertEqual(expectedOptions, encoder.encoderOptions, 'Caller options should override the preset')
+
+    def testEncodeAllFormats(self):
+
+        for imageFormat in ImageFormat:
+            for preset in EncoderPreset:
+                encoder: ImageEncoder = ImageEncoder(imageFormat=imageFormat, preset=preset)
+                buffer:  BytesIO      = BytesIO()
+
+                encoder.encode(image=self._image, fp=buffer)
+
+                buffer.seek(0)
+                encodedImage: Image = Image.open(buffer)
+                self.assertEqual(TestImageEncoder.PILLOW_FORMAT_NAMES[imageFormat], encodedImage.format, f'Bad encoding for {imageFormat} {preset}')
+                self.assertEqual(self._image.size, encodedImage.size, f'Bad size for {imageFormat} {preset}')
+
+    def testJpegFromPaletteImage(self):
+
+        encoder: ImageEncoder = ImageEncoder(imageFormat=ImageFormat.JPG)
+        buffer:  BytesIO      = BytesIO()
+
+        encoder.encode(image=self._image.convert('P'), fp=buffer)
+
+        buffer.seek(0)
+        self.assertEqual('RGB', Image.open(buffer).mode, 'Palette images should be converted for JPEG')
+
+    def testSmallPresetUsesPalette(self):
+
+        encoder: ImageEncoder = ImageEncoder(imageFormat=ImageFormat.PNG, preset=EncoderPreset.SMALL)
+        buffer:  BytesIO      = BytesIO()
+
+        encoder.encode(image=self._image, fp=buffer)
+
+        buffer.seek(0)
+        self.assertEqual('P', Image.open(buffer).mode, 'Small PNG should be palette based')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestImageEncoder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
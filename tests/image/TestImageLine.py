@@ -74,11 +74,13 @@ class TestImageLine(TestBase):
     def setUp(self):
         self.logger: Logger = TestImageLine.clsLogger
 
+        self._setUpOutputDirectory()
+
     def tearDown(self):
         pass
 
     def testOrthogonalInheritanceLines(self):
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalInheritanceLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalInheritanceLines.{ImageFormat.PNG.value}'))
 
         self._drawHorizontalBoundaries(diagram)
         self._drawVerticalBoundaries(diagram)
@@ -96,7 +98,7 @@ class TestImageLine(TestBase):
 
     def testDiagonalInheritanceLines(self):
 
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalInheritanceLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalInheritanceLines.{ImageFormat.PNG.value}'))
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: ImageLine = ImageLine(docWriter=diagram._imgDraw, diagramPadding=diagram._diagramPadding)
@@ -111,7 +113,7 @@ class TestImageLine(TestBase):
 
     def testOrthogonalCompositionLines(self):
 
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalCompositionLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalCompositionLines.{ImageFormat.PNG.value}'))
 
         self._drawHorizontalBoundaries(diagram)
         self._drawVerticalBoundaries(diagram)
@@ -130,7 +132,7 @@ class TestImageLine(TestBase):
 
     def testDiagonalCompositionLines(self):
 
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalCompositionLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalCompositionLines.{ImageFormat.PNG.value}'))
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: ImageLine = ImageLine(docWriter=diagram._imgDraw, diagramPadding=diagram._diagramPadding)
@@ -143,7 +145,7 @@ class TestImageLine(TestBase):
 
     def testOrthogonalAggregationLines(self):
 
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalAggregationLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalAggregationLines.{ImageFormat.PNG.value}'))
 
         self._drawHorizontalBoundaries(diagram)
         self._drawVerticalBoundaries(diagram)
@@ -161,7 +163,7 @@ class TestImageLine(TestBase):
 
     def testDiagonalAggregationLines(self):
 
-        diagram: ImageDiagram = ImageDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalAggregationLines.{ImageFormat.PNG.value}')
+        diagram: ImageDiagram = ImageDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalAggregationLines.{ImageFormat.PNG.value}'))
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: ImageLine = ImageLine(docWriter=diagram._imgDraw, diagramPadding=diagram._diagramPadding)
@@ -0,0 +1,104 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from PIL import Image
+
+from pyumldiagrams.image.ImageSpriteCache import ClassSprite
+from pyumldiagrams.image.ImageSpriteCache import ImageSpriteCache
+
+from tests.TestBase import TestBase
+
+
+class TestImageSpriteCache(TestBase):
+
+    SPRITE_WIDTH:  int = 10
+    SPRITE_HEIGHT: int = 10
+    SPRITE_BYTES:  int = SPRITE_WIDTH * SPRITE_HEIGHT * 4     # RGB plus the mask
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestImageSpriteCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestImageSpriteCache.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testStoreRetrieve(self):
+
+        spriteCache: ImageSpriteCache = ImageSpriteCache()
+        sprite:      ClassSprite      = self._buildSprite()
+
+        spriteCache.store('key1', sprite)
+
+        self.assertIs(sprite, spriteCache.retrieve('key1'), 'Should get back what we stored')
+        self.assertIsNone(spriteCache.retrieve('key2'), 'Should be a miss')
+
+        self.assertEqual(1, spriteCache.hits,   'Incorrect hit count')
+        self.assertEqual(1, spriteCache.misses, 'Incorrect miss count')
+        self.assertEqual(TestImageSpriteCache.SPRITE_BYTES, spriteCache.size, 'Incorrect cache size')
+
+    def testEvictLeastRecentlyUsed(self):
+
+        spriteCache: ImageSpriteCache = ImageSpriteCache(maximumSize=2 * TestImageSpriteCache.SPRITE_BYTES)
+
+        spriteCache.store('oldest', self._buildSprite())
+        spriteCache.store('older',  self._buildSprite())
+        spriteCache.retrieve('oldest')                     # Now the most recently used
+        spriteCache.store('newest', self._buildSprite())
+
+        self.assertEqual(2, len(spriteCache), 'Cache should be at its maximum size')
+        self.assertIsNone(spriteCache.retrieve('older'),     'Least recently used should be evicted')
+        self.assertIsNotNone(spriteCache.retrieve('oldest'), 'Recently used should be kept')
+
+    def testReplace(self):
+
+        spriteCache: ImageSpriteCache = ImageSpriteCache()
+
+        spriteCache.store('key1', self._buildSprite())
+        spriteCache.store('key1', self._buildSprite())
+
+        self.assertEqual(TestImageSpriteCache.SPRITE_BYTES, spriteCache.size, 'Replaced sprite should not be counted')
+
+    def testClear(self):
+
+        spriteCache: ImageSpriteCache = ImageSpriteCache()
+
+        spriteCache.store('key1', self._buildSprite())
+        spriteCache.clear()
+
+        self.assertEqual(0, len(spriteCache),  'Cleared cache should be empty')
+        self.assertEqual(0, spriteCache.size, 'Cleared cache should have no size')
+
+    def testProcessCache(self):
+
+        self.assertIs(ImageSpriteCache.processCache(), ImageSpriteCache.processCache(), 'Should be shared')
+
+    def _buildSprite(self) -> ClassSprite:
+
+        size = (TestImageSpriteCache.SPRITE_WIDTH, TestImageSpriteCache.SPRITE_HEIGHT)
+
+        return ClassSprite(image=Image.new(mode='RGB', size=size), mask=Image.new(mode='L', size=size))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestImageSpriteCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
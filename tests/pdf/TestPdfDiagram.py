@@ -1,4 +1,5 @@
 from typing import List
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -6,11 +7,20 @@ from logging import getLogger
 
 from os import remove as osRemove
 
+from re import search
+
 from datetime import datetime
 
+from zlib import decompress
+
+from tempfile import TemporaryDirectory
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from pyumldiagrams.DiagramCache import DiagramCache
+from pyumldiagrams.UnsupportedException import UnsupportedException
+
 from pyumldiagrams.Definitions import ClassDefinition
 from pyumldiagrams.Definitions import ClassDefinitions
 from pyumldiagrams.Definitions import DefinitionType
@@ -25,6 +35,7 @@ from pyumldiagrams.Definitions import Position
 from pyumldiagrams.Definitions import Size
 
 from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+from pyumldiagrams.pdf.PdfPreviousOutput import PdfPreviousOutput
 from pyumldiagrams.xmlsupport.ToClassDefinition import ToClassDefinition
 
 from tests.TestBase import TestBase
@@ -55,6 +66,8 @@ class TestPdfDiagram(TestDiagramParent):
         self.logger:            Logger   = TestPdfDiagram.clsLogger
         self.unitTestTimeStamp: datetime = TestDiagramParent.KNOWABLE_DATE
 
+        self._setUpOutputDirectory()
+
     def tearDown(self):
         pass
 
@@ -89,7 +102,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBasic(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-Basic'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram      = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
         classDef: ClassDefinition = ClassDefinition(name=TestDiagramParent.BASE_TEST_CLASS_NAME,
@@ -104,7 +117,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBasicFields(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicFields'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
 
@@ -126,7 +139,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBasicHeader(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicHeader'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}',
                                          dpi=TestConstants.TEST_DPI,
@@ -142,7 +155,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBasicMethod(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicMethod'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}', dpi=TestConstants.TEST_DPI)
 
@@ -168,7 +181,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBasicMethods(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BasicMethods'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}', dpi=TestConstants.TEST_DPI)
 
@@ -183,7 +196,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testBends(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-Bends'
-        fileName: str  = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str  = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
 
@@ -210,7 +223,7 @@ class TestPdfDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildBendTestFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BendsFromXmlInput'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
 
@@ -233,7 +246,7 @@ class TestPdfDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildBigClassFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-BigClass'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
 
@@ -249,7 +262,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testMethodReprRegression(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-MethodReprRegression'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
 
@@ -272,7 +285,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testFillPage(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-FillPage'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}', dpi=TestConstants.TEST_DPI)
 
@@ -300,7 +313,7 @@ class TestPdfDiagram(TestDiagramParent):
         today = self.unitTestTimeStamp.strftime("%d %b %Y %H:%M:%S")
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-SophisticatedHeader'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=fileName,
                                          dpi=TestConstants.TEST_DPI,
@@ -317,7 +330,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testSophisticatedLayout(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-SophisticatedLayout'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}', dpi=TestConstants.TEST_DPI)
 
@@ -343,7 +356,7 @@ class TestPdfDiagram(TestDiagramParent):
     def testMinimalInheritance(self):
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-MinimalInheritance'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram: PdfDiagram = PdfDiagram(fileName=f'{fileName}', dpi=75)
 
@@ -367,7 +380,7 @@ class TestPdfDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildDisplayMethodParametersTest()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-MethodParametersDisplay'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, docDisplayMethodParameters=DisplayMethodParameters.UNSPECIFIED,
                                           dpi=TestConstants.TEST_DPI)
@@ -392,7 +405,7 @@ class TestPdfDiagram(TestDiagramParent):
         toClassDefinition: ToClassDefinition = self._buildNoMethodDisplayClassFromXml()
 
         baseName: str = f'{TestConstants.TEST_FILE_NAME}-CaptureShowMethodsFalse'
-        fileName: str = f'{baseName}{TestConstants.TEST_SUFFIX}'
+        fileName: str = self._outputFileName(f'{baseName}{TestConstants.TEST_SUFFIX}')
 
         diagram:  PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
         classDefinitions: ClassDefinitions = toClassDefinition.classDefinitions
@@ -404,6 +417,243 @@ class TestPdfDiagram(TestDiagramParent):
 
         self._assertIdenticalFiles(baseName=baseName, generatedFileName=fileName, failMessage='CaptureShowMethodsFalse should be identical')
 
+    def testDiagramCache(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagramCache{TestConstants.TEST_SUFFIX}')
+
+        self._drawCachedText(fileName=fileName, diagramCache=None)
+        uncachedOutput: bytes = self._readAndRemove(fileName)
+
+        with TemporaryDirectory() as cacheDirectory:
+            diagramCache: DiagramCache = DiagramCache(cacheDirectory=cacheDirectory)
+
+            self._drawCachedText(fileName=fileName, diagramCache=diagramCache)
+            renderedOutput: bytes = self._readAndRemove(fileName)
+            cachedSize:     int   = diagramCache.size
+
+            self._drawCachedText(fileName=fileName, diagramCache=diagramCache)
+            cachedOutput: bytes = self._readAndRemove(fileName)
+
+            self.assertEqual(uncachedOutput, renderedOutput, 'Deferred drawing should not change the document')
+            self.assertEqual(uncachedOutput, cachedOutput,   'Document from the cache should be identical')
+            self.assertEqual(cachedSize, diagramCache.size,  'Same diagram should have hit the cache')
+
+    def testDiagramCacheNeedsTimeStamp(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagramCacheNoTimeStamp{TestConstants.TEST_SUFFIX}')
+
+        with TemporaryDirectory() as cacheDirectory:
+            diagramCache: DiagramCache = DiagramCache(cacheDirectory=cacheDirectory)
+
+            diagram: PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
+
+            diagram.diagramCache = diagramCache
+            diagram.drawClass(self._buildCar())
+            diagram.write()
+            self._readAndRemove(fileName)
+
+            self.assertEqual(0, diagramCache.size, 'Should not cache a document that carries its write time')
+
+    def testStreamOutput(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-StreamOutput{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=1, headerText=TestDiagramParent.UNIT_TEST_HEADER).write()
+        inMemoryOutput: bytes = self._readAndRemove(fileName)
+
+        diagram: PdfDiagram = self._drawFleet(fileName=fileName, count=1, headerText=TestDiagramParent.UNIT_TEST_HEADER, streamOutput=True)
+        diagram.write()
+        streamedOutput: bytes = self._readAndRemove(fileName)
+
+        self.assertEqual(inMemoryOutput, streamedOutput, 'Streaming should not change the document')
+        self.assertEqual(0, len(diagram._pdf.pages[1]['content']), 'Written page content should be released')
+
+    def testLinearize(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-Linearize{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=1, headerText=TestDiagramParent.UNIT_TEST_HEADER, linearize=True).write()
+        linearizedOutput: bytes = self._readAndRemove(fileName)
+
+        parameters = search(rb'<</Linearized 1 /L (\d+) +/H \[(\d+) +\d+ *\] /O (\d+) /E (\d+)', linearizedOutput[:1024])
+        self.assertIsNotNone(parameters, 'The linearization parameters should come first')
+
+        fileLength, hintOffset, pageObject, firstPageEnd = (int(value) for value in parameters.groups())
+        self.assertEqual(len(linearizedOutput), fileLength, 'Incorrect file length')
+        self.assertTrue(linearizedOutput[hintOffset:].startswith(b'5 0 obj'), 'Hint stream should follow the catalog')
+        self.assertLess(linearizedOutput.index(f'\n{pageObject} 0 obj'.encode()), firstPageEnd, 'The page should be in the first page section')
+
+    def testLinearizeIncrementalUnsupported(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+
+        diagram.linearize          = True
+        diagram.incrementalUpdates = True
+
+        self.assertRaises(UnsupportedException, diagram.write)
+
+    def testCompressionLevel(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-CompressionLevel{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=3, compressionLevel=0).write()
+        uncompressedOutput: bytes = self._readAndRemove(fileName)
+
+        self._drawFleet(fileName=fileName, count=3, compressionLevel=9).write()
+        compressedOutput: bytes = self._readAndRemove(fileName)
+
+        self.assertNotIn(b'/FlateDecode', uncompressedOutput, 'Level 0 should not compress')
+        self.assertLess(len(compressedOutput), len(uncompressedOutput), 'Compression should make a smaller document')
+
+    def testCompressionLevelUnsupported(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+
+        self.assertRaises(UnsupportedException, lambda: setattr(diagram, 'compressionLevel', 10))
+
+    def testObjectStreams(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-ObjectStreams{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=3).write()
+        plainOutput: bytes = self._readAndRemove(fileName)
+
+        self._drawFleet(fileName=fileName, count=3, compressedXref=True).write()
+        compressedXrefOutput: bytes = self._readAndRemove(fileName)
+
+        self._drawFleet(fileName=fileName, count=3, objectStreams=True).write()
+        objectStreamsOutput: bytes = self._readAndRemove(fileName)
+
+        for output in [compressedXrefOutput, objectStreamsOutput]:
+            self.assertTrue(output.startswith(b'%PDF-1.5'), 'Cross-reference streams need PDF 1.5')
+            self.assertIn(b'/Type /XRef', output, 'Should have a cross-reference stream')
+            self.assertNotIn(b'\ntrailer\n', output, 'Should not have a cross-reference table')
+
+        self.assertIn(b'/Type /ObjStm', objectStreamsOutput, 'Should have an object stream')
+        self.assertNotIn(b'/Type /Page', objectStreamsOutput, 'The page should be in the object stream')
+        self.assertLess(len(compressedXrefOutput), len(plainOutput),       'Compressed cross-reference table should be smaller')
+        self.assertLess(len(objectStreamsOutput),  len(compressedXrefOutput), 'Object streams should be smaller')
+
+    def testObjectStreamsLinearizedUnsupported(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-ObjectStreamsLinearized{TestConstants.TEST_SUFFIX}')
+
+        diagram: PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI)
+
+        diagram.linearize     = True
+        diagram.objectStreams = True
+
+        self.assertRaises(UnsupportedException, diagram.write)
+
+    def testRenderProcesses(self):
+
+        fileName:   str            = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-RenderProcesses{TestConstants.TEST_SUFFIX}')
+        fleetLines: List[LineType] = [LineType.Aggregation, LineType.Composition]
+        fleetCount: int            = PdfDiagram.MINIMUM_DEFINITIONS_PER_PROCESS    # Each class and its two lines;  Enough for two processes
+
+        for useFormXObjects in [False, True]:
+            self._drawFleet(fileName=fileName, count=fleetCount, lineTypes=fleetLines, useFormXObjects=useFormXObjects, renderProcesses=1).write()
+            serialOutput: bytes = self._readAndRemove(fileName)
+
+            self._drawFleet(fileName=fileName, count=fleetCount, lineTypes=fleetLines, useFormXObjects=useFormXObjects, renderProcesses=2).write()
+            parallelOutput: bytes = self._readAndRemove(fileName)
+
+            self.assertEqual(serialOutput, parallelOutput, f'Render processes should not change the document; {useFormXObjects=}')
+
+    def testRenderProcessCount(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+        diagram.renderProcesses = 4
+
+        minimum: int = PdfDiagram.MINIMUM_DEFINITIONS_PER_PROCESS
+        self.assertLess(diagram._renderProcessCount(definitionCount=(2 * minimum) - 1), 2, 'Small diagrams should draw in this process')
+        self.assertEqual(3, diagram._renderProcessCount(definitionCount=3 * minimum), 'Each process should get enough definitions')
+        self.assertEqual(4, diagram._renderProcessCount(definitionCount=10 * minimum), 'Should not start more than the render processes')
+
+    def testRenderProcessesUnsupported(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+
+        self.assertRaises(UnsupportedException, lambda: setattr(diagram, 'renderProcesses', 0))
+
+    def testIncrementalUpdate(self):
+
+        fileName:      str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-IncrementalUpdate{TestConstants.TEST_SUFFIX}')
+        freshFileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-IncrementalFresh{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=6, lineTypes=[LineType.Aggregation], incrementalUpdates=True).write()
+        with open(fileName, 'rb') as originalFile:
+            originalOutput: bytes = originalFile.read()
+
+        self._drawFleet(fileName=fileName, count=6, lineTypes=[LineType.Aggregation], edited=True, incrementalUpdates=True).write()
+        self._drawFleet(fileName=freshFileName, count=6, lineTypes=[LineType.Aggregation], edited=True, incrementalUpdates=True).write()
+
+        updatedPage: Tuple[List[str], bytes] = self._readSegmentedPage(fileName)
+        freshPage:   Tuple[List[str], bytes] = self._readSegmentedPage(freshFileName)
+        updatedOutput: bytes = self._readAndRemove(fileName)
+        self._readAndRemove(freshFileName)
+
+        self.assertTrue(updatedOutput.startswith(originalOutput), 'The update should be appended')
+        self.assertEqual(freshPage, updatedPage, 'The updated page should draw the edited diagram')
+        self.assertLess(len(updatedOutput) - len(originalOutput), len(originalOutput) / 2, 'The update should be smaller than the diagram')
+
+    def testIncrementalUpToDate(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-IncrementalUpToDate{TestConstants.TEST_SUFFIX}')
+
+        self._drawFleet(fileName=fileName, count=6, lineTypes=[LineType.Aggregation], incrementalUpdates=True).write()
+        with open(fileName, 'rb') as originalFile:
+            originalOutput: bytes = originalFile.read()
+
+        self._drawFleet(fileName=fileName, count=6, lineTypes=[LineType.Aggregation], incrementalUpdates=True).write()
+
+        self.assertEqual(originalOutput, self._readAndRemove(fileName), 'Nothing to update')
+
+    def testFormXObjects(self):
+
+        fileName: str = self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-FormXObjects{TestConstants.TEST_SUFFIX}')
+
+        directDiagram: PdfDiagram = self._drawFleet(fileName=fileName, count=2, lineTypes=[LineType.Inheritance], useFormXObjects=False)
+        directContent: bytes      = bytes(directDiagram._pdf.pages[1]['content'])
+        directDiagram.write()
+        directOutput: bytes = self._readAndRemove(fileName)
+
+        formDiagram: PdfDiagram = self._drawFleet(fileName=fileName, count=2, lineTypes=[LineType.Inheritance], useFormXObjects=True)
+        formContent: bytes      = bytes(formDiagram._pdf.pages[1]['content'])
+        formDiagram.write()
+        formOutput: bytes = self._readAndRemove(fileName)
+
+        self.assertEqual(0, directOutput.count(b'/Subtype /Form'), 'Forms are optional')
+        self.assertEqual(2, formOutput.count(b'/Subtype /Form'),   'Should define one class form and one arrow form')
+        self.assertEqual(4, formContent.count(b' Do '),            'Should place every class and arrow')
+        self.assertLess(len(formContent), len(directContent),      'Forms should shrink the page content')
+
+    def testCompartmentTextObjects(self):
+
+        diagram:  PdfDiagram      = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+        classDef: ClassDefinition = self._buildCar()
+
+        contentStart: int = len(diagram._pdf.pages[1]['content'])
+        diagram.drawClass(classDef)
+        content: bytes = bytes(diagram._pdf.pages[1]['content'][contentStart:])
+
+        self.assertEqual(2, content.count(b'BT '), 'Should have one text object for the name and one for the methods')
+        self.assertEqual(1 + len(classDef.methods), content.count(b') Tj'), 'Should still show every line')
+
+    def testCoordinatePrecision(self):
+
+        wholePoints: bytes = self._drawCarContent(coordinatePrecision=0)
+        twoDecimals: bytes = self._drawCarContent(coordinatePrecision=2)
+
+        self.assertIsNone(search(rb'\d\.\d+ [a-zA-Z]', wholePoints), 'Should only have whole point coordinates')
+        self.assertLess(len(wholePoints), len(twoDecimals), 'Fewer decimals should make less content')
+
+    def testCoordinatePrecisionUnsupported(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+
+        self.assertRaises(UnsupportedException, lambda: setattr(diagram, 'coordinatePrecision', 4))
+
     def testGetFullyQualifiedPdfPath(self):
 
         self.logger.warning(f'{TestDiagramParent.BASE_PDF_RESOURCE_PACKAGE_NAME}')
@@ -413,25 +663,134 @@ class TestPdfDiagram(TestDiagramParent):
         partialPath: str = '/tests/resources/basefiles/pdf/'    # needs to match resource package name
         self.assertTrue(partialPath in actualName, 'Name does not match')
 
-    def testRunDiffBogusFail(self):
+    def testComparePdfsBogusFail(self):
+
+        standardFileName: str = self._getFullyQualifiedPdfPath('Test-Basic-Standard.pdf')
+
+        self.assertRaises(FileNotFoundError, lambda: self._comparePdfs(baseFileName='bogus', standardFileName=standardFileName))
+
+    def testComparePdfsActualFail(self):
+
+        standardFileName:  str = self._getFullyQualifiedPdfPath('Test-Basic-Standard.pdf')
+        generatedFileName: str = self._getFullyQualifiedPdfPath('Test-BasicHeader-Standard.pdf')
+
+        identical: bool = self._comparePdfs(baseFileName=generatedFileName, standardFileName=standardFileName)
+        self.assertFalse(identical, 'These are different diagrams')
+
+    def testComparePdfsNotAPdfFail(self):
+
+        standardFileName:  str = self._getFullyQualifiedPdfPath('Test-Basic-Standard.pdf')
+        generatedFileName: str = self._getFullyQualifiedImagePath('Test-Basic-Standard.png')
+
+        identical: bool = self._comparePdfs(baseFileName=generatedFileName, standardFileName=standardFileName)
+        self.assertFalse(identical, 'These are not even the same type')
+
+    def _drawFleet(self, fileName: str, count: int, offset: int = 107, lineTypes: List[LineType] = None, headerText: str = '', edited: bool = False,
+                   **diagramOptions) -> PdfDiagram:
+        """
+        A row of look-alike classes, 300 points apart.  Each line type adds a line to every class:  An inheritance line
+        from the class above it, an aggregation of the class after it, or a composition of the class below it
+
+        Args:
+            fileName:        The document to write
+            count:           The number of classes
+            offset:          The left of the first class
+            lineTypes:       The lines to draw for each class
+            headerText:      The page header
+            edited:          Rename the third class, remove the lines of the fifth one, and add a class below the row
+            diagramOptions:  The diagram attributes to set before drawing
+
+        Returns:  The diagram, drawn but not written
+        """
+        diagram: PdfDiagram = PdfDiagram(fileName=fileName, dpi=TestConstants.TEST_DPI, headerText=headerText)
+
+        diagram.docTimeStamp = self.unitTestTimeStamp
+        for name, value in diagramOptions.items():
+            setattr(diagram, name, value)
+
+        lineTypes = [] if lineTypes is None else lineTypes
+        for x in range(count):
+            left: int = (x * 300) + offset
+
+            classDef: ClassDefinition = self._buildCar()
+            classDef.position = Position(x=left, y=230)
+            if edited is True and x == 2:
+                classDef.name = 'Truck'
+            diagram.drawClass(classDef)
+
+            if edited is True and x == 4:
+                continue
+            for lineType in lineTypes:
+                linePositions: LinePositions
+                if lineType == LineType.Inheritance:
+                    linePositions = [Position(x=left + 93, y=230), Position(x=left + 93, y=130)]
+                elif lineType == LineType.Aggregation:
+                    linePositions = [Position(x=left + 300, y=280), Position(x=left + 273, y=280)]
+                else:
+                    linePositions = [Position(x=left + 93, y=500), Position(x=left + 93, y=400)]
+                diagram.drawUmlLine(UmlLineDefinition(lineType=lineType, linePositions=linePositions))
+
+        if edited is True:
+            classDef: ClassDefinition = self._buildCar()
+            classDef.position = Position(x=offset, y=600)
+            diagram.drawClass(classDef)
+
+        return diagram
+
+    def _drawCachedText(self, fileName: str, diagramCache: DiagramCache):
         """
-        Test this method here even though the method will be used for both
-        pdf and image comparisons
+        Text drawn after the classes goes through the cache too
         """
-        status: int = self._runDiff(baseFileName='bogus', standardFileName='')
+        diagram: PdfDiagram = self._drawFleet(fileName=fileName, count=1, headerText=TestDiagramParent.UNIT_TEST_HEADER, diagramCache=diagramCache)
+
+        diagram.drawText(position=Position(x=50, y=300), text='Cached Text')
+        diagram.write()
 
-        self.assertFalse(status == 0, 'This should fail')
+    def _readSegmentedPage(self, fileName: str) -> Tuple[List[str], bytes]:
+        """
+        Follows the cross-reference sections to the page's latest content streams
 
-    def testRunDiffActualFail(self):
+        Returns:  The segment keys and the page content
         """
-        Test this method here even though the method will be used for both
-        pdf and image comparisons
+        previous: PdfPreviousOutput = PdfPreviousOutput.read(fileName)
+        content:  bytes             = b''
+        with open(fileName, 'rb') as inputFile:
+            for objectNumber in previous.contents:
+                _, objectOffset = PdfPreviousOutput._findObject(inputFile, previous.startXref, objectNumber)
+                contentObject: bytes = PdfPreviousOutput._readObject(inputFile, objectOffset)
+                stream:        bytes = contentObject[contentObject.index(b'>>\nstream\n') + 10:contentObject.rindex(b'\nendstream')]
+                content += decompress(stream)
+
+        return previous.segmentKeys, content
+
+    def _drawCarContent(self, coordinatePrecision: int) -> bytes:
         """
-        standardFileName: str = self._getFullyQualifiedImagePath('Test-Basic-Standard.png')
-        generatedFileName: str = self._getFullyQualifiedPdfPath('Test-Basic.pdf')
+        Draw a car and an aggregation at a fractional position
+
+        Returns:  The drawing operators
+        """
+        diagram: PdfDiagram = PdfDiagram(fileName=cast(str, None), dpi=TestConstants.TEST_DPI)
+
+        diagram.coordinatePrecision = coordinatePrecision
+
+        classDef: ClassDefinition = self._buildCar()
+        classDef.position = Position(100.3, 120.7)
+
+        linePositions: LinePositions = [Position(150.6, 400.2), Position(150.6, 300.5), Position(180.4, 300.5), Position(180.4, 250.9)]
+
+        contentStart: int = len(diagram._pdf.pages[1]['content'])
+        diagram.drawClass(classDef)
+        diagram.drawUmlLine(UmlLineDefinition(lineType=LineType.Aggregation, linePositions=linePositions))
+
+        return bytes(diagram._pdf.pages[1]['content'][contentStart:])
+
+    def _readAndRemove(self, fileName: str) -> bytes:
+
+        with open(fileName, 'rb') as generatedFile:
+            output: bytes = generatedFile.read()
+        osRemove(fileName)
 
-        status: int = self._runDiff(baseFileName=generatedFileName, standardFileName=standardFileName)
-        self.assertFalse(status == 0, 'These are not even the same type')
+        return output
 
     def _assertIdenticalFiles(self, baseName: str, generatedFileName: str, failMessage: str, removeTestFile: bool = True) -> None:
         """
@@ -444,9 +803,9 @@ class TestPdfDiagram(TestDiagramParent):
         """
 
         standardFileName: str = self._getFullyQualifiedPdfPath(f'{baseName}{TestDiagramParent.STANDARD_SUFFIX}{TestConstants.TEST_SUFFIX}')
-        status:           int = self._runPdfDiff(baseFileName=generatedFileName, standardFileName=standardFileName)
+        identical:        bool = self._comparePdfs(baseFileName=generatedFileName, standardFileName=standardFileName)
 
-        self.assertTrue(status == 0, failMessage)
+        self.assertTrue(identical, failMessage)
 
         if removeTestFile is True:
             self.logger.info(f'Removing: {generatedFileName}')
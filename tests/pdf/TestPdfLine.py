@@ -1,8 +1,11 @@
 
 from logging import Logger
 from logging import getLogger
+from typing import List
 from typing import Tuple
 
+from re import findall
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
@@ -67,12 +70,14 @@ class TestPdfDiagramLine(TestBase):
 
         self.logger: Logger = TestPdfDiagramLine.clsLogger
 
+        self._setUpOutputDirectory()
+
     def tearDown(self):
         pass
 
     def testOrthogonalInheritanceLines(self):
 
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalInheritanceLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalInheritanceLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
 
         self.__drawHorizontalBoundaries(diagram)
         self.__drawVerticalBoundaries(diagram)
@@ -90,7 +95,7 @@ class TestPdfDiagramLine(TestBase):
 
     def testOrthogonalCompositionLines(self):
 
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalCompositionLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalCompositionLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
 
         self.__drawHorizontalBoundaries(diagram)
         self.__drawVerticalBoundaries(diagram)
@@ -109,7 +114,7 @@ class TestPdfDiagramLine(TestBase):
 
     def testDiagonalInheritanceLines(self):
 
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalInheritanceLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalInheritanceLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: PdfDiagramLine = PdfDiagramLine(pdf=diagram._pdf, diagramPadding=diagram._diagramPadding, dpi=diagram._dpi)
@@ -121,7 +126,7 @@ class TestPdfDiagramLine(TestBase):
         diagram.write()
 
     def testDiagonalCompositionLines(self):
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalCompositionLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalCompositionLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: PdfDiagramLine = PdfDiagramLine(pdf=diagram._pdf, diagramPadding=diagram._diagramPadding, dpi=diagram._dpi)
@@ -133,7 +138,7 @@ class TestPdfDiagramLine(TestBase):
         diagram.write()
 
     def testOrthogonalAggregationLines(self):
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-OrthogonalAggregationLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-OrthogonalAggregationLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
 
         self.__drawHorizontalBoundaries(diagram)
         self.__drawVerticalBoundaries(diagram)
@@ -151,7 +156,7 @@ class TestPdfDiagramLine(TestBase):
 
     def testDiagonalAggregationLines(self):
 
-        diagram: PdfDiagram = PdfDiagram(fileName=f'{TestConstants.TEST_FILE_NAME}-DiagonalAggregationLines{TestConstants.TEST_SUFFIX}', dpi=TestConstants.TEST_DPI)
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-DiagonalAggregationLines{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
         self.__drawEllipseForDiagonalInheritanceLines(diagram)
 
         lineDrawer: PdfDiagramLine = PdfDiagramLine(pdf=diagram._pdf, diagramPadding=diagram._diagramPadding, dpi=diagram._dpi)
@@ -162,6 +167,30 @@ class TestPdfDiagramLine(TestBase):
             lineDrawer.draw(definition)
         diagram.write()
 
+    def testBentLineSinglePath(self):
+
+        diagram: PdfDiagram = PdfDiagram(fileName=self._outputFileName(f'{TestConstants.TEST_FILE_NAME}-BentLineSinglePath{TestConstants.TEST_SUFFIX}'), dpi=TestConstants.TEST_DPI)
+
+        lineDrawer: PdfDiagramLine = PdfDiagramLine(pdf=diagram._pdf, diagramPadding=diagram._diagramPadding, dpi=diagram._dpi)
+
+        linePositions: LinePositions = [
+            Position(TestPdfDiagramLine.V_LEFT_X,  TestPdfDiagramLine.V_BOTTOM_Y),
+            Position(TestPdfDiagramLine.V_LEFT_X,  TestPdfDiagramLine.V_TOP_Y + TestPdfDiagramLine.Y_INC),
+            Position(TestPdfDiagramLine.V_RIGHT_X, TestPdfDiagramLine.V_TOP_Y + TestPdfDiagramLine.Y_INC),
+            Position(TestPdfDiagramLine.V_RIGHT_X, TestPdfDiagramLine.V_TOP_Y),
+        ]
+        contentStart: int = len(diagram._pdf.pages[1]['content'])
+
+        lineDrawer.draw(UmlLineDefinition(lineType=LineType.Aggregation, linePositions=linePositions))
+
+        content: bytes = bytes(diagram._pdf.pages[1]['content'][contentStart:])
+
+        operators: List[bytes] = findall(rb'[a-zA-Z*]+', content)
+
+        self.assertEqual(2, operators.count(b'm'), 'The line and the diamond should each be a single path')
+        self.assertEqual(6, operators.count(b'l'), 'Three line segments plus three diamond edges before closing')
+        self.assertEqual(2, operators.count(b'S') + operators.count(b'B'), 'The line and the diamond should each be painted once')
+
     def __createOrthogonalLines(self, lineType: LineType) -> Tuple[UmlLineDefinition, UmlLineDefinition, UmlLineDefinition, UmlLineDefinition]:
 
         northLinePositions: LinePositions = [Position(TestPdfDiagramLine.V_RIGHT_X, TestPdfDiagramLine.V_TOP_Y),